@@ -0,0 +1,64 @@
+"""
+Benchmark of the reader backends on one scan folder. The CSV scan is mirrored
+to every other format in a temporary directory and a full ScanResults load is
+timed for each backend.
+
+Usage: python -m benchmarks.bench_readers <path-to-scan> --fits SG DG [--repeat 3]
+"""
+from typing import Dict
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.readers import (
+    ReaderBackend, CSVReader, ArrowCSVReader, ParquetReader, ArrowIPCReader, InMemoryReader, mirror_scan
+)
+
+
+def time_load(path: Path, fits, reader: ReaderBackend, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ScanResults(path, fits, reader=reader, lazy=False)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--fits", nargs="+", default=["SG"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.path.absolute()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        in_memory = InMemoryReader()
+        mirror_scan(path, path, in_memory)
+
+        backends: Dict[str, ReaderBackend] = {
+            "csv": CSVReader(),
+            "arrow-csv": ArrowCSVReader(),
+            "parquet": ParquetReader(),
+            "arrow-ipc": ArrowIPCReader(),
+            "in-memory": in_memory,
+        }
+        paths: Dict[str, Path] = {"csv": path, "arrow-csv": path, "in-memory": path}
+        for name in ("parquet", "arrow-ipc"):
+            paths[name] = Path(tmp_dir) / name / path.name
+            mirror_scan(path, paths[name], backends[name])
+
+        reference = None
+        for name, reader in backends.items():
+            timing = time_load(paths[name], args.fits, reader, args.repeat)
+            reference = timing if reference is None else reference
+            print(f"{name:10s} {timing * 1e3:8.1f} ms ({reference / timing:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark of the X/Y plane reshape of the fit results against the pivot_table
+it replaced, at full-orbit size (3564 BCIDs).
+
+Usage: python -m benchmarks.bench_reshape [--detectors 5] [--corrections 9] [--repeat 5]
+"""
+from typing import List
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from plotting_vdm.scan_results import ScanResults
+
+
+FIT_COLUMNS = [
+    "sigma", "sigmaErr", "CapSigma", "CapSigmaErr", "peak", "peakErr",
+    "area", "areaErr", "chi2", "ndof", "fitStatus", "covStatus",
+]
+
+
+def make_fit_results(n_detectors: int, n_corrections: int, n_bcids: int, seed: int = 0) -> List[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    bcids = np.arange(1, n_bcids + 1)
+
+    per_detector: List[pd.DataFrame] = []
+    for detector in range(n_detectors):
+        per_correction: List[pd.DataFrame] = []
+        for correction in range(n_corrections):
+            for plane in ("X", "Y"):
+                frame = pd.DataFrame(rng.random((n_bcids, len(FIT_COLUMNS))), columns=FIT_COLUMNS)
+                frame.insert(0, "BCID", bcids)
+                frame.insert(0, "Type", plane)
+                frame["correction"] = f"Correction{correction}"
+                per_correction.append(frame)
+
+        detector_results = pd.concat(per_correction, ignore_index=True)
+        detector_results["detector"] = f"Detector{detector}"
+        per_detector.append(detector_results)
+
+    return per_detector
+
+
+def pivot_reference(fit_results: List[pd.DataFrame]) -> pd.DataFrame:
+    results = pd.concat(fit_results)\
+                    .sort_index()\
+                    .pivot_table(
+                        index=["BCID", "detector", "correction"],
+                        columns="Type"
+                    ).reset_index()
+
+    results.columns = pd.Index([
+        f"{name}_{plane}" if plane else name
+        for name, plane in results.columns
+    ])
+
+    return results
+
+
+def best_of(repeat: int, function, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--detectors", type=int, default=5)
+    parser.add_argument("--corrections", type=int, default=9)
+    parser.add_argument("--bcids", type=int, default=3564)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fit_results = make_fit_results(args.detectors, args.corrections, args.bcids)
+
+    pd.testing.assert_frame_equal(
+        pivot_reference(fit_results),
+        ScanResults._process_fit_results(fit_results),
+        check_dtype=False,
+    )
+
+    pivot_time = best_of(args.repeat, pivot_reference, fit_results)
+    reshape_time = best_of(args.repeat, ScanResults._process_fit_results, fit_results)
+
+    n_rows = sum(len(frame) for frame in fit_results)
+    print(f"{args.detectors} detectors x {args.corrections} corrections x {args.bcids} BCIDs ({n_rows} rows)")
+    print(f"pivot_table: {pivot_time * 1e3:8.1f} ms")
+    print(f"reshape:     {reshape_time * 1e3:8.1f} ms ({pivot_time / reshape_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark suite of the loading and rendering paths on synthetic scans. For every
+size, a synthetic analysed_data tree is generated in a temporary directory and the
+ScanResults construction, the slice extraction and one strategy of each plotter
+family (Normal, Ratio, Corr, Evo) are timed. The timings are written as JSON so
+that two commits can be compared with --compare.
+
+Usage: python -m benchmarks.bench_suite [--sizes small medium] [--repeat 3] [--output bench.json] [--compare baseline.json]
+"""
+from typing import List, Dict, Any, Callable, Optional
+
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.config import PlotterCongig, EvoPlotterConfig
+from plotting_vdm.plotter.scan.normal import NormalPlotter, CapSigmaXNormalPlotStrategy
+from plotting_vdm.plotter.scan.ratio import RatioPlotter, CapSigmaXRatioPlotStrategy
+from plotting_vdm.plotter.scan.corr import CorrPlotter, CapSigmaXCorrPlotStrategy
+from plotting_vdm.plotter.evo import EvoPlotter, CapSigmaXEvoPlotStrategy
+
+from benchmarks.synthetic import generate, DETECTORS, CORRECTIONS
+
+
+@dataclass(frozen=True)
+class Size:
+    scans: int
+    detectors: int
+    corrections: int
+    fits: int
+    bcids: int
+
+
+SIZES: Dict[str, Size] = {
+    "small": Size(scans=2, detectors=2, corrections=2, fits=1, bcids=50),
+    "medium": Size(scans=3, detectors=3, corrections=3, fits=2, bcids=500),
+    "large": Size(scans=6, detectors=5, corrections=5, fits=2, bcids=3564),
+}
+
+
+def measure(function: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return {"best": min(timings), "mean": float(np.mean(timings)), "repeat": repeat}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_size(name: str, size: Size, repeat: int, tmp_dir: Path) -> List[Dict[str, Any]]:
+    fits = ["SG", "DG", "SGConst", "DGConst"][:size.fits]
+    detectors = DETECTORS[:size.detectors]
+    corrections = CORRECTIONS[:size.corrections]
+
+    paths = generate(tmp_dir / name / "analysed_data", size.scans, size.detectors, size.corrections, fits, size.bcids)
+    load = lambda: [
+        ScanResults(path, fits, detectors, corrections, name=f"scan{i}", lazy=False)
+        for i, path in enumerate(paths)
+    ]
+
+    results = load()
+
+    def slice_all() -> None:
+        for result in results:
+            for fit in fits:
+                for detector in detectors:
+                    for correction in corrections:
+                        result.get_slice(fit, detector, correction)
+
+    def clear_slices() -> None:
+        for result in results:
+            result._slices.clear()
+
+    config = PlotterCongig(tmp_dir / name / "plots")
+    evo_config = EvoPlotterConfig(tmp_dir / name / "plots", xticks=[result.name for result in results])
+
+    normal_plotter = NormalPlotter(config, CapSigmaXNormalPlotStrategy())
+    ratio_plotter = RatioPlotter(detectors[0], config, CapSigmaXRatioPlotStrategy())
+    corr_plotter = CorrPlotter(corrections[0], config, CapSigmaXCorrPlotStrategy())
+    evo_plotter = EvoPlotter(evo_config, CapSigmaXEvoPlotStrategy())
+
+    benchmarks: Dict[str, Dict[str, float]] = {
+        "load": measure(load, repeat),
+        "slice": measure(slice_all, repeat, setup=clear_slices),
+        "plot_normal": measure(lambda: normal_plotter.plot_many(results), repeat),
+        "plot_ratio": measure(lambda: ratio_plotter.plot_many(results), repeat),
+        "plot_corr": measure(lambda: corr_plotter.plot_many(results), repeat),
+        "plot_evo": measure(lambda: evo_plotter(results), repeat),
+    }
+
+    return [
+        {"size": name, "benchmark": benchmark, **asdict(size), **timing}
+        for benchmark, timing in benchmarks.items()
+    ]
+
+
+def compare(current: List[Dict[str, Any]], baseline_path: Path) -> None:
+    baseline = {
+        (entry["size"], entry["benchmark"]): entry["best"]
+        for entry in json.loads(baseline_path.read_text())["results"]
+    }
+
+    for entry in current:
+        reference = baseline.get((entry["size"], entry["benchmark"]))
+        if reference is None:
+            continue
+
+        print(f"{entry['size']:8s} {entry['benchmark']:12s} {reference * 1e3:10.1f} ms -> "
+              f"{entry['best'] * 1e3:10.1f} ms ({reference / entry['best']:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in args.sizes:
+            for entry in bench_size(name, SIZES[name], args.repeat, Path(tmp_dir)):
+                print(f"{entry['size']:8s} {entry['benchmark']:12s} {entry['best'] * 1e3:10.1f} ms")
+                results.append(entry)
+
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "results": results,
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
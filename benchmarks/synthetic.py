@@ -0,0 +1,220 @@
+"""
+Generator of synthetic analysed_data trees. The scan folders, detector and
+correction folders and result files follow the naming ScanResults expects, and the
+values are drawn around plausible vdM fit results so every plotter can render them.
+
+Usage: python -m benchmarks.synthetic <output-dir> [--scans 6] [--detectors 3] [--corrections 3] [--fits SG DG] [--bcids 3564]
+"""
+from typing import List, Sequence
+
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from plotting_vdm.scan_results import ScanResults
+
+
+N_BUNCH_SLOTS = 3564
+
+DETECTORS = ["PLT", "BCM1F", "HFOC", "HFET", "BCM1FUTCA"]
+CORRECTIONS = [
+    "noCorr",
+    "Background",
+    "Background_BeamBeam",
+    "Background_BeamBeam_DynamicBeta",
+    "Background_BeamBeam_DynamicBeta_LengthScale",
+]
+FITS = ["SG", "DG", "SGConst", "DGConst"]
+
+# Typical visible cross section of each detector, in ub
+XSEC = {"PLT": 300.0, "BCM1F": 130.0, "HFOC": 800.0, "HFET": 2500.0, "BCM1FUTCA": 140.0}
+
+
+def colliding_bcids(n_bcids: int) -> np.ndarray:
+    """Spreads n_bcids colliding bunches evenly over the orbit."""
+    if not 0 < n_bcids <= N_BUNCH_SLOTS:
+        raise ValueError(f"The number of BCIDs must be between 1 and {N_BUNCH_SLOTS}. Got {n_bcids}.")
+
+    return np.linspace(1, N_BUNCH_SLOTS, n_bcids).astype(np.int64)
+
+
+def scan_id(fill: int, start: datetime, duration: timedelta) -> str:
+    """Builds the folder name of a scan. Ex: 8381_11Nov22_004152_11Nov22_010424"""
+    end = start + duration
+    return f"{fill}_{start.strftime(ScanResults._timestamp_format)}_{end.strftime(ScanResults._timestamp_format)}"
+
+
+def make_fit_results(rng: np.random.Generator, bcids: np.ndarray, fit: str, scale: float) -> pd.DataFrame:
+    n_bcids = len(bcids)
+
+    planes: List[pd.DataFrame] = []
+    for plane in ("X", "Y"):
+        cap_sigma = rng.normal(0.12, 0.004, n_bcids) * scale
+        peak = rng.normal(0.25, 0.01, n_bcids) / scale
+        ndof = np.full(n_bcids, 22.0 if fit.startswith("SG") else 20.0)
+
+        frame = pd.DataFrame({
+            "XscanNumber_YscanNumber": "1_2",
+            "Type": plane,
+            "BCID": bcids,
+            "sigma": cap_sigma * rng.normal(1.0, 0.01, n_bcids),
+            "sigmaErr": rng.uniform(5e-4, 1e-3, n_bcids),
+            "CapSigma": cap_sigma,
+            "CapSigmaErr": rng.uniform(5e-4, 1e-3, n_bcids),
+            "peak": peak,
+            "peakErr": rng.uniform(1e-3, 2e-3, n_bcids),
+            "area": peak * cap_sigma * np.sqrt(2 * np.pi),
+            "areaErr": rng.uniform(1e-4, 2e-4, n_bcids),
+            "fitStatus": 0,
+            "covStatus": 3,
+            "chi2": ndof * rng.gamma(20.0, 1 / 20.0, n_bcids),
+            "ndof": ndof,
+        })
+        if fit.startswith("DG"):
+            frame["sigmaRatio"] = rng.normal(2.0, 0.1, n_bcids)
+            frame["sigmaRatioErr"] = rng.uniform(0.01, 0.02, n_bcids)
+            frame["fraction"] = rng.uniform(0.6, 0.9, n_bcids)
+            frame["fractionErr"] = rng.uniform(0.01, 0.02, n_bcids)
+        if fit.endswith("Const"):
+            frame["Const"] = rng.normal(1e-4, 1e-5, n_bcids)
+            frame["ConstErr"] = rng.uniform(1e-6, 2e-6, n_bcids)
+
+        planes.append(frame)
+
+    return pd.concat(planes, ignore_index=True)
+
+
+def make_sigvis_results(rng: np.random.Generator, bcids: np.ndarray, xsec: float) -> pd.DataFrame:
+    n_bcids = len(bcids)
+
+    return pd.DataFrame({
+        "XscanNumber_YscanNumber": "1_2",
+        "Type": "XY",
+        "BCID": bcids,
+        "xsec": rng.normal(xsec, 0.005 * xsec, n_bcids),
+        "xsecErr": rng.uniform(0.002, 0.004, n_bcids) * xsec,
+        "SBIL": rng.normal(4.0, 0.2, n_bcids),
+        "SBILErr": rng.uniform(0.01, 0.02, n_bcids),
+    })
+
+
+def generate_scan(path: Path,
+                  fill: int,
+                  detectors: Sequence[str],
+                  corrections: Sequence[str],
+                  fits: Sequence[str],
+                  bcids: np.ndarray,
+                  rng: np.random.Generator
+                  ) -> None:
+    """Writes the result files of one scan folder.
+
+    Arguments
+    ---------
+        path : pathlib.Path
+            The path to the scan folder.
+        fill : int
+            The fill number of the scan. Used in the LumiCalibration file names.
+        detectors : Sequence[str]
+            The detector folders to write.
+        corrections : Sequence[str]
+            The correction folders of every detector.
+        fits : Sequence[str]
+            The fit models of every correction.
+        bcids : np.ndarray
+            The colliding BCIDs.
+        rng : np.random.Generator
+            The source of the fit values.
+    """
+    for detector in detectors:
+        for step, correction in enumerate(corrections):
+            correction_path = path / detector / "results" / correction
+            correction_path.mkdir(parents=True, exist_ok=True)
+
+            # Each correction moves the results a little further from the uncorrected ones
+            scale = 1.0 + 0.004 * step
+            for fit in fits:
+                make_fit_results(rng, bcids, fit, scale).to_csv(correction_path / f"{fit}_FitResults.csv", index=False)
+                make_sigvis_results(rng, bcids, XSEC.get(detector, 500.0) / scale).to_csv(
+                    correction_path / f"LumiCalibration_{detector}_{fit}_{fill}.csv", index=False
+                )
+
+
+def generate(root: Path,
+             n_scans: int = 6,
+             n_detectors: int = 3,
+             n_corrections: int = 3,
+             fits: Sequence[str] = ("SG", "DG"),
+             n_bcids: int = N_BUNCH_SLOTS,
+             fill: int = 8381,
+             start: datetime = datetime(2022, 11, 11, 0, 41, 52),
+             seed: int = 0
+             ) -> List[Path]:
+    """Writes a synthetic analysed_data tree.
+
+    Arguments
+    ---------
+        root : pathlib.Path
+            The analysed_data directory to write the scan folders in.
+        n_scans : int
+            The number of scans. They are spaced by one hour and last twenty minutes.
+        n_detectors : int
+            The number of detectors of each scan, taken from DETECTORS.
+        n_corrections : int
+            The number of corrections of each detector, taken from CORRECTIONS.
+        fits : Sequence[str]
+            The fit models of each correction.
+        n_bcids : int
+            The number of colliding BCIDs. At most 3564.
+        fill : int
+            The fill number of every scan.
+        start : datetime
+            The start time of the first scan.
+        seed : int
+            The seed of the fit values, so that the tree is reproducible.
+
+    Returns
+    -------
+        List[pathlib.Path]
+            The paths to the scan folders, in chronological order.
+    """
+    if not 0 < n_detectors <= len(DETECTORS):
+        raise ValueError(f"The number of detectors must be between 1 and {len(DETECTORS)}. Got {n_detectors}.")
+    if not 0 < n_corrections <= len(CORRECTIONS):
+        raise ValueError(f"The number of corrections must be between 1 and {len(CORRECTIONS)}. Got {n_corrections}.")
+
+    rng = np.random.default_rng(seed)
+    bcids = colliding_bcids(n_bcids)
+
+    paths: List[Path] = []
+    for scan in range(n_scans):
+        path = Path(root) / scan_id(fill, start + timedelta(hours=scan), timedelta(minutes=20))
+        generate_scan(path, fill, DETECTORS[:n_detectors], CORRECTIONS[:n_corrections], fits, bcids, rng)
+        paths.append(path)
+
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--scans", type=int, default=6)
+    parser.add_argument("--detectors", type=int, default=3)
+    parser.add_argument("--corrections", type=int, default=3)
+    parser.add_argument("--fits", nargs="+", default=["SG", "DG"])
+    parser.add_argument("--bcids", type=int, default=N_BUNCH_SLOTS)
+    parser.add_argument("--fill", type=int, default=8381)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = generate(
+        args.root, args.scans, args.detectors, args.corrections, args.fits, args.bcids, args.fill, seed=args.seed
+    )
+    for path in paths:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Sequence
+from typing import Optional, ClassVar, Callable
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import os
+import json
+import hashlib
+
+import pandas as pd
+
+from plotting_vdm.scan_index import ScanIndex
+from plotting_vdm.schema import SchemaRegistry
+
+
+@dataclass
+class ResultsCache:
+    """
+    A persistent cache of the processed per-fit DataFrames of ScanResults,
+    stored in a columnar format.
+
+    Each entry is keyed by the fit, the selected detectors, corrections and columns, the
+    schemas the files were parsed with and the path, size and modification time of every
+    source file used to build it. Any change to the source files or schemas therefore
+    produces a new key. Several selections of the same scan and fit are kept side by side,
+    stale entries are only removed by the size-capped eviction.
+
+    Parameters
+    ----------
+    directory : Union[pathlib.Path,str]
+        The directory where the cache entries are written.
+    max_size : Optional[int]
+        The maximum total size of the cache in bytes. When exceeded, the least
+        recently used entries are evicted. If None, the cache is unbounded.
+    file_format : str
+        The columnar format of the entries. Either "feather" or "parquet".
+        Both require pyarrow.
+
+    Examples
+    --------
+    >>> cache = ResultsCache(Path("~/.cache/plotting_vdm").expanduser(), max_size=2**30)
+    >>> results = ScanResults(path, ["SG", "DG"], cache=cache)  # Cold: reads the CSVs
+    >>> results = ScanResults(path, ["SG", "DG"], cache=cache)  # Warm: reads the cache
+    >>> cache.invalidate(results.id_str)
+    """
+    directory: Path
+    max_size: Optional[int] = None
+    file_format: str = "feather"
+
+    _version: ClassVar[int] = 2
+    _writers: ClassVar[Dict[str, Callable[[pd.DataFrame, Path], None]]] = {
+        "feather": lambda frame, path: frame.to_feather(path),
+        "parquet": lambda frame, path: frame.to_parquet(path, index=False),
+    }
+    _readers: ClassVar[Dict[str, Callable[[Path], pd.DataFrame]]] = {
+        "feather": pd.read_feather,
+        "parquet": pd.read_parquet,
+    }
+
+    def __post_init__(self):
+        self.directory = Path(self.directory)
+
+        if self.file_format not in self._writers:
+            raise ValueError(f"Cache format '{self.file_format}' is not recognized. Use one of {list(self._writers)}.")
+
+    def key(self,
+            index: ScanIndex,
+            fit: str,
+            detectors: Sequence[str],
+            corrections: Sequence[str],
+            columns: Optional[Sequence[str]] = None,
+            schemas: Optional[SchemaRegistry] = None,
+            ) -> str:
+        """Computes the key of the entry of one fit of a scan.
+
+        Arguments
+        ---------
+            index : ScanIndex
+                The index of the scan folder.
+            fit : str
+                The fit of the entry.
+            detectors : Sequence[str]
+                The detectors loaded into the entry.
+            corrections : Sequence[str]
+                The corrections loaded into the entry.
+            columns : Optional[Sequence[str]]
+                The columns loaded into the entry. None if every column was loaded.
+            schemas : Optional[SchemaRegistry]
+                The schemas the result files of the entry are parsed with.
+                The compact and single precision dtypes are not part of the key,
+                they are applied to the entry after it is loaded.
+
+        Returns
+        -------
+            str
+                The hexadecimal key of the entry.
+        """
+        sources: List[Tuple[str, int, int]] = []
+        for detector in detectors:
+            for correction in corrections:
+                for result_file in (
+                    index.fit_result(fit, detector, correction),
+                    index.sigvis_result(fit, detector, correction),
+                ):
+                    sources.append((str(result_file.path), result_file.size, result_file.mtime_ns))
+
+        payload = json.dumps({
+            "version": self._version,
+            "fit": fit,
+            "detectors": list(detectors),
+            "corrections": list(corrections),
+            "columns": None if columns is None else list(columns),
+            "schemas": None if schemas is None else [asdict(schemas.get(kind, fit)) for kind in ("fit", "sigvis")],
+            "sources": sources,
+        })
+
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def load(self, scan_id: str, fit: str, key: str) -> Optional[pd.DataFrame]:
+        """Loads an entry from the cache.
+
+        Arguments
+        ---------
+            scan_id : str
+                The id of the scan. Ex: 8381_11Nov22_004152_11Nov22_010424
+            fit : str
+                The fit of the entry.
+            key : str
+                The key of the entry, as returned by `key`.
+
+        Returns
+        -------
+            Optional[pd.DataFrame]
+                The cached DataFrame or None on a cache miss.
+        """
+        path = self._entry_path(scan_id, fit, key)
+        if not path.is_file():
+            return None
+
+        # Touch the entry so that eviction is least recently used
+        os.utime(path)
+
+        return self._readers[self.file_format](path)
+
+    def store(self, scan_id: str, fit: str, key: str, results: pd.DataFrame) -> None:
+        """Stores an entry in the cache. Entries of other selections of the same scan and fit are kept.
+
+        Arguments
+        ---------
+            scan_id : str
+                The id of the scan. Ex: 8381_11Nov22_004152_11Nov22_010424
+            fit : str
+                The fit of the entry.
+            key : str
+                The key of the entry, as returned by `key`.
+            results : pd.DataFrame
+                The processed DataFrame of the fit.
+        """
+        path = self._entry_path(scan_id, fit, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so that readers never see a partial entry
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        self._writers[self.file_format](results.reset_index(drop=True), tmp_path)
+        os.replace(tmp_path, path)
+
+        if self.max_size is not None:
+            self.evict(self.max_size)
+
+    def invalidate(self, scan_id: Optional[str] = None) -> None:
+        """Removes the entries of one scan, or every entry if no scan is given.
+
+        Arguments
+        ---------
+            scan_id : Optional[str]
+                The id of the scan to invalidate. If None, the whole cache is cleared.
+        """
+        for path in self._entries(scan_id):
+            path.unlink(missing_ok=True)
+
+    def size(self) -> int:
+        """Returns the total size of the cache entries in bytes."""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def evict(self, max_size: int) -> None:
+        """Removes the least recently used entries until the cache fits in max_size bytes.
+
+        Arguments
+        ---------
+            max_size : int
+                The maximum total size of the cache in bytes.
+        """
+        entries = [(path, path.stat()) for path in self._entries()]
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def _entries(self, scan_id: Optional[str] = None) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+
+        pattern = f"*/*.{self.file_format}" if scan_id is None else f"{scan_id}/*.{self.file_format}"
+        return list(self.directory.glob(pattern))
+
+    def _entry_path(self, scan_id: str, fit: str, key: str) -> Path:
+        return self.directory / scan_id / f"{fit}-{key}.{self.file_format}"
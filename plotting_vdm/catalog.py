@@ -0,0 +1,301 @@
+from __future__ import annotations
+from typing import List, Dict, Any
+from typing import Union, Optional, Sequence, Iterable
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import os
+import json
+import bisect
+import hashlib
+
+from plotting_vdm.scan_results import ScanResults
+
+
+@dataclass
+class CatalogEntry:
+    """A scan folder known to a ScanCatalog.
+
+    Attributes
+    ----------
+    id_str : str
+        The id of the scan. Ex: 8381_11Nov22_004152_11Nov22_010424
+    path : pathlib.Path
+        The path to the scan folder.
+    fill_number : int
+        The fill number of the scan.
+    start : datetime
+        The start time of the scan.
+    end : datetime
+        The end time of the scan.
+    mtime_ns : int
+        The modification time of the scan folder when it was indexed.
+    name : str
+        The name of the scan. Ex: vdM1
+    """
+    id_str: str
+    path: Path
+    fill_number: int
+    start: datetime
+    end: datetime
+    mtime_ns: int
+    name: str = ""
+
+    def to_json(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["path"] = str(self.path)
+        data["start"] = self.start.isoformat()
+        data["end"] = self.end.isoformat()
+
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> CatalogEntry:
+        return cls(
+            id_str=data["id_str"],
+            path=Path(data["path"]),
+            fill_number=data["fill_number"],
+            start=datetime.fromisoformat(data["start"]),
+            end=datetime.fromisoformat(data["end"]),
+            mtime_ns=data["mtime_ns"],
+            name=data["name"],
+        )
+
+
+def _load_scan(entry: CatalogEntry, kwargs: Dict[str, Any]) -> ScanResults:
+    kwargs = {"name": entry.name, "lazy": False, **kwargs}
+    return ScanResults(entry.path, **kwargs)
+
+
+def _default_index_path(root: Path) -> Path:
+    # Outside of root, analysed_data trees are shared and often mounted read-only
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha1(str(root).encode()).hexdigest()[:16]
+
+    return cache_dir / "plotting_vdm" / f"scan_catalog-{digest}.json"
+
+
+class ScanCatalog:
+    """
+    The ScanCatalog class indexes every scan folder under an analysed_data root.
+    The fill number and scan times are parsed once per folder and the index is
+    persisted to disk, so that later sessions only parse the folders that are new
+    or changed since the last refresh.
+
+    Parameters
+    ----------
+    root : Union[pathlib.Path,str]
+        The analysed_data directory containing one folder per scan.
+    index_path : Optional[Union[pathlib.Path,str]]
+        The file where the index is persisted. If None, it is written to the user cache
+        directory ($XDG_CACHE_HOME or ~/.cache), in one file per root.
+
+    Examples
+    --------
+    Loading all the scans of a fill.
+
+    >>> catalog = ScanCatalog("<path-to>/output/analysed_data")
+    >>> catalog.name_scans(8381, ["vdM1", "BI1", "BI2", "vdM2", "vdM3", "vdM4"])
+    >>> results = catalog.load(catalog.select(fills=[8381]), fits=["SG", "DG"], max_workers=8)
+    """
+
+    _index_version = 1
+
+    def __init__(self, root: Union[Path, str], index_path: Optional[Union[Path, str]] = None) -> None:
+        self.root = Path(root).absolute()
+        self.index_path = _default_index_path(self.root) if index_path is None else Path(index_path)
+
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._by_fill: Dict[int, List[CatalogEntry]] = {}
+        self._by_name: Dict[str, List[CatalogEntry]] = {}
+        self._by_start: List[CatalogEntry] = []
+        self._starts: List[datetime] = []
+
+        self._read_index()
+        self.refresh()
+
+    @property
+    def entries(self) -> List[CatalogEntry]:
+        """Every scan in the catalog, sorted by start time."""
+        return list(self._by_start)
+
+    def refresh(self) -> None:
+        """Updates the index with the scan folders added, changed or removed since the last refresh."""
+        entries: Dict[str, CatalogEntry] = {}
+
+        for folder in os.scandir(self.root):
+            if not folder.is_dir():
+                continue
+
+            mtime_ns = folder.stat().st_mtime_ns
+            known = self._entries.get(folder.name)
+            if known is not None and known.mtime_ns == mtime_ns:
+                entries[folder.name] = known
+                continue
+
+            entry = self._parse_folder(Path(folder.path), mtime_ns)
+            if entry is not None:
+                if known is not None:
+                    entry.name = known.name
+                entries[folder.name] = entry
+
+        changed = entries != self._entries
+        self._entries = entries
+        self._build_lookups()
+
+        if changed:
+            self._write_index()
+
+    def select(self,
+               fills: Optional[Iterable[int]] = None,
+               start: Optional[datetime] = None,
+               end: Optional[datetime] = None,
+               names: Optional[Iterable[str]] = None,
+               ) -> List[CatalogEntry]:
+        """Selects the scans matching every given criterion.
+
+        Arguments
+        ---------
+            fills : Optional[Iterable[int]]
+                Only select scans of these fills.
+            start : Optional[datetime]
+                Only select scans starting at or after this time.
+            end : Optional[datetime]
+                Only select scans starting at or before this time.
+            names : Optional[Iterable[str]]
+                Only select scans with these names.
+
+        Returns
+        -------
+            List[CatalogEntry]
+                The selected scans, sorted by start time.
+        """
+        low = 0 if start is None else bisect.bisect_left(self._starts, start)
+        high = len(self._starts) if end is None else bisect.bisect_right(self._starts, end)
+        selected = self._by_start[low:high]
+
+        if fills is not None:
+            by_fill = {id(entry) for fill in fills for entry in self._by_fill.get(fill, [])}
+            selected = [entry for entry in selected if id(entry) in by_fill]
+
+        if names is not None:
+            by_name = {id(entry) for name in names for entry in self._by_name.get(name, [])}
+            selected = [entry for entry in selected if id(entry) in by_name]
+
+        return selected
+
+    def name_scans(self, fill_number: int, names: Sequence[str]) -> None:
+        """Names the scans of a fill in start time order.
+
+        Arguments
+        ---------
+            fill_number : int
+                The fill whose scans are named.
+            names : Sequence[str]
+                The names of the scans, in start time order.
+
+        Raises
+        ------
+            ValueError
+                If the number of names does not match the number of scans in the fill.
+        """
+        scans = self._by_fill.get(fill_number, [])
+        if len(scans) != len(names):
+            raise ValueError(f"Fill {fill_number} has {len(scans)} scans but {len(names)} names were given.")
+
+        for entry, name in zip(scans, names):
+            entry.name = name
+
+        self._build_lookups()
+        self._write_index()
+
+    def load(self,
+             entries: Sequence[CatalogEntry],
+             fits: List[str],
+             max_workers: Optional[int] = None,
+             **kwargs: Any,
+             ) -> List[ScanResults]:
+        """Loads the given scans in a process pool.
+
+        Arguments
+        ---------
+            entries : Sequence[CatalogEntry]
+                The scans to load.
+            fits : List[str]
+                The fits to read into memory.
+            max_workers : Optional[int]
+                The number of worker processes. If None, the executor default is used.
+            **kwargs : Any
+                Forwarded to every ScanResults. Ex: detectors, corrections, energy, cache.
+                A name or lazy given here overrides the defaults of the catalog.
+
+        Returns
+        -------
+            List[ScanResults]
+                The loaded scans, sorted by start time.
+        """
+        kwargs["fits"] = fits
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_load_scan, entries, [kwargs] * len(entries)))
+
+        results.sort(key=lambda scan: scan.start)
+        return results
+
+    def _parse_folder(self, path: Path, mtime_ns: int) -> Optional[CatalogEntry]:
+        try:
+            fill_number = ScanResults.get_fill_number(path)
+            start, end = ScanResults.get_scan_times(path)
+        except ValueError:
+            return None
+
+        return CatalogEntry(path.name, path, fill_number, start, end, mtime_ns)
+
+    def _build_lookups(self) -> None:
+        self._by_start = sorted(self._entries.values(), key=lambda entry: entry.start)
+        self._starts = [entry.start for entry in self._by_start]
+
+        self._by_fill = {}
+        self._by_name = {}
+        for entry in self._by_start:
+            self._by_fill.setdefault(entry.fill_number, []).append(entry)
+            if entry.name:
+                self._by_name.setdefault(entry.name, []).append(entry)
+
+    def _read_index(self) -> None:
+        if not self.index_path.is_file():
+            return
+
+        with open(self.index_path) as index_file:
+            data = json.load(index_file)
+
+        if data.get("version") != self._index_version or data.get("root") != str(self.root):
+            return
+
+        self._entries = {
+            entry["id_str"]: CatalogEntry.from_json(entry) for entry in data["entries"]
+        }
+
+    def _write_index(self) -> None:
+        data = {
+            "version": self._index_version,
+            "root": str(self.root),
+            "entries": [entry.to_json() for entry in self._by_start],
+        }
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as index_file:
+            json.dump(data, index_file, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return f"Scan Catalog for '{self.root}': {len(self)} scans in {len(self._by_fill)} fills"
+
+    def __repr__(self) -> str:
+        return self.__str__()
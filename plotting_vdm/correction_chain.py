@@ -0,0 +1,278 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from plotting_vdm.ratios import BCIDMatrix
+
+
+@dataclass(frozen=True)
+class CorrectionChain:
+    """The lineage of the corrections of a scan.
+
+    Each correction is compared to the correction it was built on: the longest prefix of
+    its underscore-joined name that was also applied, or the base correction if there is none.
+    For instance Background_BeamBeam_DynamicBeta → Background_BeamBeam → Background.
+
+    Attributes
+    ----------
+    base : str
+        The correction every lineage ends at.
+    corrections : Tuple[str, ...]
+        The applied corrections.
+    parents : Dict[str, str]
+        The correction each correction is compared to.
+
+    Examples
+    --------
+    >>> chain = CorrectionChain.build(["noCorr", "Background", "Background_BeamBeam"], "Background")
+    >>> chain.parent("Background_BeamBeam")
+    'Background'
+    >>> chain.lineage("Background_BeamBeam")
+    ['Background_BeamBeam', 'Background']
+    """
+    base: str
+    corrections: Tuple[str, ...]
+    parents: Dict[str, str]
+
+    @classmethod
+    def build(cls, corrections: Sequence[str], base: str) -> CorrectionChain:
+        """Resolves the parent of every correction.
+
+        Arguments
+        ---------
+            corrections : Sequence[str]
+                The applied corrections.
+            base : str
+                The correction every lineage ends at.
+
+        Returns
+        -------
+            CorrectionChain
+                The lineage of the corrections.
+
+        Raises
+        ------
+            ValueError
+                If the base correction was not applied.
+        """
+        if base not in corrections:
+            raise ValueError(f"""{base} is not in correction dictionary.
+                             Impossible to make correction effect plot
+                            Please add {base} to correction dictionary""")
+
+        applied = set(corrections)
+        parents = {}
+        for correction in corrections:
+            parts = correction.split("_")[:-1]
+            while parts and "_".join(parts) not in applied:
+                parts.pop()
+
+            parents[correction] = "_".join(parts) if parts else base
+
+        return cls(base, tuple(corrections), parents)
+
+    def parent(self, correction: str) -> str:
+        """Returns the correction a correction is compared to.
+
+        Raises
+        ------
+            ValueError
+                If the correction was not applied.
+        """
+        if correction not in self.parents:
+            raise ValueError(f"Correction {correction} is not one of {list(self.corrections)}")
+
+        return self.parents[correction]
+
+    def lineage(self, correction: str) -> List[str]:
+        """Returns the corrections from a correction down to the base correction, both included."""
+        lineage = [correction]
+        while lineage[-1] != self.base:
+            lineage.append(self.parent(lineage[-1]))
+
+        return lineage
+
+    def steps(self) -> List[Tuple[str, str]]:
+        """Returns every (correction, parent) pair of the chain, leaving out the base correction."""
+        return [(correction, self.parents[correction]) for correction in self.corrections if correction != self.base]
+
+
+@dataclass
+class CorrectionEffects:
+    """The effect of every correction step on a quantity, for every detector and BCID of a fit.
+
+    Attributes
+    ----------
+    quantity : str
+        The quantity.
+    chain : CorrectionChain
+        The lineage of the corrections.
+    bcids : np.ndarray
+        The sorted BCIDs measured by at least one detector and correction.
+    detectors : List[str]
+        The detectors.
+    effect : np.ndarray
+        The BCID × detector × correction array of (correction / parent - 1) * 100,
+        with the corrections in the order of the chain.
+    error : np.ndarray
+        The propagated error of the effect.
+    mask : np.ndarray
+        Whether both the correction and its parent were measured.
+        The effect of the other cells is NaN.
+    cumulative : np.ndarray
+        The BCID × detector × correction array of (correction / base - 1) * 100.
+
+    Examples
+    --------
+    >>> effects = result.get_correction_effects("SG", "CapSigma_X", "CapSigmaErr_X", "Background")
+    >>> bcids, effect, effect_err = effects.detector("PLT", "Background_BeamBeam")
+    >>> effects.waterfall("PLT", "Background_BeamBeam_DynamicBeta")
+    >>> effects.to_frame()
+    """
+    quantity: str
+    chain: CorrectionChain
+    bcids: np.ndarray
+    detectors: List[str]
+    effect: np.ndarray
+    error: np.ndarray
+    mask: np.ndarray
+    cumulative: np.ndarray
+
+    @classmethod
+    def from_matrix(cls,
+                    matrix: BCIDMatrix,
+                    chain: CorrectionChain,
+                    detectors: Sequence[str],
+                    quantity: str,
+                    quantity_err: str
+                    ) -> CorrectionEffects:
+        """Computes the effect of every correction step in a single vectorized pass.
+
+        Arguments
+        ---------
+            matrix : BCIDMatrix
+                The matrices of the quantity and its error, with one column per (detector, correction)
+                pair, detector major and with the corrections in the order of the chain.
+            chain : CorrectionChain
+                The lineage of the corrections.
+            detectors : Sequence[str]
+                The detectors of the matrix.
+            quantity : str
+                The quantity.
+            quantity_err : str
+                The error of the quantity.
+
+        Returns
+        -------
+            CorrectionEffects
+                The effects and their errors.
+        """
+        shape = (len(matrix.bcids), len(detectors), len(chain.corrections))
+        values = matrix.values[quantity].reshape(shape)
+        errors = matrix.values[quantity_err].reshape(shape)
+        present = matrix.present.reshape(shape)
+
+        parents = [chain.corrections.index(chain.parents[correction]) for correction in chain.corrections]
+        base = [chain.corrections.index(chain.base)]
+        mask = present & present[:, :, parents]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effect = (values / values[:, :, parents] - 1) * 100
+            error = np.abs(effect) * np.sqrt((errors / values)**2 + (errors[:, :, parents] / values[:, :, parents])**2)
+            cumulative = (values / values[:, :, base] - 1) * 100
+
+        effect[~mask] = np.nan
+        error[~mask] = np.nan
+        cumulative[~(present & present[:, :, base])] = np.nan
+
+        return cls(quantity, chain, matrix.bcids, list(detectors), effect, error, mask, cumulative)
+
+    def detector(self, detector: str, correction: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the BCIDs a detector measured with both a correction and its parent,
+        with the effects and errors of the correction.
+
+        Arguments
+        ---------
+            detector : str
+                The detector.
+            correction : str
+                The correction.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray, np.ndarray]
+                The BCIDs, effects and errors.
+        """
+        i, j = self.detectors.index(detector), self.chain.corrections.index(correction)
+        rows = self.mask[:, i, j]
+
+        return self.bcids[rows], self.effect[rows, i, j], self.error[rows, i, j]
+
+    def waterfall(self, detector: str, correction: str) -> pd.DataFrame:
+        """Breaks the cumulative effect of a correction down into the steps of its lineage.
+
+        Arguments
+        ---------
+            detector : str
+                The detector.
+            correction : str
+                The last correction of the lineage.
+
+        Returns
+        -------
+            pd.DataFrame
+                One row per step, from the base correction up: the correction, its parent,
+                the mean step effect, the mean cumulative effect over the BCIDs and the
+                contribution of the step, the difference between its cumulative effect and the
+                one of its parent. The contributions add up to the cumulative effect.
+        """
+        i = self.detectors.index(detector)
+        lineage = self.chain.lineage(correction)[::-1]
+
+        rows = []
+        previous = 0.0
+        for step in lineage[1:]:
+            j = self.chain.corrections.index(step)
+            cumulative = _nanmean(self.cumulative[:, i, j])
+            rows.append({
+                "correction": step,
+                "parent": self.chain.parents[step],
+                "effect": _nanmean(self.effect[:, i, j]),
+                "cumulative": cumulative,
+                "contribution": cumulative - previous,
+            })
+            previous = cumulative
+
+        return pd.DataFrame(rows, columns=["correction", "parent", "effect", "cumulative", "contribution"])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the effects as a long DataFrame, with one row per BCID, detector and correction step.
+
+        Returns
+        -------
+            pd.DataFrame
+                The BCID, detector, correction, parent, effect, effect_err and cumulative columns.
+        """
+        steps = np.array([correction != self.chain.base for correction in self.chain.corrections])
+        bcid, detector, correction = np.nonzero(self.mask & steps)
+
+        corrections = np.array(self.chain.corrections, dtype=object)
+        parents = np.array([self.chain.parents[name] for name in self.chain.corrections], dtype=object)
+
+        return pd.DataFrame({
+            "BCID": self.bcids[bcid],
+            "detector": np.array(self.detectors, dtype=object)[detector],
+            "correction": corrections[correction],
+            "parent": parents[correction],
+            "effect": self.effect[bcid, detector, correction],
+            "effect_err": self.error[bcid, detector, correction],
+            "cumulative": self.cumulative[bcid, detector, correction],
+        })
+
+
+def _nanmean(values: np.ndarray) -> float:
+    finite = values[np.isfinite(values)]
+    return float(finite.mean()) if finite.size else np.nan
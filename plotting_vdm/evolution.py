@@ -0,0 +1,455 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from typing import Union, Sequence, Iterable, Callable
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import gc
+
+import numpy as np
+import pandas as pd
+
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm import profiling
+
+
+Reducer = Callable[[pd.DataFrame, List[str]], pd.DataFrame]
+"""Reduces the value and error columns of a DataFrame grouped by some keys to one avg and err per group.
+It returns a DataFrame indexed by the keys, with the avg and err columns.
+The keys always include the scan, so a group never spans several scans."""
+
+_KEYS = ["correction", "detector", "scan"]
+
+
+def mean_std(frame: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """The mean of the values of each group and their standard deviation."""
+    grouped = frame.groupby(keys, sort=False, observed=True)["value"]
+    return pd.DataFrame({"avg": grouped.mean(), "err": grouped.std()})
+
+
+def weighted_mean(frame: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """The mean of the values of each group weighted by their inverse squared errors, and its error."""
+    weights = 1 / frame["error"]**2
+    sums = frame.assign(weight=weights, weighted=weights * frame["value"])\
+                .groupby(keys, sort=False, observed=True)[["weight", "weighted"]]\
+                .sum()
+
+    return pd.DataFrame({"avg": sums["weighted"] / sums["weight"], "err": 1 / np.sqrt(sums["weight"])})
+
+
+class ScanStatsReducer:
+    """Adapts a per-scan statistic, called with the values and errors of one group at a time, to a Reducer.
+
+    Parameters
+    ----------
+    scan_stats : Callable[[pd.Series, pd.Series], Tuple[float, float]]
+        Returns the avg and err of the values and errors of one scan.
+    """
+
+    def __init__(self, scan_stats: Callable[[pd.Series, pd.Series], Tuple[float, float]]) -> None:
+        self.scan_stats = scan_stats
+
+    def __call__(self, frame: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        stats = {
+            key: self.scan_stats(group["value"], group["error"])
+            for key, group in frame.groupby(keys, sort=False, observed=True)
+        }
+
+        index = pd.MultiIndex.from_tuples(list(stats), names=keys) if stats else pd.MultiIndex.from_tuples([], names=keys)
+        return pd.DataFrame(list(stats.values()), index=index, columns=["avg", "err"], dtype=float)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ScanStatsReducer) and other.scan_stats == self.scan_stats
+
+    def __hash__(self) -> int:
+        return hash(self.scan_stats)
+
+
+def _long_frame(frames: Sequence[pd.DataFrame], quantity: str, quantity_err: str, first_scan: int = 0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "correction": np.concatenate([part["correction"].to_numpy(dtype=object) for part in frames]),
+        "detector": np.concatenate([part["detector"].to_numpy(dtype=object) for part in frames]),
+        "scan": np.repeat(np.arange(first_scan, first_scan + len(frames)), [len(part) for part in frames]),
+        "value": np.concatenate([part[quantity].to_numpy() for part in frames]),
+        "error": np.concatenate([part[quantity_err].to_numpy() for part in frames]),
+    })
+
+
+class Evolution(ABC):
+    """
+    The statistics of a quantity across a sequence of scans, for every fit, correction and detector.
+
+    Attributes
+    ----------
+    results : List[Any]
+        The scans, in the order of the evolution. Each has at least a name and an id_str.
+    """
+
+    def __init__(self) -> None:
+        self.results: List[Any] = []
+        self._wide: Dict[Tuple[str, str, str, Reducer], pd.DataFrame] = {}
+
+    @abstractmethod
+    def stats(self, fit: str, quantity: str, quantity_err: str, reducer: Reducer = mean_std) -> pd.DataFrame:
+        """Returns the statistic of every (correction, detector, scan) group of a fit.
+
+        Arguments
+        ---------
+            fit : str
+                The fit.
+            quantity : str
+                The column of the values.
+            quantity_err : str
+                The column of the errors.
+            reducer : Reducer
+                The statistic, mean_std by default.
+
+        Returns
+        -------
+            pd.DataFrame
+                The avg and err columns, indexed by correction, detector and scan.
+        """
+
+    @abstractmethod
+    def covers(self, results: Sequence[Any]) -> bool:
+        """Tells whether the evolution was built from a group of scans."""
+
+    def series(self,
+               fit: str,
+               correction: str,
+               detector: str,
+               quantity: str,
+               quantity_err: str,
+               reducer: Reducer = mean_std
+               ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the statistic of one detector and correction for every scan.
+
+        Arguments
+        ---------
+            fit : str
+                The fit.
+            correction : str
+                The correction.
+            detector : str
+                The detector.
+            quantity : str
+                The column of the values.
+            quantity_err : str
+                The column of the errors.
+            reducer : Reducer
+                The statistic, mean_std by default.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray]
+                The avg and err of each scan, in the order of the scans. NaN for the scans without rows.
+        """
+        key = (fit, quantity, quantity_err, reducer)
+
+        wide = self._wide.get(key)
+        if wide is None:
+            columns = pd.MultiIndex.from_product([["avg", "err"], range(len(self.results))], names=[None, "scan"])
+            wide = self.stats(fit, quantity, quantity_err, reducer).unstack("scan").reindex(columns=columns)
+            self._wide[key] = wide
+
+        if (correction, detector) not in wide.index:
+            empty = np.full(len(self.results), np.nan)
+            return empty, empty.copy()
+
+        row = wide.loc[(correction, detector)]
+        return row["avg"].to_numpy(dtype=float), row["err"].to_numpy(dtype=float)
+
+    def table(self,
+              fits: Sequence[str],
+              quantity: str,
+              quantity_err: str,
+              reducer: Reducer = mean_std
+              ) -> pd.DataFrame:
+        """Returns the statistics of several fits as one long DataFrame.
+
+        Arguments
+        ---------
+            fits : Sequence[str]
+                The fits.
+            quantity : str
+                The column of the values.
+            quantity_err : str
+                The column of the errors.
+            reducer : Reducer
+                The statistic, mean_std by default.
+
+        Returns
+        -------
+            pd.DataFrame
+                The fit, correction, detector, scan, scan_name, avg and err columns.
+        """
+        names = np.array([result.name for result in self.results], dtype=object)
+
+        tables = []
+        for fit in fits:
+            table = self.stats(fit, quantity, quantity_err, reducer).reset_index()
+            table.insert(0, "fit", fit)
+            table.insert(4, "scan_name", names[table["scan"].to_numpy()])
+            tables.append(table)
+
+        return pd.concat(tables, ignore_index=True)
+
+
+class ScanEvolution(Evolution):
+    """
+    The statistics of a quantity across a sequence of loaded scans.
+
+    The results of every scan are concatenated once per fit, with a scan column holding the
+    position of the scan, and the statistic of every (correction, detector, scan) group is computed
+    by a single grouped aggregation. Concatenated frames and statistics are cached.
+
+    Parameters
+    ----------
+    results : Sequence[ScanResults]
+        The scans, in the order of the evolution.
+
+    Examples
+    --------
+    >>> evolution = ScanEvolution(results)
+    >>> avg, err = evolution.series("SG", "noCorr", "PLT", "xsec", "xsecErr")  # One value per scan
+    >>> evolution.table(["SG", "DG"], "xsec", "xsecErr", reducer=weighted_mean)
+    >>> evolution.stats("SG", "xsec", "xsecErr", reducer=lambda frame, keys: frame.groupby(keys)["value"].agg(avg="median", err="sem"))
+    """
+
+    def __init__(self, results: Sequence[ScanResults]) -> None:
+        super().__init__()
+        self.results = list(results)
+        self._frames: Dict[Tuple[str, str, str], pd.DataFrame] = {}
+        self._stats: Dict[Tuple[str, str, str, Reducer], pd.DataFrame] = {}
+
+    def frame(self, fit: str, quantity: str, quantity_err: str) -> pd.DataFrame:
+        """Returns the rows of every scan for one fit, as correction, detector, scan, value and error columns.
+
+        Arguments
+        ---------
+            fit : str
+                The fit.
+            quantity : str
+                The column of the values.
+            quantity_err : str
+                The column of the errors.
+
+        Returns
+        -------
+            pd.DataFrame
+                The concatenated rows.
+        """
+        key = (fit, quantity, quantity_err)
+
+        frame = self._frames.get(key)
+        if frame is None:
+            with profiling.stage("concat", fit=fit, quantity=quantity):
+                frame = _long_frame([result.results[fit] for result in self.results], quantity, quantity_err)
+            self._frames[key] = frame
+
+        return frame
+
+    def stats(self, fit: str, quantity: str, quantity_err: str, reducer: Reducer = mean_std) -> pd.DataFrame:
+        key = (fit, quantity, quantity_err, reducer)
+
+        stats = self._stats.get(key)
+        if stats is None:
+            frame = self.frame(fit, quantity, quantity_err)
+            with profiling.stage("reduce", fit=fit, quantity=quantity):
+                stats = self._stats[key] = reducer(frame, _KEYS)[["avg", "err"]]
+
+        return stats
+
+    def covers(self, results: Sequence[Any]) -> bool:
+        return len(self.results) == len(results) and all(a is b for a, b in zip(self.results, results))
+
+
+@dataclass
+class ScanSummary:
+    """What a StreamingEvolution keeps of a scan once its results are dropped.
+    It stands in for the ScanResults of the scan when plotting the evolution.
+
+    Attributes
+    ----------
+    id_str : str
+        The id of the scan.
+    name : str
+        The name of the scan.
+    fits : List[str]
+        The fits of the scan.
+    detectors : List[str]
+        The detectors of the scan.
+    corrections : List[str]
+        The corrections of the scan.
+    digests : Dict[Tuple[str, str, str], str]
+        The slice_digest of every (fit, detector, correction) slice, if they were kept.
+    """
+    id_str: str
+    name: str
+    fits: List[str]
+    detectors: List[str]
+    corrections: List[str]
+    digests: Dict[Tuple[str, str, str], str] = field(default_factory=dict, repr=False)
+
+    def slice_digest(self, fit: str, detector: str, correction: str) -> str:
+        """Returns the hash of a slice of the scan, as ScanResults.slice_digest did before the scan was dropped.
+
+        Raises
+        ------
+            ValueError
+                If the digests were not kept.
+        """
+        digest = self.digests.get((fit, detector, correction))
+        if digest is None:
+            raise ValueError(f"The digest of {fit} {detector} {correction} of scan {self.id_str} was not kept")
+
+        return digest
+
+
+class StreamingEvolution(Evolution):
+    """
+    The statistics of some quantities across a stream of scans, in bounded memory.
+
+    Each scan is reduced to its per-(fit, correction, detector) statistics as soon as it is
+    added, and only these summary rows are kept. The full results of a scan can be dropped
+    once it was added, so the memory used grows with the number of summary rows rather than
+    with the size of the scans.
+
+    Parameters
+    ----------
+    specs : Sequence[Tuple[str, str, Reducer]]
+        The (quantity, quantity_err, reducer) statistics to reduce every scan to.
+        Only these can be requested later.
+    keep_digests : bool
+        If True, the slice digests of every scan are kept, so that a RenderManifest can tell
+        whether the plots of the evolution are up to date.
+
+    Examples
+    --------
+    >>> scans = (entry.path for entry in catalog.select(start=datetime(2022, 1, 1)))
+    >>> evolution = StreamingEvolution.build(scans, [("xsec", "xsecErr", mean_std)], fits=["SG"])
+    >>> evolution.table(["SG"], "xsec", "xsecErr")
+    """
+
+    def __init__(self, specs: Sequence[Tuple[str, str, Reducer]], keep_digests: bool = False) -> None:
+        super().__init__()
+        self.specs = list(dict.fromkeys(specs))
+        self.keep_digests = keep_digests
+        self.results: List[ScanSummary] = []
+        self._parts: Dict[Tuple[str, str, str, Reducer], Dict[str, List[np.ndarray]]] = {}
+        self._stats: Dict[Tuple[str, str, str, Reducer], pd.DataFrame] = {}
+
+    @classmethod
+    def build(cls,
+              scans: Iterable[Union[ScanResults, Path, str]],
+              specs: Sequence[Tuple[str, str, Reducer]],
+              keep_digests: bool = False,
+              **kwargs: Any
+              ) -> StreamingEvolution:
+        """Loads and reduces the scans one at a time.
+
+        Arguments
+        ---------
+            scans : Iterable[Union[ScanResults, pathlib.Path, str]]
+                The scans, in the order of the evolution. Paths are loaded as ScanResults.
+                Pass a generator so that no more than one scan is held at once.
+            specs : Sequence[Tuple[str, str, Reducer]]
+                The (quantity, quantity_err, reducer) statistics to reduce every scan to.
+            keep_digests : bool
+                If True, the slice digests of every scan are kept.
+            **kwargs : Any
+                Forwarded to the ScanResults of every path. Ex: fits, detectors, corrections.
+
+        Returns
+        -------
+            StreamingEvolution
+                The statistics of the scans.
+        """
+        evolution = cls(specs, keep_digests)
+        for scan in scans:
+            if isinstance(scan, (Path, str)):
+                scan = ScanResults(scan, **kwargs)
+
+            evolution.add(scan)
+
+            # A scan holds reference cycles, it is only freed by a collection
+            del scan
+            gc.collect()
+
+        return evolution
+
+    def add(self, result: ScanResults) -> ScanSummary:
+        """Reduces a scan and appends it to the evolution. The scan can be dropped afterwards.
+
+        Arguments
+        ---------
+            result : ScanResults
+                The scan.
+
+        Returns
+        -------
+            ScanSummary
+                What is kept of the scan.
+        """
+        scan = len(self.results)
+        digests = {}
+
+        with profiling.stage("reduce", scan=result.id_str):
+            for fit in result.fits:
+                frame = result.results[fit]
+                for quantity, quantity_err, reducer in self.specs:
+                    part = reducer(_long_frame([frame], quantity, quantity_err, first_scan=scan), _KEYS)[["avg", "err"]]
+
+                    # Kept as plain arrays, a small DataFrame weighs far more than its rows
+                    columns = self._parts.setdefault(
+                        (fit, quantity, quantity_err, reducer), {name: [] for name in [*_KEYS, "avg", "err"]}
+                    )
+                    for name, values in part.reset_index().items():
+                        columns[name].append(values.to_numpy())
+
+                if self.keep_digests:
+                    digests.update({
+                        (fit, detector, correction): result.slice_digest(fit, detector, correction)
+                        for detector in result.detectors
+                        for correction in result.corrections
+                    })
+
+        summary = ScanSummary(
+            str(result.id_str), result.name, list(result.fits),
+            list(result.detectors), list(result.corrections), digests
+        )
+        self.results.append(summary)
+        self._stats.clear()
+        self._wide.clear()
+
+        return summary
+
+    def stats(self, fit: str, quantity: str, quantity_err: str, reducer: Reducer = mean_std) -> pd.DataFrame:
+        """Returns the statistic of every (correction, detector, scan) group of a fit.
+
+        Raises
+        ------
+            ValueError
+                If the scans were not reduced to this statistic.
+        """
+        key = (fit, quantity, quantity_err, reducer)
+        if (quantity, quantity_err, reducer) not in self.specs:
+            raise ValueError(f"The scans were not reduced to {quantity} with {reducer}. Reduced: {self.specs}")
+
+        stats = self._stats.get(key)
+        if stats is None:
+            columns = self._parts.get(key)
+            if columns is not None:
+                stats = pd.DataFrame({name: np.concatenate(values) for name, values in columns.items()}).set_index(_KEYS)
+            else:
+                stats = pd.DataFrame(
+                    {"avg": [], "err": []}, dtype=float, index=pd.MultiIndex.from_tuples([], names=_KEYS)
+                )
+            self._stats[key] = stats
+
+        return stats
+
+    def covers(self, results: Sequence[Any]) -> bool:
+        # Summaries are compared by id, they are copied when the evolution is sent to render workers
+        return [result.id_str for result in self.results] == [result.id_str for result in results]
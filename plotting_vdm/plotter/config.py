@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from plotting_vdm.plotter.manifest import RenderManifest
+
 
 def get_default_colors() -> List[str]:
     return ["k", "r", "g", "b", "m", "c", "y"]
@@ -14,6 +17,8 @@ class PlotterCongig:
     file_suffix: str = ""
     file_ext: str = "png"
     colors: List[str] = field(default_factory=get_default_colors)
+    reuse_figure: bool = False
+    manifest: Optional[RenderManifest] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -1,12 +1,20 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Sequence, Optional
+from typing import List, Tuple, Sequence, Optional, Iterable, Union, Any
 from itertools import product
+from pathlib import Path
 
-import matplotlib.pyplot as plt
+import copy
+
+from matplotlib.axes import Axes
 
 from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.evolution import Evolution, ScanEvolution, StreamingEvolution, ScanSummary
+from plotting_vdm import profiling
 from plotting_vdm.plotter.config import EvoPlotterConfig
+from plotting_vdm.plotter.worker import PlotJob, render_in_pool
+from plotting_vdm.plotter.manifest import ManifestEntry, render_job
+from plotting_vdm.plotter.utils import plot_axes
 from .strategy import EvoPlotStrategy
 
 
@@ -15,60 +23,197 @@ class EvoPlotter:
     config: EvoPlotterConfig
     plot_strategy: Optional[EvoPlotStrategy] = None
 
-    def __call__(self, result: Sequence[ScanResults]):
-        plt.figure()
-        self.plot(result)
-        plt.close()
+    def __post_init__(self):
+        self._evolution: Optional[Evolution] = None
 
-    def plot_many(self, results: Sequence[Sequence[ScanResults]]):
-        for result in results:
-            self(result)
+    def __getstate__(self):
+        # A ScanEvolution holds the concatenated scans, workers build their own.
+        # A StreamingEvolution only holds summary rows and is sent along, its scans cannot be reloaded.
+        state = self.__dict__.copy()
+        if isinstance(self._evolution, ScanEvolution):
+            state["_evolution"] = None
+        return state
+
+    def __call__(self, result: Sequence[ScanResults]):
+        with self._stage("plot"):
+            self.plot(result)
+
+    def plot_many(self, results: Sequence[Sequence[ScanResults]], max_workers: Optional[int] = None):
+        """Plots every group of scans.
+
+        Arguments
+        ---------
+            results : Sequence[Sequence[ScanResults]]
+                The groups of scans to plot.
+            max_workers : Optional[int]
+                If None, the groups are plotted one after another in this process. Otherwise, their
+                jobs are rendered by this many Agg worker processes with the rcParams of this process.
+        """
+        if max_workers is None:
+            for result in results:
+                self(result)
+            return
 
-    def plot(self, results: Sequence[ScanResults]):
         if self.plot_strategy is None:
             raise ValueError("Plot strategy not set")
 
-        fits = results[0].fits
-        corrections = results[0].corrections
+        render_in_pool(self, [(result, self.jobs(result)) for result in results], max_workers)
+
+    def plot_stream(self,
+                    scans: Iterable[Union[ScanResults, Path, str]],
+                    strategies: Optional[Sequence[EvoPlotStrategy]] = None,
+                    max_workers: Optional[int] = None,
+                    **kwargs: Any) -> StreamingEvolution:
+        """Plots the evolution of scans that are loaded, reduced and dropped one at a time.
+
+        Only the per-(fit, correction, detector) statistics of each scan are kept, so the memory
+        used does not grow with the size of the scans. Every strategy is plotted from a single
+        pass over the scans.
+
+        Arguments
+        ---------
+            scans : Iterable[Union[ScanResults, pathlib.Path, str]]
+                The scans, in the order of the evolution. Paths are loaded as ScanResults with kwargs.
+                Pass a generator so that no more than one scan is held at once.
+            strategies : Optional[Sequence[EvoPlotStrategy]]
+                The strategies to plot. If None, the strategy of the plotter is plotted.
+            max_workers : Optional[int]
+                If set, the plots are rendered by this many Agg worker processes.
+            **kwargs : Any
+                Forwarded to the ScanResults of every path. Ex: fits, detectors, corrections.
+
+        Returns
+        -------
+            StreamingEvolution
+                The statistics of the scans, to plot them again or export them without reloading.
+
+        Raises
+        ------
+            ValueError
+                If no strategy is given and the plotter has none.
+        """
+        strategies = [self.plot_strategy] if strategies is None else list(strategies)
+        if not strategies or any(strategy is None for strategy in strategies):
+            raise ValueError("Plot strategy not set")
 
-        for fit, correction in product(fits, corrections):
-            if self.plot_strategy.plot_per_detector:
-                self._plot_per_detector(results, fit, correction)
+        evolution = StreamingEvolution.build(
+            scans,
+            [(strategy.quantity, strategy.quantity_err, strategy.reducer) for strategy in strategies],
+            keep_digests=self.config.manifest is not None,
+            **kwargs,
+        )
+        if not evolution.results:
+            return evolution
+
+        for strategy in strategies:
+            plotter = copy.copy(self)
+            plotter.plot_strategy = strategy
+            plotter._evolution = evolution
+
+            if max_workers is None:
+                plotter(evolution.results)
             else:
-                self._not_plot_per_detector(results, fit, correction)
+                render_in_pool(plotter, [(evolution.results, plotter.jobs(evolution.results))], max_workers)
 
-    def _plot_per_detector(self, results: Sequence[ScanResults], fit: str, correction: str):
-        for i, detector in enumerate(results[0].detectors):
-            plt.clf()
-            
-            datas = [
-                result.results[fit]\
-                    .query(f"detector == '{detector}' and correction == '{correction}'")
-                for result in results
+        return evolution
+
+    def jobs(self, results: Sequence[ScanResults]) -> List[PlotJob]:
+        """Lists the figures the plotter renders for a group of scans."""
+        fits = results[0].fits
+        corrections = results[0].corrections
+
+        if self.plot_strategy.plot_per_detector:
+            return [
+                PlotJob(fit, correction, detector)
+                for fit, correction, detector in product(fits, corrections, results[0].detectors)
             ]
 
-            self.plot_strategy.do_plot(datas, label=detector, color=self.config.colors[i])
-            self._post_plot(fit, correction)
+        return [PlotJob(fit, correction) for fit, correction in product(fits, corrections)]
 
-    def _not_plot_per_detector(self, results: Sequence[ScanResults], fit: str, correction: str):
-        plt.clf()
+    def plot(self, results: Sequence[ScanResults]):
+        if self.plot_strategy is None:
+            raise ValueError("Plot strategy not set")
+
+        for job in self.jobs(results):
+            self.render(results, job)
+
+        if self.config.manifest is not None:
+            self.config.manifest.save()
+
+    def render(self, results: Sequence[ScanResults], job: PlotJob) -> List[ManifestEntry]:
+        """Renders one job, unless the manifest of the configuration lists it as up to date."""
+        return render_job(self, results, job)
+
+    def plot_job(self, results: Sequence[ScanResults], job: PlotJob):
+        fit, correction = job.fit, job.correction
+        strategy = self.plot_strategy
+        evolution = self.evolution(results)
+
+        ax = plot_axes((type(self), type(strategy)), reuse=self.config.reuse_figure)
 
         for i, detector in enumerate(results[0].detectors):
-            datas = [
-                result.results[fit]\
-                    .query(f"detector == '{detector}' and correction == '{correction}'")
-                for result in results
-            ]
+            if job.detector is not None and detector != job.detector:
+                continue
+
+            # The statistics of every scan, detector and correction of the fit are reduced together the first time
+            avg, err = evolution.series(fit, correction, detector, strategy.quantity, strategy.quantity_err, strategy.reducer)
+
+            with self._stage("draw", fit=fit, detector=detector, correction=correction):
+                strategy.plot_stats(avg, err, label=detector, color=self.config.colors[i], detector=detector, ax=ax)
+
+        self._post_plot(fit, correction, ax)
 
-            self.plot_strategy.do_plot(datas, label=detector, color=self.config.colors[i])
+    def evolution(self, results: Sequence[Union[ScanResults, ScanSummary]]) -> Evolution:
+        """Returns the evolution of a group of scans, reusing the one of the previous call for the same scans.
 
-        self._post_plot(fit, correction)
+        Raises
+        ------
+            ValueError
+                If the scans are summaries of another StreamingEvolution.
+        """
+        if self._evolution is None or not self._evolution.covers(results):
+            if any(isinstance(result, ScanSummary) for result in results):
+                raise ValueError("Scan summaries can only be plotted with the StreamingEvolution they come from")
 
-    def _post_plot(self, fit, correction):
-        self.plot_strategy.style_plot(fit=fit, correction=correction, xticks=self.config.xticks)
-        self.plot_strategy.save_plot(
+            self._evolution = ScanEvolution(results)
+
+        return self._evolution
+
+    def job_inputs(self, results: Sequence[ScanResults], job: PlotJob) -> List[Tuple[str, ...]]:
+        """Lists the slices a job reads, as ("slice", scan, fit, detector, correction) keys."""
+        detectors = results[0].detectors if job.detector is None else [job.detector]
+        return [
+            ("slice", result.id_str, job.fit, detector, job.correction)
+            for detector in detectors
+            for result in results
+        ]
+
+    def job_output(self, results: Sequence[ScanResults], job: PlotJob) -> Path:
+        """Returns the path of the plot a job writes."""
+        return self.plot_strategy.output_path(
             self.config.output_dir,
-            f"{fit}_{correction}",
+            f"{job.fit}_{job.correction}",
             suffix=self.config.file_suffix,
             file_ext=self.config.file_ext,
+            detector=job.detector,
         )
+
+    def job_outputs(self, results: Sequence[ScanResults], job: PlotJob) -> List[Path]:
+        """Returns the paths of every file a job writes, its plot first."""
+        return [self.job_output(results, job)]
+
+    def _post_plot(self, fit: str, correction: str, ax: Axes):
+        with self._stage("style", fit=fit, correction=correction):
+            self.plot_strategy.style_plot(fit=fit, correction=correction, xticks=self.config.xticks, ax=ax)
+
+        with self._stage("save", fit=fit, correction=correction):
+            self.plot_strategy.save_plot(
+                self.config.output_dir,
+                f"{fit}_{correction}",
+                suffix=self.config.file_suffix,
+                file_ext=self.config.file_ext,
+                ax=ax,
+            )
+
+    def _stage(self, name: str, **tags):
+        return profiling.stage(name, strategy=type(self.plot_strategy).__name__, **tags)
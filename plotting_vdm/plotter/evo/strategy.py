@@ -5,9 +5,10 @@ from pathlib import Path
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
-from plotting_vdm.plotter.utils import TitleBuilder
+from plotting_vdm.plotter.utils import TitleBuilder, resolve_axes
+from plotting_vdm.evolution import Reducer, ScanStatsReducer, mean_std
 
 
 def _set_current_detector(method):
@@ -20,6 +21,11 @@ def _set_current_detector(method):
     return do_plot_wrapper
 
 
+def mean_and_std(values, _errors) -> Tuple[float, float]:
+    # A module level function rather than a lambda, so that strategies can be sent to render workers
+    return values.mean(), values.std()
+
+
 @dataclass
 class EvoPlotStrategy:
     latex: str
@@ -34,12 +40,13 @@ class EvoPlotStrategy:
     scan_stats: Callable[
         [pd.Series, pd.Series], # Arguments: value, error
         Tuple[float, float] # Return: avg, err
-    ] = lambda x, _: (x.mean(), x.std())
+    ] = mean_and_std
+    scan_reducer: Optional[Reducer] = None # Vectorized replacement of scan_stats, see plotting_vdm.evolution
     plot_fit: bool = False
     fit_stats: Callable[
         [np.ndarray, np.ndarray], # Arguments: value, error
         Tuple[float, float] # Return: avg, err
-    ] = lambda x, _: (x.mean(), x.std())
+    ] = mean_and_std
 
     def __post_init__(self):
         self.current_detector = ""
@@ -48,27 +55,65 @@ class EvoPlotStrategy:
     def plot_per_detector(self) -> bool:
         return self.plot_per_detector
 
+    @property
+    def reducer(self) -> Reducer:
+        """The vectorized statistic of the scans: scan_reducer if set, otherwise scan_stats applied to each scan."""
+        if self.scan_reducer is not None:
+            return self.scan_reducer
+        if self.scan_stats is mean_and_std:
+            return mean_std
+
+        return ScanStatsReducer(self.scan_stats)
+
     @_set_current_detector
-    def do_plot(self, datas: Sequence[pd.DataFrame], *, label: str, color: str = "k"):
-        x_data = np.empty(len(datas))
+    def do_plot(self, datas: Sequence[pd.DataFrame], *, label: str, color: str = "k", ax: Optional[Axes] = None):
         y_data = np.empty(len(datas))
         y_err  = np.empty(len(datas))
 
         for i, data in enumerate(datas):
-            avg, err = self.scan_stats(data[self.quantity], data[self.quantity_err])
+            y_data[i], y_err[i] = self.scan_stats(data[self.quantity], data[self.quantity_err])
+
+        self.plot_stats(y_data, y_err, label=label, color=color, detector=self.current_detector, ax=ax)
+
+    def plot_stats(self,
+                   y_data: np.ndarray,
+                   y_err: np.ndarray,
+                   *,
+                   label: str,
+                   color: str = "k",
+                   detector: str = "",
+                   ax: Optional[Axes] = None):
+        """Plots the already reduced statistic of every scan.
+
+        Arguments
+        ---------
+            y_data : np.ndarray
+                The avg of each scan, in the order of the scans.
+            y_err : np.ndarray
+                The err of each scan.
+            label : str
+                The label of the points.
+            color : str
+                The color of the points.
+            detector : str
+                The detector of the points, used by the output path of per-detector plots.
+            ax : Optional[Axes]
+                The axes to plot on.
+        """
+        if self.plot_per_detector:
+            self.current_detector = detector
 
-            x_data[i] = i+1
-            y_data[i] = avg
-            y_err[i]  = err
+        ax = resolve_axes(ax)
+        x_data = np.arange(1, len(y_data) + 1, dtype=float)
 
-        plt.errorbar(x_data, y_data, yerr=y_err, fmt="o", label=label, color=color)
+        ax.errorbar(x_data, y_data, yerr=y_err, fmt="o", label=label, color=color)
 
         if self.plot_fit:
             avg, err = self.fit_stats(y_data, y_err)
             rchi2 = np.sum((y_data - avg)**2 / y_err**2) / (len(y_data) - 1)
-            plt.axhline(avg, color=color, linestyle="--")
-            plt.axhspan(avg - err, avg + err, color=color, alpha=0.3)
-            plt.figtext(
+            ax.axhline(avg, color=color, linestyle="--")
+            ax.axhspan(avg - err, avg + err, color=color, alpha=0.3)
+            ax.figure.text(
                 x=0.88,
                 y=0.87,
                 ha="right",
@@ -78,11 +123,17 @@ class EvoPlotStrategy:
                 backgroundcolor="white",
             ).set_bbox(dict(color="w", alpha=1))
 
-        plt.xlim(0, len(datas) + 1)
+        ax.set_xlim(0, len(y_data) + 1)
 
-    def style_plot(self, *, fit: str, correction: str, xticks: Optional[List[str]] = None):
+    def style_plot(self,
+                   *,
+                   fit: str,
+                   correction: str,
+                   xticks: Optional[List[str]] = None,
+                   ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
         if xticks is not None:
-            plt.xticks(range(1, len(xticks) + 1), xticks)
+            ax.set_xticks(range(1, len(xticks) + 1), xticks)
 
         title = TitleBuilder()\
                 .set_info(self.latex)\
@@ -90,21 +141,56 @@ class EvoPlotStrategy:
                 .set_correction(correction)\
                 .build()
 
-        plt.title(title)
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.latex)
-
-        plt.grid()
-        if self.add_legend: plt.legend(loc="best")
-        plt.ticklabel_format(useOffset=False, axis="y") # Disable scientific notation
-
-    def save_plot(self, ouput_dir: Path, file_name: str, *, suffix: str = "", file_ext: str = "png"):
-        path = ouput_dir/"evolution"/self.output_folder_name/self.current_detector
-        path.mkdir(parents=True, exist_ok=True)
-
-        file_name = f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
-
-        plt.savefig(path/file_name)
+        ax.set_title(title)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.latex)
+
+        ax.grid(True)
+        if self.add_legend: ax.legend(loc="best")
+        ax.ticklabel_format(useOffset=False, axis="y") # Disable scientific notation
+
+    def save_plot(self,
+                  ouput_dir: Path,
+                  file_name: str,
+                  *,
+                  suffix: str = "",
+                  file_ext: str = "png",
+                  ax: Optional[Axes] = None):
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext=file_ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        resolve_axes(ax).figure.savefig(path)
+
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        """Returns the path save_plot writes a plot to.
+
+        Arguments
+        ---------
+            ouput_dir : pathlib.Path
+                The output directory of the plotter.
+            file_name : str
+                The name of the plot, without prefix, suffix and extension.
+            suffix : str
+                Appended to the name of the plot.
+            file_ext : str
+                The extension of the file.
+            detector : Optional[str]
+                The detector of a per-detector plot. If None, the detector of the last do_plot call is used.
+
+        Returns
+        -------
+            pathlib.Path
+                The path of the plot.
+        """
+        path = ouput_dir/"evolution"/self.output_folder_name/(self.current_detector if detector is None else detector)
+
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
 
 
 @dataclass
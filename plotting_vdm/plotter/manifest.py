@@ -0,0 +1,249 @@
+from __future__ import annotations
+from typing import List, Dict, Any
+from typing import Union, Optional, ClassVar, Iterable, TYPE_CHECKING
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime
+from pathlib import Path
+
+import os
+import json
+import time
+import hashlib
+
+import matplotlib
+
+import plotting_vdm
+
+if TYPE_CHECKING:
+    from plotting_vdm.plotter.worker import PlotJob
+
+
+@dataclass
+class ManifestEntry:
+    """A file written by a render: a plot, or a table written with it.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The path of the file.
+    key : str
+        The hash of everything the file was rendered from.
+        The files written by the same job share it.
+    render_time : float
+        The time it took to render and save the job of the file, in seconds.
+    rendered_at : str
+        When the plot was rendered, in ISO format.
+    """
+    path: Path
+    key: str
+    render_time: float
+    rendered_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+
+@dataclass
+class RenderManifest:
+    """
+    An on-disk list of every file written to an output directory, with the hash of
+    the data, strategy, plotter configuration and library versions it was rendered from.
+    Jobs whose hash did not change since their last render, and whose files all still exist,
+    are skipped.
+
+    Parameters
+    ----------
+    path : Union[pathlib.Path,str]
+        The JSON file of the manifest. Paths in it are relative to its directory.
+    entries : Dict[str, ManifestEntry]
+        The files of the manifest, keyed by their path relative to the manifest directory.
+
+    Examples
+    --------
+    >>> manifest = RenderManifest.load(Path("plots_final/manifest.json"))
+    >>> config = PlotterCongig(Path("plots_final"), manifest=manifest)
+    >>> NormalPlotter(config, CapSigmaXNormalPlotStrategy()).plot_many(results)  # Only renders what changed
+    >>> manifest.files()  # Every file in the output directory
+    """
+    path: Path
+    entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    _version: ClassVar[int] = 1
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> RenderManifest:
+        """Loads a manifest, or creates an empty one if the file does not exist."""
+        manifest = cls(Path(path))
+        if not manifest.path.is_file():
+            return manifest
+
+        content = json.loads(manifest.path.read_text())
+        if content.get("version") != cls._version:
+            return manifest
+
+        for relative_path, entry in content["files"].items():
+            manifest.entries[relative_path] = ManifestEntry(
+                manifest.path.parent / relative_path, entry["key"], entry["render_time"], entry["rendered_at"]
+            )
+
+        return manifest
+
+    def save(self) -> None:
+        """Writes the manifest. The file is replaced atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        content = {
+            "version": self._version,
+            "files": {
+                relative_path: {"key": entry.key, "render_time": entry.render_time, "rendered_at": entry.rendered_at}
+                for relative_path, entry in sorted(self.entries.items())
+            },
+        }
+
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(content, indent=1))
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, path: Path, key: str) -> bool:
+        """Tells whether a file was rendered from the same inputs and still exists."""
+        entry = self.entries.get(self._relative(path))
+        return entry is not None and entry.key == key and Path(path).is_file()
+
+    def record(self, entries: Iterable[ManifestEntry]) -> None:
+        for entry in entries:
+            self.entries[self._relative(entry.path)] = entry
+
+    def files(self) -> List[Path]:
+        """Returns the path of every file of the manifest."""
+        return [entry.path for entry in self.entries.values()]
+
+    def _relative(self, path: Path) -> str:
+        return os.path.relpath(Path(path).absolute(), self.path.parent.absolute())
+
+
+def _canonical(value: Any) -> Any:
+    # Functions are identified by name, their repr contains a memory address
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+    if is_dataclass(value):
+        return [type(value).__name__, {item.name: _canonical(getattr(value, item.name)) for item in fields(value)}]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, Path):
+        return str(value)
+
+    return value
+
+
+def _rc_digest() -> str:
+    return hashlib.sha1(repr(sorted(
+        (key, repr(value)) for key, value in matplotlib.rcParams.items() if key != "backend"
+    )).encode()).hexdigest()
+
+
+def job_key(plotter: Any, target: Any, job: PlotJob) -> str:
+    """Hashes everything a plot job is rendered from.
+
+    The hash covers the content of the slices the job reads, the scan names, the fields of
+    the strategy, the fields of the plotter and of its configuration that change the plot,
+    the matplotlib rcParams and the versions of plotting_vdm and matplotlib.
+
+    Arguments
+    ---------
+        plotter : Union[Plotter, EvoPlotter]
+            The plotter, with its strategy set.
+        target : Union[ScanResults, Sequence[ScanResults]]
+            The scan, or group of scans, the job plots.
+        job : PlotJob
+            The job.
+
+    Returns
+    -------
+        str
+            The hexadecimal hash of the job.
+    """
+    results = {result.id_str: result for result in (target if isinstance(target, (list, tuple)) else [target])}
+
+    digests: List[str] = []
+    for node in plotter.job_inputs(target, job):
+        kind, scan, fit, detector, correction = node[:5]
+        digests.append(results[scan].slice_digest(fit, detector, correction))
+        if kind == "align":
+            digests.append(results[scan].slice_digest(fit, *node[5:]))
+
+    config = plotter.config
+    payload = json.dumps({
+        "versions": [plotting_vdm.__version__, matplotlib.__version__],
+        "rc_params": _rc_digest(),
+        "job": list(job),
+        "scans": [[result.id_str, result.name] for result in results.values()],
+        "inputs": digests,
+        "strategy": _canonical(plotter.plot_strategy),
+        "plotter": {
+            item.name: _canonical(getattr(plotter, item.name))
+            for item in fields(plotter) if item.name not in ("config", "plot_strategy", "plot_strategies")
+        },
+        "config": {
+            "colors": config.colors,
+            "file_suffix": config.file_suffix,
+            "file_ext": config.file_ext,
+            "xticks": getattr(config, "xticks", None),
+        },
+    }, default=str)
+
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def up_to_date(plotter: Any, target: Any, job: PlotJob) -> bool:
+    """Tells whether the manifest of the configuration of a plotter lists every file of a job as up to date."""
+    manifest: Optional[RenderManifest] = plotter.config.manifest
+    if manifest is None:
+        return False
+
+    key = job_key(plotter, target, job)
+    return all(manifest.is_current(path, key) for path in plotter.job_outputs(target, job))
+
+
+def record_job(plotter: Any, target: Any, job: PlotJob, render_time: float) -> List[ManifestEntry]:
+    """Records every file of a rendered job in the manifest of the configuration of a plotter.
+
+    Returns
+    -------
+        List[ManifestEntry]
+            The entries of the files, empty if the plotter has no manifest.
+    """
+    manifest: Optional[RenderManifest] = plotter.config.manifest
+    if manifest is None:
+        return []
+
+    key = job_key(plotter, target, job)
+    entries = [ManifestEntry(path, key, render_time) for path in plotter.job_outputs(target, job)]
+    manifest.record(entries)
+    return entries
+
+
+def render_job(plotter: Any, target: Any, job: PlotJob) -> List[ManifestEntry]:
+    """Renders one job of a plotter, unless the manifest of its configuration says it is up to date.
+
+    Arguments
+    ---------
+        plotter : Union[Plotter, EvoPlotter]
+            The plotter, with its strategy set.
+        target : Union[ScanResults, Sequence[ScanResults]]
+            The scan, or group of scans, the job plots.
+        job : PlotJob
+            The job.
+
+    Returns
+    -------
+        List[ManifestEntry]
+            The entries of the files of the job, empty if it was skipped or the plotter has no manifest.
+    """
+    if up_to_date(plotter, target, job):
+        return []
+
+    start = time.perf_counter()
+    plotter.plot_job(target, job)
+    return record_job(plotter, target, job, time.perf_counter() - start)
@@ -0,0 +1,308 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from typing import Union, Optional, Sequence, ClassVar
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import copy
+import heapq
+
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.worker import PlotJob, snapshot_rc_params, init_render_worker
+from plotting_vdm.plotter.evo import EvoPlotter
+from plotting_vdm.plotter.manifest import ManifestEntry, render_job
+
+
+Node = Tuple[str, ...]
+
+
+@dataclass
+class RenderTask:
+    """One figure of the plan.
+
+    Attributes
+    ----------
+    plotter : Union[Plotter, EvoPlotter]
+        A copy of the plotter, with the strategy of the figure set.
+    job : PlotJob
+        The figure of the plotter.
+    inputs : List[Tuple[str, ...]]
+        The slices and alignments the figure reads.
+    cost : float
+        The estimated render time of the figure in seconds.
+    """
+    plotter: Any
+    job: PlotJob
+    inputs: List[Node]
+    cost: float
+
+
+@dataclass
+class RenderUnit:
+    """The figures of one fit of one scan, or of one group of scans for evolution plots.
+    A unit is rendered by a single worker, so the slices and alignments its figures
+    share are only computed once.
+
+    Attributes
+    ----------
+    result : Union[ScanResults, Tuple[ScanResults, ...]]
+        The scan, or group of scans, the figures are plotted from.
+    fit : str
+        The fit of the figures.
+    tasks : List[RenderTask]
+        The figures of the unit.
+    """
+    result: Union[ScanResults, Tuple[ScanResults, ...]]
+    fit: str
+    tasks: List[RenderTask] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        results = self.result if isinstance(self.result, tuple) else (self.result,)
+        # Unnamed scans are told apart by their id
+        return f"{'+'.join(result.name or result.id_str for result in results)}/{self.fit}"
+
+    @property
+    def cost(self) -> float:
+        return sum(task.cost for task in self.tasks)
+
+
+def _render_unit(unit: RenderUnit) -> List[List[ManifestEntry]]:
+    return [render_job(task.plotter, unit.result, task.job) for task in unit.tasks]
+
+
+@dataclass
+class RenderPlan:
+    """
+    The figures of a run, grouped into units and ordered longest first.
+
+    Attributes
+    ----------
+    units : List[RenderUnit]
+        The units of the plan, by decreasing estimated cost.
+    duplicates : int
+        The number of requested figures dropped because another task writes the same figure.
+    """
+    units: List[RenderUnit]
+    duplicates: int = 0
+
+    @property
+    def tasks(self) -> List[RenderTask]:
+        return [task for unit in self.units for task in unit.tasks]
+
+    @property
+    def cost(self) -> float:
+        return sum(unit.cost for unit in self.units)
+
+    def nodes(self) -> Dict[Node, int]:
+        """Counts the figures reading each slice and alignment."""
+        counts: Dict[Node, int] = {}
+        for task in self.tasks:
+            for node in task.inputs:
+                counts[node] = counts.get(node, 0) + 1
+
+        return counts
+
+    def makespan(self, max_workers: int) -> float:
+        """Estimates the wall time of the plan when its units are handed, in order, to the first free worker.
+
+        Arguments
+        ---------
+            max_workers : int
+                The number of workers.
+
+        Returns
+        -------
+            float
+                The estimated wall time in seconds.
+        """
+        loads = [0.0] * max(1, max_workers)
+        for unit in self.units:
+            heapq.heapreplace(loads, loads[0] + unit.cost)
+
+        return max(loads)
+
+    def describe(self, max_workers: int = 1) -> str:
+        """Describes the plan without rendering anything.
+
+        Arguments
+        ---------
+            max_workers : int
+                The number of workers to estimate the wall time for.
+
+        Returns
+        -------
+            str
+                One line per unit and a summary of the plan.
+        """
+        nodes = self.nodes()
+        references = sum(nodes.values())
+
+        lines = [f"{'unit':40s} {'figures':>8s} {'cost [s]':>10s}"]
+        for unit in self.units:
+            lines.append(f"{unit.name:40s} {len(unit.tasks):8d} {unit.cost:10.2f}")
+
+        lines.append(
+            f"{len(self.tasks)} figures in {len(self.units)} units "
+            f"({self.duplicates} duplicates dropped), "
+            f"{len(nodes)} slices and alignments shared by {references} reads"
+        )
+        lines.append(
+            f"Estimated cost: {self.cost:.1f} s serial, "
+            f"{self.makespan(max_workers):.1f} s on {max_workers} worker(s)"
+        )
+
+        return "\n".join(lines)
+
+    def run(self, max_workers: Optional[int] = None, dry_run: bool = False) -> None:
+        """Renders every figure of the plan.
+
+        Arguments
+        ---------
+            max_workers : Optional[int]
+                If None, the units are rendered in this process. Otherwise, they are rendered by
+                this many Agg worker processes with the rcParams of this process, longest first.
+            dry_run : bool
+                If True, the plan is printed and nothing is rendered.
+
+        Raises
+        ------
+            Exception
+                The first error raised while rendering. The units that did not start yet are cancelled.
+        """
+        if dry_run:
+            print(self.describe(max_workers or 1))
+            return
+
+        if max_workers is None:
+            for unit in self.units:
+                _render_unit(unit)
+            self._save_manifests()
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_render_worker,
+            initargs=(snapshot_rc_params(),),
+        ) as pool:
+            futures = [pool.submit(_render_unit, unit) for unit in self.units]
+            try:
+                entries = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # The workers record into copies of the manifests
+        for unit, unit_entries in zip(self.units, entries):
+            for task, task_entries in zip(unit.tasks, unit_entries):
+                if task_entries:
+                    task.plotter.config.manifest.record(task_entries)
+        self._save_manifests()
+
+    def _save_manifests(self) -> None:
+        manifests = {id(task.plotter.config.manifest): task.plotter.config.manifest for task in self.tasks}
+        for manifest in manifests.values():
+            if manifest is not None:
+                manifest.save()
+
+
+@dataclass
+class RenderPlanner:
+    """
+    Expands plotters and their strategies into an explicit plan of figures for a set of scans.
+
+    Every (plotter, strategy, scan, fit, correction[, detector]) figure becomes a task that
+    lists the slices and alignments it reads. Figures written twice are dropped. Tasks are
+    grouped by scan and fit so that the data they share is prepared once, and the groups
+    are scheduled longest first.
+
+    Parameters
+    ----------
+    plotters : Sequence[Tuple[Any, Sequence[Any]]]
+        The plotters to run, each with the strategies to run it with. Scan plotters run on
+        every scan, an EvoPlotter runs once on all the scans.
+    figure_cost : float
+        The estimated time to style and save one figure, in seconds.
+    point_cost : float
+        The estimated time to draw one BCID of one detector, in seconds.
+
+    Examples
+    --------
+    >>> planner = RenderPlanner([
+    ...     (NormalPlotter(config), [CapSigmaXNormalPlotStrategy(), PeakXNormalPlotStrategy()]),
+    ...     (RatioPlotter("HFOC", config), [CapSigmaXRatioPlotStrategy(), CapSigmaYRatioPlotStrategy()]),
+    ...     (EvoPlotter(evo_config), [CapSigmaXEvoPlotStrategy()]),
+    ... ])
+    >>> plan = planner.plan(results)
+    >>> plan.run(max_workers=8, dry_run=True)
+    >>> plan.run(max_workers=8)
+    """
+    plotters: Sequence[Tuple[Any, Sequence[Any]]]
+    figure_cost: float = 0.08
+    point_cost: float = 2e-5
+
+    # Approximate size of the two plane rows of one BCID in a FitResults CSV
+    _bytes_per_point: ClassVar[int] = 400
+
+    def plan(self, results: Sequence[ScanResults]) -> RenderPlan:
+        """Builds the plan of every figure of the plotters for the scans.
+
+        Arguments
+        ---------
+            results : Sequence[ScanResults]
+                The scans to plot.
+
+        Returns
+        -------
+            RenderPlan
+                The plan, with its units ordered longest first.
+        """
+        units: Dict[Tuple[Tuple[str, ...], str], RenderUnit] = {}
+        seen = set()
+        duplicates = 0
+
+        for plotter, strategies in self.plotters:
+            for strategy in strategies:
+                if isinstance(plotter, EvoPlotter):
+                    strategy_plotter = copy.copy(plotter)
+                    strategy_plotter.plot_strategy = strategy
+                else:
+                    strategy_plotter = plotter.for_strategy(strategy)
+
+                targets = [tuple(results)] if isinstance(plotter, EvoPlotter) else list(results)
+                for target in targets:
+                    for job in strategy_plotter.jobs(target):
+                        key = (repr(strategy_plotter), self._scan_ids(target), job)
+                        if key in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(key)
+
+                        inputs = strategy_plotter.job_inputs(target, job)
+                        task = RenderTask(strategy_plotter, job, inputs, self._estimate(target, inputs))
+
+                        unit_key = (self._scan_ids(target), job.fit)
+                        if unit_key not in units:
+                            units[unit_key] = RenderUnit(target, job.fit)
+                        units[unit_key].tasks.append(task)
+
+        ordered = sorted(units.values(), key=lambda unit: unit.cost, reverse=True)
+        return RenderPlan(ordered, duplicates)
+
+    @staticmethod
+    def _scan_ids(target: Union[ScanResults, Tuple[ScanResults, ...]]) -> Tuple[str, ...]:
+        targets = target if isinstance(target, tuple) else (target,)
+        return tuple(result.id_str for result in targets)
+
+    def _estimate(self, target: Union[ScanResults, Tuple[ScanResults, ...]], inputs: List[Node]) -> float:
+        results = {result.id_str: result for result in (target if isinstance(target, tuple) else (target,))}
+
+        points = 0
+        for node in inputs:
+            _, scan, fit, detector, correction = node[:5]
+            result_file = results[scan].index.fit_results.get((fit, detector, correction))
+            if result_file is not None:
+                points += result_file.size // self._bytes_per_point
+
+        return self.figure_cost + self.point_cost * points
@@ -1,22 +1,210 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Sequence
+from itertools import product
+from typing import List, Dict, Tuple, Any, Iterator, Sequence, Optional
+from pathlib import Path
 
-import matplotlib.pyplot as plt
+import copy
+import time
+
+from matplotlib.axes import Axes
 
 from plotting_vdm.scan_results import ScanResults
+from plotting_vdm import profiling
+from plotting_vdm.plotter.worker import PlotJob, render_in_pool
+from plotting_vdm.plotter.manifest import ManifestEntry, render_job, up_to_date, record_job
+from plotting_vdm.plotter.utils import plot_axes
 
 
 class Plotter(ABC):
-    @abstractmethod
+    """
+    Base class of the scan plotters.
+
+    A plotter renders either its `plot_strategy`, one figure per job, or every strategy of
+    `plot_strategies` in a single pass: each job is then a (fit, correction) pair, whose
+    slices are extracted and aligned once and handed to all the strategies.
+
+    Examples
+    --------
+    >>> plotter = NormalPlotter(config, plot_strategies=[CapSigmaXNormalPlotStrategy(), PeakXNormalPlotStrategy()])
+    >>> plotter.plot_many(results)
+    """
+
+    def jobs(self, result: ScanResults) -> List[PlotJob]:
+        """Lists the figures the plotter renders for a scan, one per fit and correction by default.
+        With several strategies, lists the passes over the scan, one per fit and correction."""
+        return [PlotJob(fit, correction) for fit, correction in product(result.fits, result.corrections)]
+
+    def set_strategies(self, plot_strategies: Sequence[Any]):
+        """Sets the strategies rendered together, checking each like `set_strategy`."""
+        plot_strategy = self.plot_strategy
+        for strategy in plot_strategies:
+            self.set_strategy(strategy)
+
+        self.plot_strategy = plot_strategy
+        self.plot_strategies = list(plot_strategies)
+
+    def for_strategy(self, plot_strategy: Any) -> Plotter:
+        """Returns a copy of the plotter rendering a single strategy."""
+        plotter = copy.copy(self)
+        plotter.plot_strategy = plot_strategy
+        plotter.plot_strategies = []
+        return plotter
+
+    def plot_job(self, result: ScanResults, job: PlotJob):
+        ax = self._axes()
+        for i, detector, data in self._job_data(result, job):
+            with self._stage("draw", scan=result.id_str, fit=job.fit, detector=detector, correction=job.correction):
+                self._draw(result, job, detector, data, label=self._label(detector), color=self.config.colors[i], ax=ax)
+
+        self._post_plot(result, job, ax)
+
+    def plot_pass(self, result: ScanResults, job: PlotJob) -> List[ManifestEntry]:
+        """Renders the figures of every strategy for one fit and correction of a scan.
+
+        The slices of the pass are extracted, or aligned, once and drawn by every strategy.
+        The figures the manifest lists as up to date are skipped.
+
+        Arguments
+        ---------
+            result : ScanResults
+                The scan to plot.
+            job : PlotJob
+                The fit and correction of the pass.
+
+        Returns
+        -------
+            List[ManifestEntry]
+                The entries of the figures rendered, if the configuration has a manifest.
+        """
+        figures: Dict[Tuple[int, PlotJob], float] = {}
+        plotters = [self.for_strategy(strategy) for strategy in self.plot_strategies]
+        for k, plotter in enumerate(plotters):
+            for figure in plotter.jobs(result):
+                if figure[:2] == job[:2] and not up_to_date(plotter, result, figure):
+                    figures[(k, figure)] = 0.0
+
+        if not figures:
+            return []
+
+        # Figures of every detector stay open during the pass, per-detector figures are done with each detector
+        axes = {k: plotters[k]._axes(k) for k, figure in figures if figure.detector is None}
+        for i, detector, data in self._job_data(result, job):
+            for k, figure in figures:
+                if figure.detector not in (None, detector):
+                    continue
+
+                start = time.perf_counter()
+                plotter = plotters[k]
+                ax = axes[k] if figure.detector is None else plotter._axes(k)
+                with plotter._stage("draw", scan=result.id_str, fit=job.fit, detector=detector, correction=job.correction):
+                    plotter._draw(result, job, detector, data, label=self._label(detector), color=self.config.colors[i], ax=ax)
+
+                if figure.detector is not None:
+                    plotter._post_plot(result, figure, ax)
+                figures[(k, figure)] += time.perf_counter() - start
+
+        for k, ax in axes.items():
+            start = time.perf_counter()
+            plotters[k]._post_plot(result, job, ax)
+            figures[(k, job)] += time.perf_counter() - start
+
+        return [
+            entry
+            for (k, figure), render_time in figures.items()
+            for entry in record_job(plotters[k], result, figure, render_time)
+        ]
+
+    def render(self, result: ScanResults, job: PlotJob) -> List[ManifestEntry]:
+        """Renders one job, or one pass when the plotter has several strategies."""
+        if self.plot_strategies:
+            return self.plot_pass(result, job)
+
+        return render_job(self, result, job)
+
+    def job_inputs(self, result: ScanResults, job: PlotJob) -> List[Tuple[str, ...]]:
+        """Lists the data a job reads, as ("slice", scan, fit, detector, correction)
+        or ("align", scan, fit, detector, correction, ref_detector, ref_correction) keys."""
+        detectors = result.detectors if job.detector is None else [job.detector]
+        return [("slice", result.id_str, job.fit, detector, job.correction) for detector in detectors]
+
+    def job_output(self, result: ScanResults, job: PlotJob) -> Path:
+        """Returns the path of the plot a job writes."""
+        return self.plot_strategy.output_path(
+            self.config.output_dir/result.id_str,
+            f"{job.fit}_{job.correction}",
+            suffix=self.config.file_suffix,
+            file_ext=self.config.file_ext,
+            detector=job.detector,
+        )
+
+    def job_outputs(self, result: ScanResults, job: PlotJob) -> List[Path]:
+        """Returns the paths of every file a job writes, its plot first."""
+        return [self.job_output(result, job)]
+
     def plot(self, result: ScanResults):
-        pass
+        if self.plot_strategy is None and not self.plot_strategies:
+            raise ValueError("Plot strategy not set")
+
+        for job in self.jobs(result):
+            self.render(result, job)
+
+        if self.config.manifest is not None:
+            self.config.manifest.save()
+
+    def plot_many(self, results: Sequence[ScanResults], max_workers: Optional[int] = None):
+        """Plots every scan.
+
+        Arguments
+        ---------
+            results : Sequence[ScanResults]
+                The scans to plot.
+            max_workers : Optional[int]
+                If None, the scans are plotted one after another in this process. Otherwise, their
+                jobs are rendered by this many Agg worker processes with the rcParams of this process.
+                The files written are the same either way.
+        """
+        if max_workers is None:
+            for result in results:
+                self(result)
+            return
+
+        if self.plot_strategy is None and not self.plot_strategies:
+            raise ValueError("Plot strategy not set")
 
-    def plot_many(self, results: Sequence[ScanResults]):
-        for result in results:
-            self(result)
+        render_in_pool(self, [(result, self.jobs(result)) for result in results], max_workers)
 
     def __call__(self, result: ScanResults):
-        plt.figure()
-        self.plot(result)
-        plt.close()
+        with self._stage("plot", scan=result.id_str):
+            self.plot(result)
+
+    @abstractmethod
+    def _job_data(self, result: ScanResults, job: PlotJob) -> Iterator[Tuple[int, str, Tuple[Any, ...]]]:
+        """Yields the index, name and do_plot data of every detector drawn by a job."""
+        pass
+
+    @abstractmethod
+    def _post_plot(self, result: ScanResults, job: PlotJob, ax: Axes):
+        pass
+
+    def _draw(self,
+              result: ScanResults,
+              job: PlotJob,
+              detector: str,
+              data: Tuple[Any, ...],
+              *,
+              label: str,
+              color: str,
+              ax: Axes):
+        self.plot_strategy.do_plot(*data, label=label, color=color, ax=ax)
+
+    def _label(self, detector: str) -> str:
+        return detector
+
+    def _axes(self, slot: int = 0) -> Axes:
+        # Strategies style the Axes differently, a reused Axes is only shared by plots of one strategy
+        return plot_axes((type(self), type(self.plot_strategy), slot), reuse=self.config.reuse_figure)
+
+    def _stage(self, name: str, **tags):
+        strategies = self.plot_strategies or [self.plot_strategy]
+        return profiling.stage(name, strategy="+".join(type(strategy).__name__ for strategy in strategies), **tags)
@@ -0,0 +1,19 @@
+from .plotter import ComparisonPlotter
+from .strategy import (
+    ComparisonPlotStrategy,
+    CapSigmaXComparisonPlotStrategy,
+    CapSigmaYComparisonPlotStrategy,
+    PeakXComparisonPlotStrategy,
+    PeakYComparisonPlotStrategy,
+    SigVisComparisonPlotStrategy
+)
+
+__all__ = [
+    "ComparisonPlotter",
+    "ComparisonPlotStrategy",
+    "CapSigmaXComparisonPlotStrategy",
+    "CapSigmaYComparisonPlotStrategy",
+    "PeakXComparisonPlotStrategy",
+    "PeakYComparisonPlotStrategy",
+    "SigVisComparisonPlotStrategy"
+]
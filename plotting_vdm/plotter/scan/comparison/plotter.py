@@ -0,0 +1,108 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple, Any, Iterator, Optional
+from pathlib import Path
+
+from matplotlib.axes import Axes
+
+from plotting_vdm.plotter.scan.base import Plotter
+from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.worker import PlotJob
+from plotting_vdm.scan_results import ScanResults
+from .strategy import ComparisonPlotStrategy
+
+
+@dataclass
+class ComparisonPlotter(Plotter):
+    """
+    Compares every pair of detectors of a scan: one grid per fit and correction, with a cell
+    per (detector, reference) pair, and a CSV table of the statistics of every pair.
+
+    The ratios of all the pairs are computed at once by ScanResults.get_comparison_matrix,
+    instead of running a RatioPlotter per reference detector.
+
+    Parameters
+    ----------
+    config : PlotterCongig
+        The configuration of the plotter.
+    plot_strategy : Optional[ComparisonPlotStrategy]
+        The strategy to plot.
+    plot_strategies : List[ComparisonPlotStrategy]
+        The strategies to plot in a single pass.
+    write_table : bool
+        If True, the statistics of every grid are written next to it as CSV.
+        The table is an output of the job of the grid, so the manifest lists it with the plot.
+
+    Examples
+    --------
+    >>> plotter = ComparisonPlotter(config, plot_strategies=[CapSigmaXComparisonPlotStrategy(), SigVisComparisonPlotStrategy()])
+    >>> plotter.plot_many(results)
+    """
+    config: PlotterCongig
+    plot_strategy: Optional[ComparisonPlotStrategy] = None
+    plot_strategies: List[ComparisonPlotStrategy] = field(default_factory=list)
+    write_table: bool = True
+
+    def set_strategy(self, plot_strategy: ComparisonPlotStrategy):
+        if not isinstance(plot_strategy, ComparisonPlotStrategy):
+            raise TypeError(f"Expected ComparisonPlotStrategy, got {type(plot_strategy)}")
+
+        self.plot_strategy = plot_strategy
+
+    def job_outputs(self, result: ScanResults, job: PlotJob) -> List[Path]:
+        """Returns the paths of the grid a job writes and, if write_table, of its table."""
+        outputs = [self.job_output(result, job)]
+        if self.write_table:
+            outputs.append(self.plot_strategy.output_path(
+                self.config.output_dir/result.id_str,
+                f"{job.fit}_{job.correction}",
+                suffix=self.config.file_suffix,
+                file_ext="csv",
+            ))
+
+        return outputs
+
+    def _job_data(self, result: ScanResults, job: PlotJob) -> Iterator[Tuple[int, str, Tuple[Any, ...]]]:
+        for i, detector in enumerate(result.detectors):
+            yield i, detector, ()
+
+    def _draw(self,
+              result: ScanResults,
+              job: PlotJob,
+              detector: str,
+              data: Tuple[Any, ...],
+              *,
+              label: str,
+              color: str,
+              ax: Axes):
+        comparison = result.get_comparison_matrix(
+            job.fit, job.correction, self.plot_strategy.quantity, self.plot_strategy.quantity_err
+        )
+        self.plot_strategy.do_plot(comparison, detector, label=label, ax=ax)
+
+    def _post_plot(self, result: ScanResults, job: PlotJob, ax: Axes):
+        fit, correction = job.fit, job.correction
+
+        with self._stage("style", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.style_plot(
+                scan_name=result.name, fit=fit, correction=correction, detectors=result.detectors, ax=ax
+            )
+
+        with self._stage("save", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.save_plot(
+                self.config.output_dir/result.id_str,
+                f"{fit}_{correction}",
+                suffix=self.config.file_suffix,
+                file_ext=self.config.file_ext,
+                ax=ax
+            )
+
+            if self.write_table:
+                comparison = result.get_comparison_matrix(
+                    fit, correction, self.plot_strategy.quantity, self.plot_strategy.quantity_err
+                )
+                self.plot_strategy.save_table(
+                    comparison,
+                    self.config.output_dir/result.id_str,
+                    f"{fit}_{correction}",
+                    suffix=self.config.file_suffix,
+                )
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from pathlib import Path
+
+import numpy as np
+from matplotlib.axes import Axes
+
+from plotting_vdm.ratios import ComparisonMatrix
+from plotting_vdm.plotter.utils import TitleBuilder, resolve_axes
+
+
+@dataclass
+class ComparisonPlotStrategy:
+    latex: str
+    quantity: str
+    quantity_err: str
+    output_folder_name: str
+
+    axis_text: str = ""
+    file_name_prepend: str = ""
+    statistic: str = "weighted_mean"
+    cmap: str = "RdBu_r"
+    limit: Optional[float] = None
+
+    def do_plot(self,
+                comparison: ComparisonMatrix,
+                detector: str,
+                *,
+                label: str = "",
+                color: str = "k",
+                ax: Optional[Axes] = None):
+        """Draws the row of a detector in the grid: one cell per reference, colored by the
+        statistic of the strategy and annotated with it and the spread of the ratios.
+
+        The color scale spans ±limit percent, or the largest statistic of the grid if limit is None.
+        """
+        ax = resolve_axes(ax)
+
+        i = comparison.detectors.index(detector)
+        values = comparison.statistic(self.statistic)
+        spread = comparison.statistic("std")
+
+        off_diagonal = values[~np.eye(len(values), dtype=bool)]
+        limit = self.limit
+        if limit is None:
+            finite = np.abs(off_diagonal[np.isfinite(off_diagonal)])
+            limit = finite.max() if finite.size and finite.max() > 0 else 1.0
+
+        row = values[i].astype(float)
+        row[i] = np.nan
+        ax.pcolormesh(
+            np.arange(len(row) + 1) - 0.5, [i - 0.5, i + 0.5], np.ma.masked_invalid(row[None, :]),
+            cmap=self.cmap, vmin=-limit, vmax=limit
+        )
+
+        for j, value in enumerate(row):
+            if j == i:
+                text = detector
+            elif np.isnan(value):
+                text = "n/a"
+            else:
+                text = f"{value:.2f}\n±{spread[i, j]:.2f}"
+
+            ax.text(j, i, text, ha="center", va="center", fontsize="small", color=color)
+
+    def style_plot(self,
+                   *,
+                   scan_name: str = "",
+                   fit: str = "",
+                   correction: str = "",
+                   detectors: Optional[List[str]] = None,
+                   ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
+        detectors = detectors or []
+        title = TitleBuilder()\
+                .set_scan_name(scan_name)\
+                .set_fit(fit)\
+                .set_correction(correction)\
+                .set_axis(self.axis_text)\
+                .set_info(f"{self.latex} Ratio")\
+                .build()
+
+        ax.set_title(title)
+        ax.set_xticks(range(len(detectors)))
+        ax.set_xticklabels(detectors)
+        ax.set_yticks(range(len(detectors)))
+        ax.set_yticklabels(detectors)
+        ax.set_xlim(-0.5, len(detectors) - 0.5)
+        ax.set_ylim(len(detectors) - 0.5, -0.5)
+        ax.set_xlabel("Reference")
+        ax.set_ylabel(f"Detector, {self.statistic.replace('_', ' ')} ratio [%]")
+
+    def save_plot(self,
+                  ouput_dir: Path,
+                  file_name: str,
+                  *,
+                  suffix: str = "",
+                  file_ext: str = "png",
+                  ax: Optional[Axes] = None):
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext=file_ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        resolve_axes(ax).figure.savefig(path)
+
+    def save_table(self,
+                   comparison: ComparisonMatrix,
+                   ouput_dir: Path,
+                   file_name: str,
+                   *,
+                   suffix: str = ""):
+        """Writes the statistics of every pair of detectors next to the plot, as CSV."""
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext="csv")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        comparison.summary().to_csv(path, index=False)
+
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        """Returns the path save_plot writes a plot to.
+
+        Arguments
+        ---------
+            ouput_dir : pathlib.Path
+                The output directory of the plotter.
+            file_name : str
+                The name of the plot, without prefix, suffix and extension.
+            suffix : str
+                Appended to the name of the plot.
+            file_ext : str
+                The extension of the file.
+            detector : Optional[str]
+                Not used, the plots of this strategy are not per detector.
+
+        Returns
+        -------
+            pathlib.Path
+                The path of the plot.
+        """
+        path = ouput_dir/"comparison"/self.output_folder_name
+
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
+
+
+@dataclass
+class CapSigmaXComparisonPlotStrategy(ComparisonPlotStrategy):
+    latex: str = r"$\Sigma_X$"
+    quantity: str = "CapSigma_X"
+    quantity_err: str = "CapSigmaErr_X"
+    output_folder_name: str = "capsigma"
+
+    axis_text: str = "X Scan"
+    file_name_prepend: str = "X_"
+
+
+@dataclass
+class CapSigmaYComparisonPlotStrategy(ComparisonPlotStrategy):
+    latex: str = r"$\Sigma_Y$"
+    quantity: str = "CapSigma_Y"
+    quantity_err: str = "CapSigmaErr_Y"
+    output_folder_name: str = "capsigma"
+
+    axis_text: str = "Y Scan"
+    file_name_prepend: str = "Y_"
+
+
+@dataclass
+class PeakXComparisonPlotStrategy(ComparisonPlotStrategy):
+    latex: str = r"$\mathrm{Peak}_X$"
+    quantity: str = "peak_X"
+    quantity_err: str = "peakErr_X"
+    output_folder_name: str = "peak"
+
+    axis_text: str = "X Scan"
+    file_name_prepend: str = "X_"
+
+
+@dataclass
+class PeakYComparisonPlotStrategy(ComparisonPlotStrategy):
+    latex: str = r"$\mathrm{Peak}_Y$"
+    quantity: str = "peak_Y"
+    quantity_err: str = "peakErr_Y"
+    output_folder_name: str = "peak"
+
+    axis_text: str = "Y Scan"
+    file_name_prepend: str = "Y_"
+
+
+@dataclass
+class SigVisComparisonPlotStrategy(ComparisonPlotStrategy):
+    latex: str = r"$\sigma_{\mathrm{vis}}$"
+    quantity: str = "xsec"
+    quantity_err: str = "xsecErr"
+    output_folder_name: str = "sigvis"
@@ -5,7 +5,11 @@ from .strategy import (
     CapSigmaYCorrPlotStrategy,
     PeakXCorrPlotStrategy,
     PeakYCorrPlotStrategy,
-    SigVisCorrPlotStrategy
+    SigVisCorrPlotStrategy,
+    CorrWaterfallPlotStrategy,
+    CapSigmaXCorrWaterfallPlotStrategy,
+    CapSigmaYCorrWaterfallPlotStrategy,
+    SigVisCorrWaterfallPlotStrategy
 )
 
 __all__ = [
@@ -15,5 +19,9 @@ __all__ = [
     "CapSigmaYCorrPlotStrategy",
     "PeakXCorrPlotStrategy",
     "PeakYCorrPlotStrategy",
-    "SigVisCorrPlotStrategy"
-]
\ No newline at end of file
+    "SigVisCorrPlotStrategy",
+    "CorrWaterfallPlotStrategy",
+    "CapSigmaXCorrWaterfallPlotStrategy",
+    "CapSigmaYCorrWaterfallPlotStrategy",
+    "SigVisCorrWaterfallPlotStrategy"
+]
@@ -1,13 +1,13 @@
-from itertools import product
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Tuple, Any, Iterator, Optional
 
-import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
 from plotting_vdm.plotter.scan.base import Plotter
 from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.worker import PlotJob
 from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.correction_chain import CorrectionChain
 from .strategy import CorrPlotStrategy
 
 
@@ -16,6 +16,7 @@ class CorrPlotter(Plotter):
     base_reference: str
     config: PlotterCongig
     plot_strategy: Optional[CorrPlotStrategy] = None
+    plot_strategies: List[CorrPlotStrategy] = field(default_factory=list)
 
     def set_strategy(self, plot_strategy: CorrPlotStrategy):
         if not isinstance(plot_strategy, CorrPlotStrategy):
@@ -23,65 +24,66 @@ class CorrPlotter(Plotter):
 
         self.plot_strategy = plot_strategy
 
-    def plot(self, result: ScanResults):
-        if self.plot_strategy is None:
-            raise ValueError("Plot strategy not set")
-
-        # NOTE: If corrections are not equal across every fit-detector pair, will this cause a bug?
-        applied_corrections = result.corrections
-
-        for fit, correction in product(result.fits, result.corrections):
-            if correction == "noCorr":
-                continue
-
-            plt.clf()
-
-            ref_correction = self.get_reference_correction(correction, applied_corrections)
-            for i, detector in enumerate(result.detectors):
-                data = result.results[fit].query(
-                    f"detector == '{detector}' and correction == '{correction}'")
-                ref = result.results[fit].query(
-                    f"detector == '{detector}' and correction == '{ref_correction}'")
-
-                if not ref["BCID"].equals(data["BCID"]):
-                    bcid_filter = np.intersect1d(ref["BCID"], data["BCID"])
-
-                    data = data[data["BCID"].isin(bcid_filter)].reset_index(drop=True)
-                    ref = ref[ref["BCID"].isin(bcid_filter)].reset_index(drop=True)
-
-                self.plot_strategy.do_plot(data, ref, label=detector, color=self.config.colors[i])
-
-            self._post_plot(result, fit, correction, ref_correction)
-
-    def get_reference_correction(self, correction: str, applied_corrections: list) -> str:
-        base_ref_corr = self.base_reference
-        keep_looking = True
-        tmp_corr = correction
-        while keep_looking:
-            if len(tmp_corr.split("_")) != 1:
-                ref_corr = tmp_corr.replace("_" + tmp_corr.split("_")[-1], "")
-            else:
-                ref_corr = base_ref_corr
-            if ref_corr in applied_corrections:
-                keep_looking = False
-            else:
-                tmp_corr = ref_corr
-            if (ref_corr == base_ref_corr) and (base_ref_corr not in applied_corrections):
-                raise ValueError(f"""{base_ref_corr} is not in correction dictionary.
-                                 Impossible to make correction effect plot
-                                Please add {base_ref_corr} to correction dictionary""")
-
-        return ref_corr
-
-    def _post_plot(self, result: ScanResults, fit: str, correction: str, ref_correction: str):
-        self.plot_strategy.style_plot(
-            scan_name=result.name, fit=fit,
-            correction=correction, difference=ref_correction.split("_")[-1]
+    def jobs(self, result: ScanResults) -> List[PlotJob]:
+        jobs = [job for job in super().jobs(result) if job.correction != "noCorr"]
+        if self.plot_strategy is None or not self.plot_strategy.cumulative:
+            return jobs
+
+        # The base correction has no step to break down
+        chain = result.get_correction_chain(self.base_reference)
+        return [job for job in jobs if len(chain.lineage(job.correction)) > 1]
+
+    def _job_data(self, result: ScanResults, job: PlotJob) -> Iterator[Tuple[int, str, Tuple[Any, ...]]]:
+        for i, detector in enumerate(result.detectors):
+            yield i, detector, ()
+
+    def _draw(self,
+              result: ScanResults,
+              job: PlotJob,
+              detector: str,
+              data: Tuple[Any, ...],
+              *,
+              label: str,
+              color: str,
+              ax: Axes):
+        # The effects of every step of the chain are computed at once the first time they are requested
+        effects = result.get_correction_effects(
+            job.fit, self.plot_strategy.quantity, self.plot_strategy.quantity_err, self.base_reference
         )
+        self.plot_strategy.plot_effects(effects, detector, job.correction, label=label, color=color, ax=ax)
+
+    def job_inputs(self, result: ScanResults, job: PlotJob) -> List[Tuple[str, ...]]:
+        chain = result.get_correction_chain(self.base_reference)
+        if self.plot_strategy is not None and self.plot_strategy.cumulative:
+            return [
+                ("slice", result.id_str, job.fit, detector, correction)
+                for detector in result.detectors
+                for correction in chain.lineage(job.correction)
+            ]
+
+        return [
+            ("align", result.id_str, job.fit, detector, job.correction, detector, chain.parent(job.correction))
+            for detector in result.detectors
+        ]
 
-        self.plot_strategy.save_plot(
-            self.config.output_dir/result.id_str,
-            f"{fit}_{correction}",
-            suffix=self.config.file_suffix,
-            file_ext=self.config.file_ext
-        )
+    def get_reference_correction(self, correction: str, applied_corrections: list) -> str:
+        return CorrectionChain.build(applied_corrections, self.base_reference).parent(correction)
+
+    def _post_plot(self, result: ScanResults, job: PlotJob, ax: Axes):
+        fit, correction = job.fit, job.correction
+        ref_correction = result.get_correction_chain(self.base_reference).parent(correction)
+
+        with self._stage("style", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.style_plot(
+                scan_name=result.name, fit=fit,
+                correction=correction, difference=ref_correction.split("_")[-1], ax=ax
+            )
+
+        with self._stage("save", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.save_plot(
+                self.config.output_dir/result.id_str,
+                f"{fit}_{correction}",
+                suffix=self.config.file_suffix,
+                file_ext=self.config.file_ext,
+                ax=ax
+            )
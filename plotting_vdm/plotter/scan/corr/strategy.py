@@ -1,11 +1,14 @@
 from dataclasses import dataclass
+from typing import List, Optional, ClassVar
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.ticker import AutoLocator, ScalarFormatter
 
-from plotting_vdm.plotter.utils import TitleBuilder
+from plotting_vdm.correction_chain import CorrectionEffects
+from plotting_vdm.plotter.utils import TitleBuilder, resolve_axes
 
 
 @dataclass
@@ -18,16 +21,52 @@ class CorrPlotStrategy:
     axis_text: str = ""
     file_name_prepend: str = ""
 
-    def do_plot(self, data: pd.DataFrame, ref: pd.DataFrame, *, label: str, color: str = "k"):
+    # Whether the plot shows the whole lineage of a correction rather than its last step
+    cumulative: ClassVar[bool] = False
+
+    def do_plot(self,
+                data: pd.DataFrame,
+                ref: pd.DataFrame,
+                *,
+                label: str,
+                color: str = "k",
+                ax: Optional[Axes] = None):
         ratio = (data[self.quantity] / ref[self.quantity] - 1) * 100
         ratio_err = np.abs(ratio) * np.sqrt(
             (data[self.quantity_err] / data[self.quantity])**2 +
             (ref[self.quantity_err] / ref[self.quantity])**2
         )
 
-        plt.errorbar(x=data["BCID"], y=ratio, yerr=ratio_err, fmt="o", label=label, color=color)
+        self.plot_effect(data["BCID"], ratio, ratio_err, label=label, color=color, ax=ax)
+
+    def plot_effects(self,
+                     effects: CorrectionEffects,
+                     detector: str,
+                     correction: str,
+                     *,
+                     label: str,
+                     color: str = "k",
+                     ax: Optional[Axes] = None):
+        """Plots the effect of a correction on a detector from the effects of every correction step."""
+        self.plot_effect(*effects.detector(detector, correction), label=label, color=color, ax=ax)
 
-    def style_plot(self, *, scan_name: str = "", fit: str = "", correction: str = "", difference: str = ""):
+    def plot_effect(self,
+                    bcids: np.ndarray,
+                    effect: np.ndarray,
+                    effect_err: np.ndarray,
+                    *,
+                    label: str,
+                    color: str = "k",
+                    ax: Optional[Axes] = None):
+        resolve_axes(ax).errorbar(x=bcids, y=effect, yerr=effect_err, fmt="o", label=label, color=color)
+
+    def style_plot(self,
+                   *,
+                   scan_name: str = "",
+                   fit: str = "",
+                   correction: str = "", difference: str = "",
+                   ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
         title = TitleBuilder()\
                 .set_scan_name(scan_name)\
                 .set_fit(fit)\
@@ -35,20 +74,55 @@ class CorrPlotStrategy:
                 .set_axis(self.axis_text)\
                 .set_info(f"Effect of {difference} on {self.latex}")\
                 .build()
-        plt.title(title)
-        plt.xlabel("BCID")
-        plt.ylabel(f"Effect of {difference} on {self.latex}")
+        ax.set_title(title)
+        ax.set_xlabel("BCID")
+        ax.set_ylabel(f"Effect of {difference} on {self.latex}")
 
-        plt.grid()
-        plt.legend(loc="best")
+        ax.grid(True)
+        ax.legend(loc="best")
 
-    def save_plot(self, ouput_dir: Path, file_name: str, *, suffix: str = "", file_ext: str = "png"):
-        path = ouput_dir/"corr"/self.output_folder_name
-        path.mkdir(parents=True, exist_ok=True)
+    def save_plot(self,
+                  ouput_dir: Path,
+                  file_name: str,
+                  *,
+                  suffix: str = "",
+                  file_ext: str = "png",
+                  ax: Optional[Axes] = None):
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext=file_ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_name = f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
+        resolve_axes(ax).figure.savefig(path)
 
-        plt.savefig(path/file_name)
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        """Returns the path save_plot writes a plot to.
+
+        Arguments
+        ---------
+            ouput_dir : pathlib.Path
+                The output directory of the plotter.
+            file_name : str
+                The name of the plot, without prefix, suffix and extension.
+            suffix : str
+                Appended to the name of the plot.
+            file_ext : str
+                The extension of the file.
+            detector : Optional[str]
+                Not used, the plots of this strategy are not per detector.
+
+        Returns
+        -------
+            pathlib.Path
+                The path of the plot.
+        """
+        path = ouput_dir/"corr"/self.output_folder_name
+
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
 
 
 @dataclass
@@ -97,3 +171,105 @@ class SigVisCorrPlotStrategy(CorrPlotStrategy):
     quantity: str = "xsec"
     quantity_err: str = "xsecErr"
     output_folder_name: str = "sigvis"
+
+
+@dataclass
+class CorrWaterfallPlotStrategy(CorrPlotStrategy):
+    """
+    Breaks the effect of a correction on a quantity down into the steps of its lineage, from
+    the base correction up. Each step is a bar from the mean cumulative effect of its parent to
+    its own, with one bar per detector, and the last bar is the total effect.
+    """
+    cumulative: ClassVar[bool] = True
+
+    def __post_init__(self):
+        self.steps: List[str] = []
+
+    def plot_effects(self,
+                     effects: CorrectionEffects,
+                     detector: str,
+                     correction: str,
+                     *,
+                     label: str,
+                     color: str = "k",
+                     ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
+        waterfall = effects.waterfall(detector, correction)
+        self.steps = [step.split("_")[-1] for step in waterfall["correction"]]
+
+        width = 0.8 / len(effects.detectors)
+        offset = (effects.detectors.index(detector) - (len(effects.detectors) - 1) / 2) * width
+        x = np.arange(len(waterfall)) + offset
+
+        total = waterfall["cumulative"].iloc[-1] if len(waterfall) else 0.0
+        ax.bar(x, waterfall["contribution"], bottom=waterfall["cumulative"] - waterfall["contribution"],
+               width=width, label=label, color=color)
+        ax.bar(len(waterfall) + offset, total, width=width, color=color, hatch="//", alpha=0.5)
+
+    def style_plot(self,
+                   *,
+                   scan_name: str = "",
+                   fit: str = "",
+                   correction: str = "", difference: str = "",
+                   ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
+        title = TitleBuilder()\
+                .set_scan_name(scan_name)\
+                .set_fit(fit)\
+                .set_correction(correction)\
+                .set_axis(self.axis_text)\
+                .set_info(f"Corrections on {self.latex}")\
+                .build()
+        ax.set_title(title)
+
+        # Everything set below is reset first, a reused Axes keeps the ticks, labels and grid of the previous plot
+        ax.xaxis.set_major_locator(AutoLocator())
+        ax.xaxis.set_major_formatter(ScalarFormatter())
+        ax.set_xticks(range(len(self.steps) + 1))
+        ax.set_xticklabels(self.steps + ["Total"])
+        ax.set_xlabel("")
+        ax.set_ylabel(f"Cumulative effect on {self.latex} [%]")
+        ax.axhline(0, color="k", linewidth=0.5)
+
+        ax.grid(False)
+        ax.grid(True, axis="y")
+        ax.legend(loc="best")
+
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        path = ouput_dir/"corr"/"waterfall"/self.output_folder_name
+
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
+
+
+@dataclass
+class CapSigmaXCorrWaterfallPlotStrategy(CorrWaterfallPlotStrategy):
+    latex: str = r"$\Sigma_X$"
+    quantity: str = "CapSigma_X"
+    quantity_err: str = "CapSigmaErr_X"
+    output_folder_name: str = "capsigma"
+
+    axis_text: str = "X Scan"
+    file_name_prepend: str = "X_"
+
+@dataclass
+class CapSigmaYCorrWaterfallPlotStrategy(CorrWaterfallPlotStrategy):
+    latex: str = r"$\Sigma_Y$"
+    quantity: str = "CapSigma_Y"
+    quantity_err: str = "CapSigmaErr_Y"
+    output_folder_name: str = "capsigma"
+
+    axis_text: str = "Y Scan"
+    file_name_prepend: str = "Y_"
+
+@dataclass
+class SigVisCorrWaterfallPlotStrategy(CorrWaterfallPlotStrategy):
+    latex: str = r"$\sigma_{vis}$"
+    quantity: str = "xsec"
+    quantity_err: str = "xsecErr"
+    output_folder_name: str = "sigvis"
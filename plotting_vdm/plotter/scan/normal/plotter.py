@@ -1,11 +1,12 @@
 from itertools import product
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Tuple, Any, Iterator, Optional
 
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
 from plotting_vdm.plotter.scan.base import Plotter
 from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.worker import PlotJob
 from plotting_vdm.scan_results import ScanResults
 from .strategy import NormalPlotStrategy
 
@@ -14,6 +15,7 @@ from .strategy import NormalPlotStrategy
 class NormalPlotter(Plotter):
     config: PlotterCongig
     plot_strategy: Optional[NormalPlotStrategy] = None
+    plot_strategies: List[NormalPlotStrategy] = field(default_factory=list)
 
     def set_strategy(self, plot_strategy: NormalPlotStrategy):
         if not isinstance(plot_strategy, NormalPlotStrategy):
@@ -21,43 +23,35 @@ class NormalPlotter(Plotter):
 
         self.plot_strategy = plot_strategy
 
-    def plot(self, result: ScanResults):
-        if self.plot_strategy is None:
-            raise ValueError("Plot strategy not set")
+    def jobs(self, result: ScanResults) -> List[PlotJob]:
+        if self.plot_strategies or not self.plot_strategy.plot_per_detector:
+            return super().jobs(result)
 
-        for fit, correction in product(result.fits, result.corrections):
-            if self.plot_strategy.plot_per_detector:
-                self._plot_per_detector(result, fit, correction)
-            else:
-                self._not_plot_per_detector(result, fit, correction)
+        return [
+            PlotJob(fit, correction, detector)
+            for fit, correction, detector in product(result.fits, result.corrections, result.detectors)
+        ]
 
-    def _plot_per_detector(self, result: ScanResults, fit: str, correction: str):
+    def _job_data(self, result: ScanResults, job: PlotJob) -> Iterator[Tuple[int, str, Tuple[Any, ...]]]:
         for i, detector in enumerate(result.detectors):
-            plt.clf()
-
-            data = result.results[fit].query(
-                f"detector == '{detector}' and correction == '{correction}'")
-            self.plot_strategy.do_plot(data, label=detector, color=self.config.colors[i])
-
-            self._post_plot(result, fit, correction)
-
-    def _not_plot_per_detector(self, result: ScanResults, fit: str, correction: str):
-        plt.clf()
-        for i, detector in enumerate(result.detectors):
-            data = result.results[fit].query(
-                f"detector == '{detector}' and correction == '{correction}'")
-            self.plot_strategy.do_plot(data, label=detector, color=self.config.colors[i])
-
-        self._post_plot(result, fit, correction)
-
-    def _post_plot(self, result: ScanResults, fit: str, correction: str):
-        self.plot_strategy.style_plot(
-            scan_name=result.name, fit=fit, correction=correction
-        )
-
-        self.plot_strategy.save_plot(
-            self.config.output_dir/result.id_str,
-            f"{fit}_{correction}",
-            suffix=self.config.file_suffix,
-            file_ext=self.config.file_ext
-        )
+            if job.detector is not None and detector != job.detector:
+                continue
+
+            yield i, detector, (result.get_slice(job.fit, detector, job.correction),)
+
+    def _post_plot(self, result: ScanResults, job: PlotJob, ax: Axes):
+        fit, correction = job.fit, job.correction
+
+        with self._stage("style", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.style_plot(
+                scan_name=result.name, fit=fit, correction=correction, ax=ax
+            )
+
+        with self._stage("save", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.save_plot(
+                self.config.output_dir/result.id_str,
+                f"{fit}_{correction}",
+                suffix=self.config.file_suffix,
+                file_ext=self.config.file_ext,
+                ax=ax
+            )
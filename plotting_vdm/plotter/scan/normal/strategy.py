@@ -1,11 +1,12 @@
 from __future__ import annotations
+from typing import Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
-from plotting_vdm.plotter.utils import TitleBuilder
+from plotting_vdm.plotter.utils import TitleBuilder, resolve_axes
 
 
 def _set_current_detector(method):
@@ -28,6 +29,7 @@ class NormalPlotStrategy:
     quantity_err: str = ""
     axis_text: str = ""
     file_name_prepend: str = ""
+    extra_columns: Tuple[str, ...] = ()
 
     def __post_init__(self):
         self.current_detector = ""
@@ -37,16 +39,18 @@ class NormalPlotStrategy:
         return self.plot_per_detector
 
     @_set_current_detector
-    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k"):
+    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k", ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
         yaxis = data[self.quantity]
         yerr = data[self.quantity_err]
 
         if self.quantity_err:
-            plt.errorbar(data["BCID"], yaxis, yerr=yerr, fmt="o", label=label, color=color)
+            ax.errorbar(data["BCID"], yaxis, yerr=yerr, fmt="o", label=label, color=color)
         else:
-            plt.plot(data["BCID"], yaxis, "o", label=label, color=color)
+            ax.plot(data["BCID"], yaxis, "o", label=label, color=color)
 
-    def style_plot(self, *, scan_name: str = "", fit: str = "", correction: str = ""):
+    def style_plot(self, *, scan_name: str = "", fit: str = "", correction: str = "", ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
         title = TitleBuilder()\
                 .set_scan_name(scan_name)\
                 .set_fit(fit)\
@@ -55,20 +59,55 @@ class NormalPlotStrategy:
                 .set_info(self.latex)\
                 .build()
 
-        plt.title(title)
-        plt.xlabel("BCID")
-        plt.ylabel(self.latex)
-
-        plt.grid()
-        plt.legend(loc="best")
-
-    def save_plot(self, ouput_dir: Path, file_name: str, *, suffix: str = "", file_ext: str = "png"):
-        path = ouput_dir/"normal"/self.output_folder_name/self.current_detector
-        path.mkdir(parents=True, exist_ok=True)
-
-        file_name = f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
-
-        plt.savefig(path/file_name)
+        ax.set_title(title)
+        ax.set_xlabel("BCID")
+        ax.set_ylabel(self.latex)
+
+        ax.grid(True)
+        ax.legend(loc="best")
+
+    def save_plot(self,
+                  ouput_dir: Path,
+                  file_name: str,
+                  *,
+                  suffix: str = "",
+                  file_ext: str = "png",
+                  ax: Optional[Axes] = None):
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext=file_ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        resolve_axes(ax).figure.savefig(path)
+
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        """Returns the path save_plot writes a plot to.
+
+        Arguments
+        ---------
+            ouput_dir : pathlib.Path
+                The output directory of the plotter.
+            file_name : str
+                The name of the plot, without prefix, suffix and extension.
+            suffix : str
+                Appended to the name of the plot.
+            file_ext : str
+                The extension of the file.
+            detector : Optional[str]
+                The detector of a per-detector plot. If None, the detector of the last do_plot call is used.
+
+        Returns
+        -------
+            pathlib.Path
+                The path of the plot.
+        """
+        path = ouput_dir/"normal"/self.output_folder_name/(self.current_detector if detector is None else detector)
+
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
 
 
 @dataclass
@@ -146,10 +185,11 @@ class RChi2XNormalPlotStrategy(NormalPlotStrategy):
 
     axis_text: str = "X Scan"
     file_name_prepend: str = "X_"
+    extra_columns: Tuple[str, ...] = ("ndof_X",)
 
-    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k"):
+    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k", ax: Optional[Axes] = None):
         yaxis = data[self.quantity] / data["ndof_X"]
-        plt.plot(data["BCID"], yaxis, "o", label=label, color=color)
+        resolve_axes(ax).plot(data["BCID"], yaxis, "o", label=label, color=color)
 
 
 @dataclass
@@ -161,7 +201,8 @@ class RChi2YNormalPlotStrategy(NormalPlotStrategy):
 
     axis_text: str = "Y Scan"
     file_name_prepend: str = "Y_"
+    extra_columns: Tuple[str, ...] = ("ndof_Y",)
 
-    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k"):
+    def do_plot(self, data: pd.DataFrame, *, label: str, color: str = "k", ax: Optional[Axes] = None):
         yaxis = data[self.quantity] / data["ndof_Y"]
-        plt.plot(data["BCID"], yaxis, "o", label=label, color=color)
+        resolve_axes(ax).plot(data["BCID"], yaxis, "o", label=label, color=color)
@@ -1,12 +1,11 @@
-from itertools import product
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Tuple, Any, Iterator, Optional
 
-import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
 from plotting_vdm.plotter.scan.base import Plotter
 from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.worker import PlotJob
 from plotting_vdm.scan_results import ScanResults
 from .strategy import RatioPlotStrategy
 
@@ -16,6 +15,7 @@ class RatioPlotter(Plotter):
     reference_detector: str
     config: PlotterCongig
     plot_strategy: Optional[RatioPlotStrategy] = None
+    plot_strategies: List[RatioPlotStrategy] = field(default_factory=list)
 
     def set_strategy(self, plot_strategy: RatioPlotStrategy):
         if not isinstance(plot_strategy, RatioPlotStrategy):
@@ -23,44 +23,50 @@ class RatioPlotter(Plotter):
 
         self.plot_strategy = plot_strategy
 
-    def plot(self, result: ScanResults):
-        if self.plot_strategy is None:
-            raise ValueError("Plot strategy not set")
-
-        for fit, correction in product(result.fits, result.corrections):
-
-            plt.clf()
-
-            for i, detector in enumerate(result.detectors):
-                if detector == self.reference_detector:
-                    continue
-
-                data = result.results[fit].query(
-                    f"detector == '{detector}' and correction == '{correction}'")
-                ref  = result.results[fit].query(
-                    f"detector == '{self.reference_detector}' and correction == '{correction}'")
-
-                if not ref["BCID"].equals(data["BCID"]):
-                    bcid_filter = np.intersect1d(ref["BCID"], data["BCID"])
-
-                    data = data[data["BCID"].isin(bcid_filter)].reset_index(drop=True)
-                    ref = ref[ref["BCID"].isin(bcid_filter)].reset_index(drop=True)
-
-                self.plot_strategy.do_plot(data, ref,
-                    label=f"{detector}/{self.reference_detector}",
-                    color=self.config.colors[i]
-                )
-
-            self._post_plot(result, fit, correction)
-
-    def _post_plot(self, result: ScanResults, fit: str, correction: str):
-        self.plot_strategy.style_plot(
-            scan_name=result.name, fit=fit, correction=correction
-        )
-
-        self.plot_strategy.save_plot(
-            self.config.output_dir/result.id_str,
-            f"{fit}_{correction}",
-            suffix=self.config.file_suffix,
-            file_ext=self.config.file_ext
+    def job_inputs(self, result: ScanResults, job: PlotJob) -> List[Tuple[str, ...]]:
+        # The ratio table is built from the slice of every detector, the reference included, no alignment is made
+        return [("slice", result.id_str, job.fit, detector, job.correction) for detector in result.detectors]
+
+    def _job_data(self, result: ScanResults, job: PlotJob) -> Iterator[Tuple[int, str, Tuple[Any, ...]]]:
+        for i, detector in enumerate(result.detectors):
+            if detector == self.reference_detector:
+                continue
+
+            yield i, detector, ()
+
+    def _draw(self,
+              result: ScanResults,
+              job: PlotJob,
+              detector: str,
+              data: Tuple[Any, ...],
+              *,
+              label: str,
+              color: str,
+              ax: Axes):
+        # Every detector of the job is divided at once the first time the table is requested
+        table = result.get_ratio_table(
+            job.fit, job.correction,
+            self.plot_strategy.quantity, self.plot_strategy.quantity_err,
+            self.reference_detector
         )
+        self.plot_strategy.plot_ratio(*table.detector(detector), label=label, color=color, ax=ax)
+
+    def _label(self, detector: str) -> str:
+        return f"{detector}/{self.reference_detector}"
+
+    def _post_plot(self, result: ScanResults, job: PlotJob, ax: Axes):
+        fit, correction = job.fit, job.correction
+
+        with self._stage("style", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.style_plot(
+                scan_name=result.name, fit=fit, correction=correction, ax=ax
+            )
+
+        with self._stage("save", scan=result.id_str, fit=fit, correction=correction):
+            self.plot_strategy.save_plot(
+                self.config.output_dir/result.id_str,
+                f"{fit}_{correction}",
+                suffix=self.config.file_suffix,
+                file_ext=self.config.file_ext,
+                ax=ax
+            )
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
-from plotting_vdm.plotter.utils import TitleBuilder
+from plotting_vdm.plotter.utils import TitleBuilder, resolve_axes
 
 
 @dataclass
@@ -18,16 +19,39 @@ class RatioPlotStrategy:
     axis_text: str = ""
     file_name_prepend: str = ""
 
-    def do_plot(self, data: pd.DataFrame, ref: pd.DataFrame, *, label: str, color: str = "k"):
+    def do_plot(self,
+                data: pd.DataFrame,
+                ref: pd.DataFrame,
+                *,
+                label: str,
+                color: str = "k",
+                ax: Optional[Axes] = None):
         ratio = (data[self.quantity] / ref[self.quantity] - 1) * 100
         ratio_err = np.abs(ratio) * np.sqrt(
             (data[self.quantity_err] / data[self.quantity])**2 +
             (ref[self.quantity_err] / ref[self.quantity])**2
         )
 
-        plt.errorbar(x=data["BCID"], y=ratio, yerr=ratio_err, fmt="o", label=label, color=color)
-
-    def style_plot(self, *, scan_name: str = "", fit: str = "", correction: str = ""):
+        self.plot_ratio(data["BCID"], ratio, ratio_err, label=label, color=color, ax=ax)
+
+    def plot_ratio(self,
+                   bcids: np.ndarray,
+                   ratio: np.ndarray,
+                   ratio_err: np.ndarray,
+                   *,
+                   label: str,
+                   color: str = "k",
+                   ax: Optional[Axes] = None):
+        """Plots ratios already computed, for instance by a RatioTable."""
+        resolve_axes(ax).errorbar(x=bcids, y=ratio, yerr=ratio_err, fmt="o", label=label, color=color)
+
+    def style_plot(self,
+                   *,
+                   scan_name: str = "",
+                   fit: str = "",
+                   correction: str = "",
+                   ax: Optional[Axes] = None):
+        ax = resolve_axes(ax)
         title = TitleBuilder()\
                 .set_scan_name(scan_name)\
                 .set_fit(fit)\
@@ -36,20 +60,55 @@ class RatioPlotStrategy:
                 .set_info(f"{self.latex} Ratio")\
                 .build()
 
-        plt.title(title)
-        plt.xlabel("BCID")
-        plt.ylabel(f"{self.latex} Ratio [%]")
-
-        plt.grid()
-        plt.legend()
-
-    def save_plot(self, ouput_dir: Path, file_name: str, *, suffix: str = "", file_ext: str = "png"):
+        ax.set_title(title)
+        ax.set_xlabel("BCID")
+        ax.set_ylabel(f"{self.latex} Ratio [%]")
+
+        ax.grid(True)
+        ax.legend()
+
+    def save_plot(self,
+                  ouput_dir: Path,
+                  file_name: str,
+                  *,
+                  suffix: str = "",
+                  file_ext: str = "png",
+                  ax: Optional[Axes] = None):
+        path = self.output_path(ouput_dir, file_name, suffix=suffix, file_ext=file_ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        resolve_axes(ax).figure.savefig(path)
+
+    def output_path(self,
+                    ouput_dir: Path,
+                    file_name: str,
+                    *,
+                    suffix: str = "",
+                    file_ext: str = "png",
+                    detector: Optional[str] = None) -> Path:
+        """Returns the path save_plot writes a plot to.
+
+        Arguments
+        ---------
+            ouput_dir : pathlib.Path
+                The output directory of the plotter.
+            file_name : str
+                The name of the plot, without prefix, suffix and extension.
+            suffix : str
+                Appended to the name of the plot.
+            file_ext : str
+                The extension of the file.
+            detector : Optional[str]
+                Not used, the plots of this strategy are not per detector.
+
+        Returns
+        -------
+            pathlib.Path
+                The path of the plot.
+        """
         path = ouput_dir/"ratio"/self.output_folder_name
-        path.mkdir(parents=True, exist_ok=True)
-
-        file_name = f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
 
-        plt.savefig(path/file_name)
+        return path/f"{self.file_name_prepend}{file_name}{suffix}.{file_ext}"
 
 
 @dataclass
@@ -1 +1,2 @@
-from .title_builder import TitleBuilder
\ No newline at end of file
+from .title_builder import TitleBuilder
+from .axes import resolve_axes, plot_axes
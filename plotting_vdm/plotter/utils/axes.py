@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Optional
+
+import threading
+
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+
+_local = threading.local()
+
+
+def resolve_axes(ax: Optional[Axes]) -> Axes:
+    """Returns ax, or the current pyplot Axes if ax is None, so that strategies
+    can still be used with the pyplot state machine."""
+    return plt.gca() if ax is None else ax
+
+
+def plot_axes(key: Hashable, reuse: bool = False) -> Axes:
+    """Returns the Axes to draw the next plot of a plotter on.
+
+    Every thread keeps one Figure per key, created outside of pyplot so that
+    plots can be rendered concurrently. By default the Figure is cleared and
+    a new Axes is built for every plot, like `plt.clf()` does. When reusing,
+    the Axes and its styling are kept and only its artists and texts are removed.
+
+    Arguments
+    ---------
+        key : Hashable
+            Identifies the plotter and its strategy. Plots that style their Axes differently
+            must use different keys, the styling of a reused Axes is not reset.
+        reuse : bool
+            If True, keep the Axes of the previous plot.
+
+    Returns
+    -------
+        Axes
+            An empty Axes.
+    """
+    figures: Dict[Hashable, Figure] = _local.__dict__.setdefault("figures", {})
+
+    figure = figures.get(key)
+    if figure is None:
+        figure = figures[key] = Figure()
+    elif reuse and figure.axes:
+        ax = figure.axes[0]
+        _clear_artists(ax)
+        return ax
+    else:
+        figure.clf()
+
+    return figure.add_subplot()
+
+
+def _clear_artists(ax: Axes) -> None:
+    for artist in [*ax.lines, *ax.collections, *ax.patches, *ax.texts, *ax.figure.texts]:
+        artist.remove()
+    ax.containers.clear()
+
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+
+    # Back to the limits of a new Axes, so that plots without finite data look the same
+    ax.set_prop_cycle(None)
+    ax.relim()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.autoscale(True)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from typing import Optional, Sequence, NamedTuple
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+from plotting_vdm.plotter.manifest import ManifestEntry
+
+
+def snapshot_rc_params() -> Dict[str, Any]:
+    """Returns the current matplotlib rcParams, to be replayed in a render worker.
+
+    Returns
+    -------
+        Dict[str, Any]
+            Every rcParam except the backend.
+    """
+    return {key: value for key, value in matplotlib.rcParams.items() if key != "backend"}
+
+
+def init_render_worker(rc_params: Dict[str, Any]) -> None:
+    """Initializes a render worker process with the headless Agg backend and the
+    rcParams of the parent process, so that its plots match the ones rendered in the parent.
+
+    Arguments
+    ---------
+        rc_params : Dict[str, Any]
+            The rcParams of the parent process, as returned by `snapshot_rc_params`.
+    """
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update(rc_params)
+
+
+class PlotJob(NamedTuple):
+    """One figure of a plotter: a fit and correction, and the detector for per-detector strategies."""
+    fit: str
+    correction: str
+    detector: Optional[str] = None
+
+
+def _render_jobs(plotter: Any, result: Any, jobs: Sequence[PlotJob]) -> List[ManifestEntry]:
+    return [entry for job in jobs for entry in plotter.render(result, job)]
+
+
+def render_in_pool(plotter: Any, tasks: Sequence[Tuple[Any, List[PlotJob]]], max_workers: int) -> None:
+    """Renders the jobs of a plotter in a pool of Agg render workers.
+
+    The jobs of each result are split into at most max_workers chunks, so that
+    a result is sent to the workers a bounded number of times.
+
+    Arguments
+    ---------
+        plotter : Plotter or EvoPlotter
+            The plotter to render with. It is sent to the workers with its strategy.
+        tasks : Sequence[Tuple[Any, List[PlotJob]]]
+            Each result to render, with the jobs to render it with.
+        max_workers : int
+            The number of render workers.
+
+    Raises
+    ------
+        Exception
+            The first error raised by a job. The jobs that did not start yet are cancelled.
+
+    Notes
+    -----
+    If the configuration of the plotter has a manifest, the workers skip the jobs it lists as
+    up to date, and the entries of the plots they render are recorded and saved in this process.
+    """
+    chunks: List[Tuple[Any, List[PlotJob]]] = []
+    for result, jobs in tasks:
+        chunk_size = max(1, -(-len(jobs) // max_workers))
+        chunks.extend((result, jobs[start:start + chunk_size]) for start in range(0, len(jobs), chunk_size))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_render_worker,
+        initargs=(snapshot_rc_params(),),
+    ) as pool:
+        futures = [pool.submit(_render_jobs, plotter, result, jobs) for result, jobs in chunks]
+        try:
+            entries = [entry for future in futures for entry in future.result()]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    manifest = plotter.config.manifest
+    if manifest is not None:
+        manifest.record(entries)
+        manifest.save()
@@ -0,0 +1,287 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Iterator, Any
+from typing import Union, Optional, ClassVar
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import json
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+@dataclass
+class StageStats:
+    """The accumulated measurements of one stage for one set of tags.
+
+    Attributes
+    ----------
+    count : int
+        The number of times the stage ran.
+    total : float
+        The total wall time of the stage in seconds.
+    max : float
+        The longest single run of the stage in seconds.
+    peak_memory : Optional[int]
+        The largest increase of traced memory during a run of the stage, in bytes.
+        None if memory was not tracked.
+    """
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    peak_memory: Optional[int] = None
+
+    def add(self, elapsed: float, peak_memory: Optional[int]) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        if peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, peak_memory)
+
+
+@dataclass
+class _Frame:
+    start_memory: int
+    peak_memory: int
+
+
+class _Stage:
+    __slots__ = ("profile", "key", "start")
+
+    def __init__(self, profile: Profile, key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> None:
+        self.profile = profile
+        self.key = key
+
+    def __enter__(self) -> None:
+        if self.profile.memory:
+            self.profile._push_frame()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        peak_memory = self.profile._pop_frame() if self.profile.memory else None
+        self.profile._record(self.key, elapsed, peak_memory)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+@dataclass
+class Profile:
+    """
+    The wall time, call count and peak memory of every instrumented stage of a run,
+    tagged by scan, fit, detector, correction and strategy.
+
+    Stages can be nested, each one is measured independently. Only the stages that run
+    in the profiling process are recorded: reads done in a process executor are not.
+
+    Parameters
+    ----------
+    memory : bool
+        If True, the peak memory of every stage is traced with tracemalloc.
+        This slows down the run noticeably, so it is off by default.
+
+    Examples
+    --------
+    >>> with profiling.profile(memory=True) as run_profile:
+    ...     results = ScanResults(path, ["SG", "DG"])
+    ...     plotter.plot_many([results])
+    >>> print(run_profile.summary())
+    >>> run_profile.to_json("profile.json")
+    """
+    memory: bool = False
+    stats: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], StageStats] = field(default_factory=dict)
+
+    _tags: ClassVar[Tuple[str, ...]] = ("scan", "fit", "detector", "correction", "strategy")
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started: Optional[float] = None
+        self.wall_time = 0.0
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started is not None:
+            self.wall_time += time.perf_counter() - self._started
+            self._started = None
+
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def stage(self, name: str, **tags: Any) -> _Stage:
+        """Returns a context manager that measures one run of a stage.
+
+        Arguments
+        ---------
+            name : str
+                The name of the stage. Ex: read_fit, merge, draw, save
+            **tags : Any
+                The scan, fit, detector, correction or strategy the stage ran for.
+        """
+        key = (name, tuple(sorted((tag, str(value)) for tag, value in tags.items() if value is not None)))
+        return _Stage(self, key)
+
+    def _record(self, key: Tuple[str, Tuple[Tuple[str, str], ...]], elapsed: float, peak_memory: Optional[int]) -> None:
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StageStats()
+            stats.add(elapsed, peak_memory)
+
+    def _push_frame(self) -> None:
+        # tracemalloc has a single peak, so it is reset for every stage and
+        # the peak of the enclosing stage is carried in its frame
+        frames: List[_Frame] = self._local.__dict__.setdefault("frames", [])
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1].peak_memory = max(frames[-1].peak_memory, peak)
+        tracemalloc.reset_peak()
+        frames.append(_Frame(current, current))
+
+    def _pop_frame(self) -> int:
+        frames: List[_Frame] = self._local.frames
+        _, peak = tracemalloc.get_traced_memory()
+        frame = frames.pop()
+        peak = max(frame.peak_memory, peak)
+        if frames:
+            frames[-1].peak_memory = max(frames[-1].peak_memory, peak)
+
+        return peak - frame.start_memory
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns one row per stage and set of tags.
+
+        Returns
+        -------
+            pd.DataFrame
+                The stage, its tags, count, total, mean and max wall time in seconds
+                and peak memory in bytes.
+        """
+        with self._lock:
+            items = list(self.stats.items())
+
+        rows = []
+        for (name, tags), stats in items:
+            tag_values = dict(tags)
+            rows.append({
+                "stage": name,
+                **{tag: tag_values.get(tag) for tag in self._tags},
+                "count": stats.count,
+                "total": stats.total,
+                "mean": stats.total / stats.count,
+                "max": stats.max,
+                "peak_memory": stats.peak_memory,
+            })
+
+        return pd.DataFrame(rows, columns=["stage", *self._tags, "count", "total", "mean", "max", "peak_memory"])
+
+    def to_json(self, path: Union[Path, str]) -> None:
+        Path(path).write_text(json.dumps({
+            "wall_time": self.wall_time,
+            "memory": self.memory,
+            "stages": json.loads(self.to_frame().to_json(orient="records")),
+        }, indent=2))
+
+    def to_csv(self, path: Union[Path, str]) -> None:
+        self.to_frame().to_csv(path, index=False)
+
+    def summary(self, top: int = 10) -> str:
+        """Summarizes the run by stage, slowest stages first.
+
+        Arguments
+        ---------
+            top : int
+                The number of stages to list.
+
+        Returns
+        -------
+            str
+                One line per stage with its count, total time, share of the run wall time and peak memory.
+        """
+        frame = self.to_frame()
+        if frame.empty:
+            return "No stage was recorded."
+
+        by_stage = frame.groupby("stage").agg(
+            count=("count", "sum"), total=("total", "sum"), peak_memory=("peak_memory", "max")
+        ).sort_values("total", ascending=False).head(top)
+
+        lines = [f"Profiled {self.wall_time:.2f} s (stages can be nested, shares do not add up to 100%)"]
+        for name, row in by_stage.iterrows():
+            share = 100 * row["total"] / self.wall_time if self.wall_time else float("nan")
+            line = f"  {name:16s} {int(row['count']):8d} calls {row['total']:10.3f} s {share:6.1f}%"
+            if pd.notna(row["peak_memory"]):
+                line += f" {row['peak_memory'] / 2**20:10.1f} MiB peak"
+            lines.append(line)
+
+        return "\n".join(lines)
+
+
+_active: Optional[Profile] = None
+
+
+def stage(name: str, **tags: Any) -> Union[_Stage, _NullStage]:
+    """Measures one run of a stage in the active profile. Does nothing if profiling is disabled.
+
+    Arguments
+    ---------
+        name : str
+            The name of the stage.
+        **tags : Any
+            The scan, fit, detector, correction or strategy the stage ran for.
+    """
+    if _active is None:
+        return _NULL_STAGE
+
+    return _active.stage(name, **tags)
+
+
+def is_enabled() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def profile(memory: bool = False) -> Iterator[Profile]:
+    """Enables profiling for the duration of the block.
+
+    Arguments
+    ---------
+        memory : bool
+            If True, the peak memory of every stage is traced as well.
+
+    Yields
+    ------
+        Profile
+            The profile the stages are recorded in.
+    """
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("A profile is already active.")
+
+    run_profile = Profile(memory=memory)
+    run_profile.start()
+    _active = run_profile
+    try:
+        yield run_profile
+    finally:
+        _active = None
+        run_profile.stop()
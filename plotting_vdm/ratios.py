@@ -0,0 +1,375 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Sequence, ClassVar
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class BCIDMatrix:
+    """The values of some columns of one fit and correction, as BCID × detector matrices.
+
+    Attributes
+    ----------
+    bcids : np.ndarray
+        The sorted BCIDs measured by at least one detector. One row per BCID.
+    detectors : List[str]
+        The detectors, one column per detector.
+    values : Dict[str, np.ndarray]
+        The matrix of each column. Cells of BCIDs a detector did not measure are NaN.
+    present : np.ndarray
+        Whether each detector measured each BCID.
+    """
+    bcids: np.ndarray
+    detectors: List[str]
+    values: Dict[str, np.ndarray]
+    present: np.ndarray
+
+    @classmethod
+    def build(cls,
+              frame: pd.DataFrame,
+              positions: Dict[str, np.ndarray],
+              detectors: Sequence[str],
+              columns: Sequence[str]
+              ) -> BCIDMatrix:
+        """Scatters the rows of every detector of a fit and correction into BCID × detector matrices.
+
+        Arguments
+        ---------
+            frame : pd.DataFrame
+                The DataFrame of the fit.
+            positions : Dict[str, np.ndarray]
+                The row positions of each detector in the DataFrame, for one correction.
+                Detectors without positions have no measured BCID.
+            detectors : Sequence[str]
+                The detectors, in the order of the matrix columns.
+            columns : Sequence[str]
+                The columns to build a matrix of.
+
+        Returns
+        -------
+            BCIDMatrix
+                The matrices of the columns.
+
+        Raises
+        ------
+            ValueError
+                If a detector has several rows for the same BCID.
+        """
+        all_bcids = frame["BCID"].to_numpy()
+        detector_bcids = [all_bcids[positions[detector]] if detector in positions else all_bcids[:0] for detector in detectors]
+
+        # Floating point columns keep their precision, so that single precision results divide like their Series
+        column_values = {column: frame[column].to_numpy() for column in columns}
+        column_values = {
+            column: array if np.issubdtype(array.dtype, np.floating) else array.astype(np.float64)
+            for column, array in column_values.items()
+        }
+
+        bcids = np.unique(np.concatenate(detector_bcids)) if detector_bcids else all_bcids[:0]
+        present = np.zeros((len(bcids), len(detectors)), dtype=bool)
+        values = {
+            column: np.full((len(bcids), len(detectors)), np.nan, dtype=array.dtype)
+            for column, array in column_values.items()
+        }
+
+        for j, (detector, rows) in enumerate(zip(detectors, detector_bcids)):
+            if len(rows) == 0:
+                continue
+
+            row_index = np.searchsorted(bcids, rows)
+            if len(np.unique(row_index)) != len(row_index):
+                raise ValueError(f"Detector {detector} has several rows for the same BCID")
+
+            present[row_index, j] = True
+            for column, array in column_values.items():
+                values[column][row_index, j] = array[positions[detector]]
+
+        return cls(bcids, list(detectors), values, present)
+
+
+@dataclass
+class RatioTable:
+    """The ratios of a quantity of every detector to a reference detector, for one fit and correction.
+
+    Attributes
+    ----------
+    quantity : str
+        The compared quantity.
+    reference : str
+        The reference detector.
+    bcids : np.ndarray
+        The sorted BCIDs measured by at least one detector.
+    detectors : List[str]
+        The detectors, including the reference.
+    ratio : np.ndarray
+        The BCID × detector matrix of (detector / reference - 1) * 100.
+    error : np.ndarray
+        The propagated error of the ratio.
+    mask : np.ndarray
+        Whether both the detector and the reference measured each BCID.
+        The ratio of the other cells is NaN.
+
+    Examples
+    --------
+    >>> table = result.get_ratio_table("SG", "noCorr", "CapSigma_X", "CapSigmaErr_X", "HFOC")
+    >>> bcids, ratio, ratio_err = table.detector("PLT")
+    >>> table.to_frame()
+    """
+    quantity: str
+    reference: str
+    bcids: np.ndarray
+    detectors: List[str]
+    ratio: np.ndarray
+    error: np.ndarray
+    mask: np.ndarray
+
+    @classmethod
+    def from_matrix(cls, matrix: BCIDMatrix, quantity: str, quantity_err: str, reference: str) -> RatioTable:
+        """Computes the ratios of every detector to the reference in a single vectorized pass.
+
+        Arguments
+        ---------
+            matrix : BCIDMatrix
+                The matrices of the quantity and its error.
+            quantity : str
+                The compared quantity.
+            quantity_err : str
+                The error of the quantity.
+            reference : str
+                The reference detector. It must be one of the detectors of the matrix.
+
+        Returns
+        -------
+            RatioTable
+                The ratios and their errors.
+
+        Raises
+        ------
+            ValueError
+                If the reference detector is not a detector of the matrix.
+        """
+        if reference not in matrix.detectors:
+            raise ValueError(f"Reference detector {reference} is not one of {matrix.detectors}")
+
+        ref = matrix.detectors.index(reference)
+        values, errors = matrix.values[quantity], matrix.values[quantity_err]
+        mask = matrix.present & matrix.present[:, [ref]]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (values / values[:, [ref]] - 1) * 100
+            error = np.abs(ratio) * np.sqrt((errors / values)**2 + (errors[:, [ref]] / values[:, [ref]])**2)
+
+        ratio[~mask] = np.nan
+        error[~mask] = np.nan
+
+        return cls(quantity, reference, matrix.bcids, matrix.detectors, ratio, error, mask)
+
+    def detector(self, detector: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the BCIDs both a detector and the reference measured, with their ratios and errors.
+
+        Arguments
+        ---------
+            detector : str
+                The detector.
+
+        Returns
+        -------
+            Tuple[np.ndarray, np.ndarray, np.ndarray]
+                The BCIDs, ratios and errors.
+        """
+        j = self.detectors.index(detector)
+        rows = self.mask[:, j]
+
+        return self.bcids[rows], self.ratio[rows, j], self.error[rows, j]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the ratios as a long DataFrame, with one row per detector and BCID
+        measured by both the detector and the reference. The reference is left out.
+
+        Returns
+        -------
+            pd.DataFrame
+                The BCID, detector, ratio and ratio_err columns.
+        """
+        frames = []
+        for detector in self.detectors:
+            if detector == self.reference:
+                continue
+
+            bcids, ratio, error = self.detector(detector)
+            frames.append(pd.DataFrame({"BCID": bcids, "detector": detector, "ratio": ratio, "ratio_err": error}))
+
+        if not frames:
+            return pd.DataFrame(columns=["BCID", "detector", "ratio", "ratio_err"])
+
+        return pd.concat(frames, ignore_index=True)
+
+
+@dataclass
+class ComparisonMatrix:
+    """The ratios of a quantity of every pair of detectors, for one fit and correction.
+
+    Attributes
+    ----------
+    quantity : str
+        The compared quantity.
+    bcids : np.ndarray
+        The sorted BCIDs measured by at least one detector.
+    detectors : List[str]
+        The detectors.
+    ratio : np.ndarray
+        The BCID × detector × reference array of (detector / reference - 1) * 100.
+    error : np.ndarray
+        The error of the ratio propagated like RatioTable, proportional to the ratio itself.
+        It is the error bar of the ratio plots.
+    mask : np.ndarray
+        Whether both the detector and the reference measured each BCID.
+        The ratio of the other cells is NaN.
+    weight_error : np.ndarray
+        The error of detector / reference, in percent, propagated from the relative errors of both detectors.
+        The weighted mean uses its inverse square as weights.
+
+    Examples
+    --------
+    >>> comparison = result.get_comparison_matrix("SG", "noCorr", "CapSigma_X", "CapSigmaErr_X")
+    >>> comparison.summary()  # One row per pair of detectors
+    >>> comparison.table("weighted_mean")  # Detector × reference
+    >>> comparison.ratio_table("HFOC")  # Same as the RatioTable of the HFOC reference
+    """
+    quantity: str
+    bcids: np.ndarray
+    detectors: List[str]
+    ratio: np.ndarray
+    error: np.ndarray
+    mask: np.ndarray
+    weight_error: np.ndarray
+
+    statistics: ClassVar[Tuple[str, ...]] = ("n_bcids", "mean", "weighted_mean", "weighted_mean_err", "std")
+
+    @classmethod
+    def from_matrix(cls, matrix: BCIDMatrix, quantity: str, quantity_err: str) -> ComparisonMatrix:
+        """Computes the ratios of every pair of detectors in a single vectorized pass.
+
+        Arguments
+        ---------
+            matrix : BCIDMatrix
+                The matrices of the quantity and its error.
+            quantity : str
+                The compared quantity.
+            quantity_err : str
+                The error of the quantity.
+
+        Returns
+        -------
+            ComparisonMatrix
+                The ratios and their errors.
+        """
+        values, errors = matrix.values[quantity], matrix.values[quantity_err]
+        mask = matrix.present[:, :, None] & matrix.present[:, None, :]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_err = (errors / values)**2
+            ratio = (values[:, :, None] / values[:, None, :] - 1) * 100
+            relative_ratio_err = np.sqrt(relative_err[:, :, None] + relative_err[:, None, :])
+            error = np.abs(ratio) * relative_ratio_err
+            weight_error = np.abs(ratio + 100) * relative_ratio_err
+
+        ratio[~mask] = np.nan
+        error[~mask] = np.nan
+        weight_error[~mask] = np.nan
+
+        return cls(quantity, matrix.bcids, matrix.detectors, ratio, error, mask, weight_error)
+
+    def ratio_table(self, reference: str) -> RatioTable:
+        """Returns the ratios of every detector to one reference.
+
+        Arguments
+        ---------
+            reference : str
+                The reference detector.
+
+        Returns
+        -------
+            RatioTable
+                The ratios of the reference.
+        """
+        ref = self.detectors.index(reference)
+        return RatioTable(
+            self.quantity, reference, self.bcids, self.detectors,
+            self.ratio[:, :, ref], self.error[:, :, ref], self.mask[:, :, ref]
+        )
+
+    def statistic(self, name: str) -> np.ndarray:
+        """Summarizes the ratios of every pair of detectors over their common BCIDs.
+
+        Arguments
+        ---------
+            name : str
+                One of "n_bcids", "mean", "weighted_mean", "weighted_mean_err" and "std".
+                The weighted mean uses the inverse squared weight errors of the ratios as weights.
+                BCIDs whose ratio or weight error is not finite, or whose weight error is zero, are ignored.
+
+        Returns
+        -------
+            np.ndarray
+                The detector × reference matrix of the statistic. NaN for pairs without common BCIDs.
+
+        Raises
+        ------
+            ValueError
+                If the statistic is unknown.
+        """
+        if name not in self.statistics:
+            raise ValueError(f"Unknown statistic {name}, expected one of {self.statistics}")
+
+        valid = np.isfinite(self.ratio)
+        n_bcids = valid.sum(axis=0)
+        if name == "n_bcids":
+            return n_bcids
+
+        ratio = np.where(valid, self.ratio, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if name == "mean":
+                return ratio.sum(axis=0) / n_bcids
+            if name == "std":
+                mean = ratio.sum(axis=0) / n_bcids
+                return np.sqrt(np.where(valid, (ratio - mean)**2, 0.0).sum(axis=0) / n_bcids)
+
+            weighted = valid & np.isfinite(self.weight_error) & (self.weight_error > 0)
+            weights = np.where(weighted, 1 / np.where(weighted, self.weight_error, 1.0)**2, 0.0)
+            total_weight = np.where(weighted.any(axis=0), weights.sum(axis=0), np.nan)
+            if name == "weighted_mean_err":
+                return 1 / np.sqrt(total_weight)
+
+            return (weights * ratio).sum(axis=0) / total_weight
+
+    def table(self, name: str = "weighted_mean") -> pd.DataFrame:
+        """Returns one statistic as a detector × reference DataFrame."""
+        return pd.DataFrame(
+            self.statistic(name),
+            index=pd.Index(self.detectors, name="detector"),
+            columns=pd.Index(self.detectors, name="reference"),
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """Returns every statistic of every pair of different detectors.
+
+        Returns
+        -------
+            pd.DataFrame
+                The detector and reference columns, followed by one column per statistic.
+        """
+        n_detectors = len(self.detectors)
+        detector, reference = np.divmod(np.arange(n_detectors * n_detectors), n_detectors)
+        pairs = detector != reference
+
+        summary = pd.DataFrame({
+            "detector": np.array(self.detectors, dtype=object)[detector[pairs]],
+            "reference": np.array(self.detectors, dtype=object)[reference[pairs]],
+        })
+        for name in self.statistics:
+            summary[name] = self.statistic(name).ravel()[pairs]
+
+        return summary
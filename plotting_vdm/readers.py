@@ -0,0 +1,315 @@
+from __future__ import annotations
+from typing import List, Dict, Any
+from typing import Union, Optional, ClassVar, Collection
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+import os
+import itertools
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ResultFile:
+    """A result file found while indexing a scan folder.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The absolute path to the file.
+    size : int
+        The size of the file in bytes.
+    mtime_ns : int
+        The last modification time of the file in nanoseconds.
+    """
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry) -> ResultFile:
+        stat = entry.stat()
+        return cls(Path(entry.path), stat.st_size, stat.st_mtime_ns)
+
+
+ScanTree = Dict[str, Dict[str, List[ResultFile]]]
+
+
+class ReaderBackend(ABC):
+    """
+    Reads the result files of a scan folder. A backend defines the extension of the
+    files, how the folder is listed and how a single file is parsed.
+
+    The scan folder layout is the same for every backend:
+    `<detector>/results/<correction>/{fit}_FitResults.<ext>` and
+    `<detector>/results/<correction>/LumiCalibration_{detector}_{fit}_{fill}.<ext>`.
+    """
+
+    file_ext: ClassVar[str]
+
+    @abstractmethod
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        """Parses one result file.
+
+        Arguments
+        ---------
+            path : pathlib.Path
+                The path to the file.
+            columns : Optional[Collection[str]]
+                Only parse the columns of the file that are in this collection.
+                Columns that are not in the file are ignored. If None, every column is parsed.
+            dtypes : Optional[Dict[str, str]]
+                The dtypes of the known columns. Text formats parse these columns
+                without type inference, binary formats already store their types.
+
+        Returns
+        -------
+            pd.DataFrame
+                The content of the file.
+        """
+
+    def write(self, results: pd.DataFrame, path: Path) -> None:
+        """Writes one result file in the format of the backend.
+
+        Arguments
+        ---------
+            results : pd.DataFrame
+                The content of the file.
+            path : pathlib.Path
+                The path to the file.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support writing.")
+
+    def walk(self, path: Path) -> ScanTree:
+        """Lists the result files of a scan folder in a single pass.
+
+        Arguments
+        ---------
+            path : pathlib.Path
+                The path to the scan folder.
+
+        Returns
+        -------
+            ScanTree
+                The files of every correction folder of every detector folder.
+        """
+        tree: ScanTree = {}
+
+        for detector_entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            results_path = Path(detector_entry.path) / "results"
+            if not detector_entry.is_dir() or not results_path.is_dir():
+                continue
+
+            corrections = tree.setdefault(detector_entry.name, {})
+            for correction_entry in sorted(os.scandir(results_path), key=lambda entry: entry.name):
+                if not correction_entry.is_dir():
+                    continue
+
+                corrections[correction_entry.name] = [
+                    ResultFile.from_entry(file_entry)
+                    for file_entry in os.scandir(correction_entry.path)
+                    if file_entry.name.endswith(f".{self.file_ext}")
+                ]
+
+        return tree
+
+    def fit_result_name(self, fit: str) -> str:
+        return f"{fit}_FitResults.{self.file_ext}"
+
+    def sigvis_result_name(self, detector: str, fit: str, fill_number: int) -> str:
+        return f"LumiCalibration_{detector}_{fit}_{fill_number}.{self.file_ext}"
+
+
+class CSVReader(ReaderBackend):
+    """Reads the CSV files written by the fitting framework with the default pandas parser.
+
+    Parameters
+    ----------
+    **read_kwargs : Any
+        Forwarded to every pd.read_csv call.
+    """
+
+    file_ext = "csv"
+
+    def __init__(self, **read_kwargs: Any) -> None:
+        self.read_kwargs = read_kwargs
+
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        return pd.read_csv(path, usecols=self._usecols(columns), dtype=dtypes, **self.read_kwargs)
+
+    @staticmethod
+    def _usecols(columns: Optional[Collection[str]]) -> Optional[Any]:
+        return None if columns is None else columns.__contains__
+
+    def write(self, results: pd.DataFrame, path: Path) -> None:
+        results.to_csv(path, index=False)
+
+
+class ArrowCSVReader(CSVReader):
+    """Reads the CSV files with the multithreaded pyarrow parser. Requires pyarrow.
+
+    The declared dtypes are passed to the parser as column types, so these columns are not inferred
+    and a value that does not fit its type fails the read.
+
+    Parameters
+    ----------
+    **read_kwargs : Any
+        Forwarded to every pyarrow.csv.read_csv call. Ex: read_options, parse_options.
+    """
+
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        import pyarrow.csv
+
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={column: _arrow_type(dtype) for column, dtype in (dtypes or {}).items()}
+        )
+        results = pyarrow.csv.read_csv(path, convert_options=convert_options, **self.read_kwargs).to_pandas()
+
+        # Projected after parsing, include_columns would add the columns that are not in the file
+        if columns is not None:
+            results = results[[column for column in results.columns if column in columns]]
+
+        return results
+
+
+def _arrow_type(dtype: str) -> Any:
+    import numpy as np
+    import pyarrow
+
+    return pyarrow.string() if dtype == "str" else pyarrow.from_numpy_dtype(np.dtype(dtype))
+
+
+class ParquetReader(ReaderBackend):
+    """Reads a Parquet mirror of the scan folder. Requires pyarrow."""
+
+    file_ext = "parquet"
+
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        if columns is not None:
+            import pyarrow.parquet
+
+            columns = [column for column in pyarrow.parquet.read_schema(path).names if column in columns]
+
+        return pd.read_parquet(path, columns=columns)
+
+    def write(self, results: pd.DataFrame, path: Path) -> None:
+        results.to_parquet(path, index=False)
+
+
+class ArrowIPCReader(ReaderBackend):
+    """Reads an Arrow IPC (Feather V2) mirror of the scan folder. Requires pyarrow."""
+
+    file_ext = "arrow"
+
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        if columns is not None:
+            import pyarrow.ipc
+
+            with pyarrow.ipc.open_file(path) as ipc_file:
+                columns = [column for column in ipc_file.schema.names if column in columns]
+
+        return pd.read_feather(path, columns=columns)
+
+    def write(self, results: pd.DataFrame, path: Path) -> None:
+        results.reset_index(drop=True).to_feather(path)
+
+
+class InMemoryReader(ReaderBackend):
+    """
+    Serves result files from memory. Files are keyed by the path they would have on disk,
+    so ScanResults can be built on a scan folder that does not exist. Mostly useful in tests.
+
+    Examples
+    --------
+    >>> reader = InMemoryReader()
+    >>> reader.write(fit_results, Path("/scans/8381_11Nov22_004152_11Nov22_010424/PLT/results/noCorr/SG_FitResults.csv"))
+    >>> results = ScanResults("/scans/8381_11Nov22_004152_11Nov22_010424", ["SG"], reader=reader)
+    """
+
+    file_ext = "csv"
+    _versions = itertools.count(1)
+
+    def __init__(self, files: Optional[Dict[Union[Path, str], pd.DataFrame]] = None) -> None:
+        self._files: Dict[Path, pd.DataFrame] = {}
+        self._stats: Dict[Path, ResultFile] = {}
+
+        for path, results in (files or {}).items():
+            self.write(results, Path(path))
+
+    def read(self,
+             path: Path,
+             columns: Optional[Collection[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None
+             ) -> pd.DataFrame:
+        results = self._files[Path(path)]
+        if columns is not None:
+            results = results[[column for column in results.columns if column in columns]]
+
+        return results.copy()
+
+    def write(self, results: pd.DataFrame, path: Path) -> None:
+        path = Path(path)
+        self._files[path] = results.copy()
+        self._stats[path] = ResultFile(path, int(results.memory_usage(deep=True).sum()), next(self._versions))
+
+    def walk(self, path: Path) -> ScanTree:
+        tree: ScanTree = {}
+
+        for file_path, result_file in sorted(self._stats.items()):
+            relative = file_path.relative_to(path) if file_path.is_relative_to(path) else None
+            if relative is None or len(relative.parts) != 4 or relative.parts[1] != "results":
+                continue
+
+            detector, _, correction, _ = relative.parts
+            tree.setdefault(detector, {}).setdefault(correction, []).append(result_file)
+
+        return tree
+
+
+def mirror_scan(path: Path, target: Path, reader: ReaderBackend, source_reader: Optional[ReaderBackend] = None) -> None:
+    """Writes a copy of a scan folder in the format of another backend.
+
+    Arguments
+    ---------
+        path : pathlib.Path
+            The path to the scan folder to copy.
+        target : pathlib.Path
+            The path to the copy of the scan folder. Its name must be the same scan id.
+        reader : ReaderBackend
+            The backend whose format the copy is written in.
+        source_reader : Optional[ReaderBackend]
+            The backend of the scan folder to copy. If None, CSVReader is used.
+    """
+    source_reader = CSVReader() if source_reader is None else source_reader
+
+    for detector, corrections in source_reader.walk(path).items():
+        for correction, files in corrections.items():
+            correction_target = target / detector / "results" / correction
+            if not isinstance(reader, InMemoryReader):
+                correction_target.mkdir(parents=True, exist_ok=True)
+
+            for result_file in files:
+                name = result_file.path.name[:-len(source_reader.file_ext)] + reader.file_ext
+                reader.write(source_reader.read(result_file.path), correction_target / name)
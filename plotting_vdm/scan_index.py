@@ -0,0 +1,156 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Iterable, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from plotting_vdm.readers import ResultFile, ReaderBackend, CSVReader
+
+
+@dataclass
+class ScanIndex:
+    """
+    Index of the result files available in a scan folder. The folder is walked
+    once and every `{fit}_FitResults.<ext>` and `LumiCalibration_{detector}_{fit}_{fill}.<ext>`
+    is recorded under its (fit, detector, correction) key. The extension and the
+    way the folder is listed are defined by the reader backend.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the scan folder.
+    fill_number : int
+        The fill number of the scan. Used to match the LumiCalibration files.
+    fit_results : Dict[Tuple[str, str, str], ResultFile]
+        The fit result files, keyed by (fit, detector, correction).
+    sigvis_results : Dict[Tuple[str, str, str], ResultFile]
+        The LumiCalibration files, keyed by (fit, detector, correction).
+    detector_corrections : Dict[str, List[str]]
+        The correction folders found for each detector folder.
+    reader : ReaderBackend
+        The backend whose files are indexed.
+
+    Examples
+    --------
+    >>> index = ScanIndex.build(path, fill_number=8381)
+    >>> index.detectors
+    ['BCM1F', 'HFOC', 'PLT']
+    >>> index.missing(["SG"], ["PLT"], ["noCorr"])
+    []
+    """
+    path: Path
+    fill_number: int
+    fit_results: Dict[Tuple[str, str, str], ResultFile] = field(default_factory=dict)
+    sigvis_results: Dict[Tuple[str, str, str], ResultFile] = field(default_factory=dict)
+    detector_corrections: Dict[str, List[str]] = field(default_factory=dict)
+    reader: ReaderBackend = field(default_factory=CSVReader)
+
+    @classmethod
+    def build(cls, path: Path, fill_number: int, reader: Optional[ReaderBackend] = None) -> ScanIndex:
+        """Walks the scan folder once and indexes every result file in it.
+
+        Arguments
+        ---------
+            path : pathlib.Path
+                The path to the scan folder.
+            fill_number : int
+                The fill number of the scan.
+            reader : Optional[ReaderBackend]
+                The backend that lists the scan folder. If None, CSVReader is used.
+
+        Returns
+        -------
+            ScanIndex
+                The index of the scan folder.
+        """
+        index = cls(path, fill_number, reader=CSVReader() if reader is None else reader)
+
+        for detector, corrections in index.reader.walk(path).items():
+            index.detector_corrections[detector] = list(corrections)
+
+            for correction, result_files in corrections.items():
+                for result_file in result_files:
+                    index._add_file(detector, correction, result_file)
+
+        return index
+
+    def _add_file(self, detector: str, correction: str, result_file: ResultFile) -> None:
+        name = result_file.path.name
+
+        fit_suffix = self.reader.fit_result_name("")
+        if name.endswith(fit_suffix):
+            self.fit_results[(name[:-len(fit_suffix)], detector, correction)] = result_file
+            return
+
+        sigvis_prefix, sigvis_suffix = self.reader.sigvis_result_name(detector, "\0", self.fill_number).split("\0")
+        if name.startswith(sigvis_prefix) and name.endswith(sigvis_suffix):
+            fit = name[len(sigvis_prefix):-len(sigvis_suffix)]
+            self.sigvis_results[(fit, detector, correction)] = result_file
+
+    @property
+    def fits(self) -> List[str]:
+        return sorted({fit for fit, _, _ in self.fit_results})
+
+    @property
+    def detectors(self) -> List[str]:
+        return list(self.detector_corrections)
+
+    def corrections(self, detectors: Iterable[str]) -> List[str]:
+        """Returns the corrections found for any of the given detectors.
+
+        Arguments
+        ---------
+            detectors : Iterable[str]
+                The detectors to get the corrections of.
+
+        Returns
+        -------
+            List[str]
+                The sorted union of the corrections of each detector.
+        """
+        return sorted({
+            correction
+            for detector in detectors
+            for correction in self.detector_corrections.get(detector, [])
+        })
+
+    def fit_result(self, fit: str, detector: str, correction: str) -> ResultFile:
+        return self.fit_results[(fit, detector, correction)]
+
+    def sigvis_result(self, fit: str, detector: str, correction: str) -> ResultFile:
+        return self.sigvis_results[(fit, detector, correction)]
+
+    def missing(self,
+                fits: Iterable[str],
+                detectors: Iterable[str],
+                corrections: Iterable[str]
+                ) -> List[str]:
+        """Lists every result file needed to load the given combinations that is not in the index.
+
+        Arguments
+        ---------
+            fits : Iterable[str]
+                The fits to check.
+            detectors : Iterable[str]
+                The detectors to check.
+            corrections : Iterable[str]
+                The corrections to check.
+
+        Returns
+        -------
+            List[str]
+                A description of every missing file. Empty if nothing is missing.
+        """
+        missing: List[str] = []
+        for fit in fits:
+            for detector in detectors:
+                for correction in corrections:
+                    key = (fit, detector, correction)
+                    if key not in self.fit_results:
+                        missing.append(f"{detector}/results/{correction}/{self.reader.fit_result_name(fit)}")
+                    if key not in self.sigvis_results:
+                        missing.append(
+                            f"{detector}/results/{correction}/"
+                            f"{self.reader.sigvis_result_name(detector, fit, self.fill_number)}"
+                        )
+
+        return missing
@@ -1,12 +1,245 @@
-from typing import List, Dict, Tuple
-from typing import Union, Optional, ClassVar
+from typing import List, Dict, Tuple, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Union, Optional, ClassVar, Type, Callable, Iterable, Collection, Set, Any
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
 
 import re
+import hashlib
+import threading
 
+import numpy as np
 import pandas as pd
 
+from plotting_vdm.scan_index import ScanIndex
+from plotting_vdm.readers import ReaderBackend, CSVReader
+from plotting_vdm.schema import ResultSchema, SchemaRegistry, DEFAULT_SCHEMAS
+from plotting_vdm.cache import ResultsCache
+from plotting_vdm.ratios import BCIDMatrix, RatioTable, ComparisonMatrix
+from plotting_vdm.correction_chain import CorrectionChain, CorrectionEffects
+from plotting_vdm import profiling
+
+
+def _read_result(reader: ReaderBackend,
+                 path: Path,
+                 correction: str,
+                 columns: Optional[Collection[str]],
+                 schema: ResultSchema,
+                 tags: Dict[str, str]
+                 ) -> pd.DataFrame:
+    with profiling.stage(f"read_{schema.kind}", correction=correction, **tags):
+        result = schema.read(reader, path, columns)
+    result["correction"] = correction
+
+    return result
+
+
+class LazyResults(Mapping[str, pd.DataFrame]):
+    """
+    A read-only mapping of fits to DataFrames that loads each fit
+    the first time it is accessed.
+
+    Parameters
+    ----------
+    fits : List[str]
+        The keys of the mapping.
+    loader : Callable[[List[str]], Dict[str, pd.DataFrame]]
+        Loads the DataFrames of the given fits.
+    """
+
+    def __init__(self, fits: List[str], loader: Callable[[List[str]], Dict[str, pd.DataFrame]]) -> None:
+        self._fits = list(fits)
+        self._loader = loader
+        self._loaded: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, fit: str) -> pd.DataFrame:
+        if fit not in self._fits:
+            raise KeyError(fit)
+
+        if fit not in self._loaded:
+            self.load([fit])
+
+        return self._loaded[fit]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fits)
+
+    def __len__(self) -> int:
+        return len(self._fits)
+
+    def is_loaded(self, fit: str) -> bool:
+        return fit in self._loaded
+
+    def store(self, fit: str, results: pd.DataFrame) -> None:
+        with self._lock:
+            self._loaded[fit] = results
+
+    def load(self, fits: Iterable[str]) -> None:
+        with self._lock:
+            missing = [fit for fit in fits if fit not in self._loaded]
+            if missing:
+                self._loaded.update(self._loader(missing))
+
+    def unload(self, fit: str) -> None:
+        with self._lock:
+            self._loaded.pop(fit, None)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"LazyResults(fits={self._fits}, loaded={list(self._loaded)})"
+
+
+@dataclass
+class RefreshReport:
+    """What changed in a scan after a call to ScanResults.refresh.
+
+    Attributes
+    ----------
+    changes : List[Tuple[str, str, str]]
+        The (fit, detector, correction) combinations that were added or modified.
+    new_detectors : List[str]
+        The detectors that were not part of the scan before.
+    new_corrections : List[str]
+        The corrections that were not part of the scan before.
+    """
+    changes: List[Tuple[str, str, str]] = field(default_factory=list)
+    new_detectors: List[str] = field(default_factory=list)
+    new_corrections: List[str] = field(default_factory=list)
+
+    @property
+    def corrections(self) -> List[str]:
+        """The corrections affected by a change, to be plotted again."""
+        return sorted({correction for _, _, correction in self.changes})
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+
+class _SliceIndex:
+    """Row positions of every (detector, correction) group of a fit DataFrame,
+    and the slices and BCID alignments built from them."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+        self.positions: Dict[Tuple[str, str], np.ndarray] = {
+            (str(detector), str(correction)): positions
+            for (detector, correction), positions in frame.groupby(
+                ["detector", "correction"], sort=False, observed=True
+            ).indices.items()
+        }
+        self.slices: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self.alignments: Dict[Tuple[Tuple[str, str], Tuple[str, str]], Tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self.digests: Dict[Tuple[str, str], str] = {}
+        self.matrices: Dict[Tuple[Tuple[str, ...], str, str, str], BCIDMatrix] = {}
+        self.ratios: Dict[Tuple[Tuple[str, ...], str, str, str, str], RatioTable] = {}
+        self.comparisons: Dict[Tuple[Tuple[str, ...], str, str, str], ComparisonMatrix] = {}
+        self.effects: Dict[Tuple[Tuple[str, ...], str, Tuple[str, ...], str, str], CorrectionEffects] = {}
+
+    def get(self, detector: str, correction: str) -> pd.DataFrame:
+        key = (detector, correction)
+
+        frame_slice = self.slices.get(key)
+        if frame_slice is None:
+            positions = self.positions.get(key)
+            frame_slice = self.frame.iloc[0:0] if positions is None else self.frame.take(positions)
+            self.slices[key] = frame_slice
+
+        return frame_slice
+
+    def aligned(self, key: Tuple[str, str], ref_key: Tuple[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        aligned = self.alignments.get((key, ref_key))
+        if aligned is None:
+            data, ref = self.get(*key), self.get(*ref_key)
+
+            if not ref["BCID"].equals(data["BCID"]):
+                bcid_filter = np.intersect1d(ref["BCID"], data["BCID"])
+
+                data = data[data["BCID"].isin(bcid_filter)].reset_index(drop=True)
+                ref = ref[ref["BCID"].isin(bcid_filter)].reset_index(drop=True)
+
+            aligned = self.alignments[(key, ref_key)] = (data, ref)
+
+        return aligned
+
+    def digest(self, detector: str, correction: str) -> str:
+        key = (detector, correction)
+
+        digest = self.digests.get(key)
+        if digest is None:
+            frame_slice = self.get(detector, correction)
+
+            hasher = hashlib.sha1(repr(list(frame_slice.columns)).encode())
+            hasher.update(pd.util.hash_pandas_object(frame_slice, index=True).to_numpy().tobytes())
+            digest = self.digests[key] = hasher.hexdigest()
+
+        return digest
+
+    def matrix(self, detectors: Sequence[str], correction: str, quantity: str, quantity_err: str) -> BCIDMatrix:
+        key = (tuple(detectors), correction, quantity, quantity_err)
+
+        matrix = self.matrices.get(key)
+        if matrix is None:
+            positions = {
+                detector: detector_positions
+                for (detector, detector_correction), detector_positions in self.positions.items()
+                if detector_correction == correction
+            }
+            matrix = self.matrices[key] = BCIDMatrix.build(self.frame, positions, detectors, [quantity, quantity_err])
+
+        return matrix
+
+    def ratio_table(self,
+                    detectors: Sequence[str],
+                    correction: str,
+                    quantity: str,
+                    quantity_err: str,
+                    reference: str
+                    ) -> RatioTable:
+        key = (tuple(detectors), correction, quantity, quantity_err, reference)
+
+        table = self.ratios.get(key)
+        if table is None:
+            matrix = self.matrix(detectors, correction, quantity, quantity_err)
+            table = self.ratios[key] = RatioTable.from_matrix(matrix, quantity, quantity_err, reference)
+
+        return table
+
+    def comparison(self, detectors: Sequence[str], correction: str, quantity: str, quantity_err: str) -> ComparisonMatrix:
+        key = (tuple(detectors), correction, quantity, quantity_err)
+
+        comparison = self.comparisons.get(key)
+        if comparison is None:
+            matrix = self.matrix(detectors, correction, quantity, quantity_err)
+            comparison = self.comparisons[key] = ComparisonMatrix.from_matrix(matrix, quantity, quantity_err)
+
+        return comparison
+
+    def correction_effects(self,
+                           detectors: Sequence[str],
+                           chain: CorrectionChain,
+                           quantity: str,
+                           quantity_err: str
+                           ) -> CorrectionEffects:
+        key = (tuple(detectors), chain.base, chain.corrections, quantity, quantity_err)
+
+        effects = self.effects.get(key)
+        if effects is None:
+            columns = [(detector, correction) for detector in detectors for correction in chain.corrections]
+            matrix = BCIDMatrix.build(self.frame, self.positions, columns, [quantity, quantity_err])
+            effects = self.effects[key] = CorrectionEffects.from_matrix(matrix, chain, detectors, quantity, quantity_err)
+
+        return effects
+
 
 class ScanResults:
     """
@@ -38,13 +271,38 @@ class ScanResults:
         The energy of the scan.
     energy_unit : str
         The unit of the energy of the scan.
+    executor : Optional[str]
+        If set, read the result files concurrently. Either "thread" or "process".
+        If None, the files are read one after the other.
+    max_workers : Optional[int]
+        The number of workers of the concurrent loader. If None, the executor default is used.
+    cache : Optional[ResultsCache]
+        A persistent cache of the processed results. Fits found in the cache are not
+        read from the CSV files. If None, no cache is used.
+    lazy : bool
+        If True, each fit is loaded the first time it is accessed in `results`.
+        If False, every fit is loaded on construction.
+    reader : Optional[ReaderBackend]
+        The backend that lists and parses the result files. If None, CSVReader is used.
+    columns : Optional[Iterable[str]]
+        The result columns to load, as named in `results`. Ex: CapSigma_X, xsec.
+        Only these and the key columns are parsed. If None, every column is loaded.
+        See `required_columns` to derive them from plot strategies.
+    schemas : Optional[SchemaRegistry]
+        The declared columns and dtypes of the result files. Every file is parsed with
+        and validated against the schema of its kind and fit. If None, DEFAULT_SCHEMAS is used.
+    compact : bool
+        If True, store detector and correction as categoricals and BCID as the
+        smallest integer type that holds it.
+    single_precision : bool
+        If True, store the floating point columns as float32.
 
     Attributes
     -----
     id_str : str
         The id of the scan. Ex: 8381_11Nov22_004152_11Nov22_010424
-    results : Dict[str, pd.DataFrame]
-        A dictionary containing the fit results and cross section results DataFrames for each fit.
+    results : LazyResults
+        A mapping containing the fit results and cross section results DataFrames for each fit.
     fill_number : int
         The fill number extracted from the path.
     fits : List[str]
@@ -61,6 +319,8 @@ class ScanResults:
         The unit of the energy of the scan.
     year: int
         The year of the scan.
+    index : ScanIndex
+        The index of the result files found in the scan folder.
 
     Examples
     --------
@@ -77,6 +337,25 @@ class ScanResults:
         fits: ['SG', 'DG']
         detectors: ['PLT', 'BCM1F']
         corrections: ['noCorr', 'Background']
+
+    Reading the result files with a pool of 16 threads.
+
+    >>> results = ScanResults(path, fits, executor="thread", max_workers=16)
+
+    Fits are loaded on first access. They can also be loaded up front and released.
+
+    >>> results.preload()
+    >>> results.unload("DG")
+
+    Loading only the columns needed by the plot strategies.
+
+    >>> strategies = [CapSigmaXNormalPlotStrategy(), SigVisNormalPlotStrategy()]
+    >>> results = ScanResults(path, fits, columns=ScanResults.required_columns(strategies))
+
+    Holding many scans in memory at once.
+
+    >>> results = ScanResults(path, fits, compact=True, single_precision=True)
+    >>> results.memory_usage()
     """
 
     _timestamp_format = "%d%b%y_%H%M%S"
@@ -93,6 +372,11 @@ class ScanResults:
         "peak_Y": r"Pea$k_Y$",
         "xsec": r"$\sigma_{vis}$",
     }
+    _result_keys: ClassVar[List[str]] = ["BCID", "detector", "correction"]
+    _executors: ClassVar[Dict[str, Type[Executor]]] = {
+        "thread": ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
 
     def __init__(self,
                 path: Union[Path, str],
@@ -102,6 +386,15 @@ class ScanResults:
                 name: str = "",
                 energy: float = 0.0,
                 energy_unit: str = "GeV",
+                executor: Optional[str] = None,
+                max_workers: Optional[int] = None,
+                cache: Optional[ResultsCache] = None,
+                lazy: bool = True,
+                reader: Optional[ReaderBackend] = None,
+                columns: Optional[Iterable[str]] = None,
+                schemas: Optional[SchemaRegistry] = None,
+                compact: bool = False,
+                single_precision: bool = False,
                 ) -> None:
         if isinstance(path, str):
             self._path = Path(path).absolute()
@@ -113,6 +406,18 @@ class ScanResults:
         self.energy = energy
         self.energy_unit = energy_unit
 
+        if executor is not None and executor not in self._executors:
+            raise ValueError(f"Executor '{executor}' is not recognized. Use one of {list(self._executors)}.")
+        self._executor = executor
+        self._max_workers = max_workers
+        self._cache = cache
+        self._reader = CSVReader() if reader is None else reader
+        self._columns = None if columns is None else sorted(set(columns))
+        self._read_columns = self._get_read_columns(self._columns)
+        self._schemas = DEFAULT_SCHEMAS if schemas is None else schemas
+        self._compact = compact
+        self._single_precision = single_precision
+
         self._iter_detectors = detectors is None
         self._detectors = [] if self._iter_detectors else detectors
         assert self._detectors is not None
@@ -124,13 +429,23 @@ class ScanResults:
         self.fill_number = self._get_fill_number()
         self.start, self.end = self._get_scan_times()
 
-        self.results: Dict[str, pd.DataFrame] = {}
-        self._collect_results()
+        self._index = ScanIndex.build(self._path, self.fill_number, self._reader)
+        self._detectors, self._corrections = self._resolve_selection(self._index)
+
+        self.results = LazyResults(self.fits, self._collect_results)
+        self._slices: Dict[str, _SliceIndex] = {}
+        self._chains: Dict[Tuple[str, Tuple[str, ...]], CorrectionChain] = {}
+        if not lazy:
+            self.preload()
 
     @property
     def path(self) -> Path:
         return self._path
 
+    @property
+    def index(self) -> ScanIndex:
+        return self._index
+
     @property
     def id_str(self) -> Path:
         return self._path.stem
@@ -164,6 +479,355 @@ class ScanResults:
         """
         return all(column in result.columns for result in self.results.values())
 
+    def preload(self, fits: Optional[List[str]] = None) -> None:
+        """Loads the given fits into memory. Fits that are already loaded are not read again.
+
+        Arguments
+        ---------
+            fits : Optional[List[str]]
+                The fits to load. If None, every fit is loaded.
+        """
+        self.results.load(self.fits if fits is None else fits)
+
+    def unload(self, fit: str) -> None:
+        """Releases the DataFrame of a fit. It is loaded again on its next access.
+
+        Arguments
+        ---------
+            fit : str
+                The fit to release.
+        """
+        self.results.unload(fit)
+        self._slices.pop(fit, None)
+
+    def memory_usage(self) -> pd.Series:
+        """Reports the memory used by each loaded fit. Fits that are not loaded are not reported.
+
+        Returns
+        -------
+            pd.Series
+                The number of bytes used by the DataFrame of each loaded fit, indexed by fit.
+        """
+        return pd.Series({
+            fit: self.results[fit].memory_usage(deep=True).sum()
+            for fit in self.fits
+            if self.results.is_loaded(fit)
+        }, name="bytes", dtype="int64")
+
+    def get_slice(self, fit: str, detector: str, correction: str) -> pd.DataFrame:
+        """Returns the rows of a fit for one detector and correction.
+
+        The row positions of every (detector, correction) group are computed once per fit
+        and each slice is cached, so repeated calls return the same DataFrame. The
+        returned DataFrame must not be modified in place.
+
+        Arguments
+        ---------
+            fit : str
+                The fit to slice.
+            detector : str
+                The detector to select.
+            correction : str
+                The correction to select.
+
+        Returns
+        -------
+            pd.DataFrame
+                The selected rows, in their original order. Empty if the combination does not exist.
+        """
+        with profiling.stage("slice", scan=self.id_str, fit=fit, detector=detector, correction=correction):
+            return self._slice_index(fit).get(detector, correction)
+
+    def get_aligned_slices(self,
+                           fit: str,
+                           detector: str,
+                           correction: str,
+                           ref_detector: str,
+                           ref_correction: str
+                           ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Returns the slices of two (detector, correction) pairs of a fit, restricted to their common BCIDs.
+
+        If both slices have the same BCIDs they are returned as is, otherwise the rows of BCIDs
+        missing from either one are dropped and both indexes are reset. Like the slices, every
+        alignment is cached, so that the plotters that compare the same pairs share it.
+
+        Arguments
+        ---------
+            fit : str
+                The fit to slice.
+            detector : str
+                The detector of the compared slice.
+            correction : str
+                The correction of the compared slice.
+            ref_detector : str
+                The detector of the reference slice.
+            ref_correction : str
+                The correction of the reference slice.
+
+        Returns
+        -------
+            Tuple[pd.DataFrame, pd.DataFrame]
+                The compared and the reference slices.
+        """
+        with profiling.stage("align", scan=self.id_str, fit=fit, detector=detector, correction=correction):
+            return self._slice_index(fit).aligned((detector, correction), (ref_detector, ref_correction))
+
+    def get_ratio_table(self,
+                        fit: str,
+                        correction: str,
+                        quantity: str,
+                        quantity_err: str,
+                        reference_detector: str
+                        ) -> RatioTable:
+        """Returns the ratios of a quantity of every detector to a reference detector.
+
+        The quantity and its error are scattered into BCID × detector matrices once, and the
+        ratios of all the detectors are computed in a single vectorized pass. BCIDs that a
+        detector or the reference did not measure are masked. Every table is cached.
+
+        Arguments
+        ---------
+            fit : str
+                The fit to compare.
+            correction : str
+                The correction to compare.
+            quantity : str
+                The compared quantity.
+            quantity_err : str
+                The error of the quantity.
+            reference_detector : str
+                The detector every other detector is divided by.
+
+        Returns
+        -------
+            RatioTable
+                The ratios and their propagated errors, in percent.
+
+        Raises
+        ------
+            ValueError
+                If the reference detector is not a detector of the scan,
+                or a detector has several rows for the same BCID.
+        """
+        with profiling.stage("ratio", scan=self.id_str, fit=fit, correction=correction, quantity=quantity):
+            return self._slice_index(fit).ratio_table(
+                self.detectors, correction, quantity, quantity_err, reference_detector
+            )
+
+    def get_comparison_matrix(self,
+                              fit: str,
+                              correction: str,
+                              quantity: str,
+                              quantity_err: str
+                              ) -> ComparisonMatrix:
+        """Returns the ratios of a quantity of every pair of detectors.
+
+        Shares the BCID × detector matrices of `get_ratio_table`, and computes the ratios
+        of all the pairs in a single vectorized pass. Every matrix is cached.
+
+        Arguments
+        ---------
+            fit : str
+                The fit to compare.
+            correction : str
+                The correction to compare.
+            quantity : str
+                The compared quantity.
+            quantity_err : str
+                The error of the quantity.
+
+        Returns
+        -------
+            ComparisonMatrix
+                The ratios and their propagated errors, in percent, and their statistics.
+
+        Raises
+        ------
+            ValueError
+                If a detector has several rows for the same BCID.
+        """
+        with profiling.stage("compare", scan=self.id_str, fit=fit, correction=correction, quantity=quantity):
+            return self._slice_index(fit).comparison(self.detectors, correction, quantity, quantity_err)
+
+    def get_correction_chain(self, base: str) -> CorrectionChain:
+        """Returns the lineage of the corrections of the scan, resolved once per base correction.
+
+        Arguments
+        ---------
+            base : str
+                The correction every lineage ends at.
+
+        Returns
+        -------
+            CorrectionChain
+                The parent of every correction.
+
+        Raises
+        ------
+            ValueError
+                If the base correction is not a correction of the scan.
+        """
+        key = (base, tuple(self.corrections))
+
+        chain = self._chains.get(key)
+        if chain is None:
+            chain = self._chains[key] = CorrectionChain.build(self.corrections, base)
+
+        return chain
+
+    def get_correction_effects(self, fit: str, quantity: str, quantity_err: str, base: str) -> CorrectionEffects:
+        """Returns the effect of every correction step on a quantity, for every detector and BCID.
+
+        The quantity and its error are scattered into a BCID × detector × correction array once,
+        and the effects of all the steps of the correction chain, and their cumulative effects,
+        are computed in a single vectorized pass. Every result is cached.
+
+        Arguments
+        ---------
+            fit : str
+                The fit.
+            quantity : str
+                The quantity.
+            quantity_err : str
+                The error of the quantity.
+            base : str
+                The correction every lineage ends at.
+
+        Returns
+        -------
+            CorrectionEffects
+                The effects of the steps and their propagated errors, in percent.
+
+        Raises
+        ------
+            ValueError
+                If the base correction is not a correction of the scan,
+                or a detector has several rows for the same BCID and correction.
+        """
+        chain = self.get_correction_chain(base)
+        with profiling.stage("effects", scan=self.id_str, fit=fit, quantity=quantity):
+            return self._slice_index(fit).correction_effects(self.detectors, chain, quantity, quantity_err)
+
+    def get_correction_effect_table(self, fit: str, quantities: Sequence[Tuple[str, str]], base: str) -> pd.DataFrame:
+        """Returns the effect of every correction step on several quantities as one long DataFrame.
+
+        Arguments
+        ---------
+            fit : str
+                The fit.
+            quantities : Sequence[Tuple[str, str]]
+                The (quantity, quantity_err) pairs.
+            base : str
+                The correction every lineage ends at.
+
+        Returns
+        -------
+            pd.DataFrame
+                The columns of CorrectionEffects.to_frame, preceded by a quantity column.
+        """
+        frames = [
+            self.get_correction_effects(fit, quantity, quantity_err, base).to_frame()
+            for quantity, quantity_err in quantities
+        ]
+        for (quantity, _), frame in zip(quantities, frames):
+            frame.insert(0, "quantity", quantity)
+
+        return pd.concat(frames, ignore_index=True)
+
+    def slice_digest(self, fit: str, detector: str, correction: str) -> str:
+        """Returns a hash of the content of a slice, to tell whether the plots made from it are up to date.
+
+        Arguments
+        ---------
+            fit : str
+                The fit of the slice.
+            detector : str
+                The detector of the slice.
+            correction : str
+                The correction of the slice.
+
+        Returns
+        -------
+            str
+                The hexadecimal hash of the columns, index and values of the slice.
+        """
+        return self._slice_index(fit).digest(detector, correction)
+
+    def _slice_index(self, fit: str) -> _SliceIndex:
+        frame = self.results[fit]
+
+        slice_index = self._slices.get(fit)
+        if slice_index is None or slice_index.frame is not frame:
+            slice_index = _SliceIndex(frame)
+            self._slices[fit] = slice_index
+
+        return slice_index
+
+    def refresh(self) -> RefreshReport:
+        """Picks up result files that were added or modified since the scan was indexed.
+
+        The scan folder is indexed again and only the (fit, detector, correction) files whose
+        size or modification time changed are read. Their rows replace the old ones in the
+        loaded fits. Fits that are not loaded will read the new files on their next access.
+
+        Returns
+        -------
+            RefreshReport
+                What changed in the scan.
+
+        Raises
+        ------
+            FileNotFoundError
+                If a result file needed by the selection is missing. The scan is left unchanged.
+        """
+        index = ScanIndex.build(self._path, self.fill_number, self._reader)
+        detectors, corrections = self._resolve_selection(index)
+
+        report = RefreshReport(
+            new_detectors=[detector for detector in detectors if detector not in self.detectors],
+            new_corrections=[correction for correction in corrections if correction not in self.corrections],
+        )
+        for fit in self.fits:
+            for detector in detectors:
+                for correction in corrections:
+                    key = (fit, detector, correction)
+                    if index.fit_results[key] != self._index.fit_results.get(key) \
+                        or index.sigvis_results[key] != self._index.sigvis_results.get(key):
+                        report.changes.append(key)
+
+        self._index, self._detectors, self._corrections = index, detectors, corrections
+
+        for fit in self.fits:
+            fit_changes = [(detector, correction) for changed_fit, detector, correction in report.changes if changed_fit == fit]
+            if fit_changes and self.results.is_loaded(fit):
+                self.results.store(fit, self._splice_results(fit, fit_changes))
+
+        return report
+
+    @staticmethod
+    def required_columns(strategies: Iterable[Any]) -> List[str]:
+        """Returns the result columns plotted by the given strategies.
+
+        Arguments
+        ---------
+            strategies : Iterable[Any]
+                Plot strategies of any plotter. Their `quantity`, `quantity_err`
+                and `extra_columns` fields are collected.
+
+        Returns
+        -------
+            List[str]
+                The sorted columns needed by the strategies.
+        """
+        columns: Set[str] = set()
+        for strategy in strategies:
+            columns.add(strategy.quantity)
+            columns.update(getattr(strategy, "extra_columns", ()))
+            if getattr(strategy, "quantity_err", ""):
+                columns.add(strategy.quantity_err)
+
+        return sorted(columns)
+
     @classmethod
     def get_quantity_latex(cls, quantity: str) -> str:
         """Returns the LaTeX respresentation of the quantity.
@@ -210,33 +874,97 @@ class ScanResults:
         else:
             return quantity, f"{quantity}Err"
 
-    def _get_fill_number(self) -> int:
-        result = re.match(r"^(\d)*", self._path.stem)
+    @classmethod
+    def get_fill_number(cls, path: Path) -> int:
+        """Extracts the fill number from the stem of a scan folder path.
+
+        Arguments
+        ---------
+            path : pathlib.Path
+                The path to the scan folder. Ex: .../8381_11Nov22_004152_11Nov22_010424
+
+        Returns
+        -------
+            int
+                The fill number of the scan.
+
+        Raises
+        ------
+            ValueError
+                If the fill number could not be extracted.
+        """
+        result = re.match(r"^(\d)*", path.stem)
         if not result:
-            raise ValueError(f"Could not extract fill number from path '{self._path}'.")
+            raise ValueError(f"Could not extract fill number from path '{path}'.")
 
         return int(result.group())
 
-    def _get_scan_times(self) -> Tuple[datetime, datetime]:
-        result = re.search("\d+_(\d{2}\w+\d{2}_\d{6})_(\d{2}\w+\d{2}_\d{6})", self._path.stem)
+    @classmethod
+    def get_scan_times(cls, path: Path) -> Tuple[datetime, datetime]:
+        """Extracts the start and end times from the stem of a scan folder path.
+
+        Arguments
+        ---------
+            path : pathlib.Path
+                The path to the scan folder. Ex: .../8381_11Nov22_004152_11Nov22_010424
+
+        Returns
+        -------
+            Tuple[datetime, datetime]
+                The start and end times of the scan.
+
+        Raises
+        ------
+            ValueError
+                If the scan times could not be extracted.
+        """
+        result = re.search("\d+_(\d{2}\w+\d{2}_\d{6})_(\d{2}\w+\d{2}_\d{6})", path.stem)
 
         if not result:
-            raise ValueError(f"Could not extract scan times from path '{self._path}'.")
+            raise ValueError(f"Could not extract scan times from path '{path}'.")
         
         time_start, time_end = result.groups()
 
-        start = datetime.strptime(time_start, self._timestamp_format)
-        end = datetime.strptime(time_end, self._timestamp_format)
+        start = datetime.strptime(time_start, cls._timestamp_format)
+        end = datetime.strptime(time_end, cls._timestamp_format)
 
         return start, end
 
-    def _process_fit_results(self, fit_results: List[pd.DataFrame]) -> pd.DataFrame:
-        results = pd.concat(fit_results)\
-                        .sort_index()\
-                        .pivot_table(
-                            index=["BCID", "detector", "correction"],
-                            columns="Type"
-                        ).reset_index()
+    def _get_fill_number(self) -> int:
+        return self.get_fill_number(self._path)
+
+    def _get_scan_times(self) -> Tuple[datetime, datetime]:
+        return self.get_scan_times(self._path)
+
+    @classmethod
+    def _process_fit_results(cls, fit_results: List[pd.DataFrame]) -> pd.DataFrame:
+        results = pd.concat(fit_results, ignore_index=True)
+
+        # Only numeric columns are kept, like the groupby mean of pivot_table did
+        values = [
+            column for column in results.select_dtypes("number").columns
+            if column not in cls._result_keys
+        ]
+
+        planes: Dict[str, pd.DataFrame] = {}
+        for plane, plane_results in results.groupby("Type", sort=True):
+            plane_results = plane_results.set_index(cls._result_keys)[values]
+
+            duplicated = plane_results.index.duplicated()
+            if duplicated.any():
+                raise ValueError(
+                    f"Found {duplicated.sum()} duplicated {cls._result_keys} rows in the '{plane}' plane. "
+                    f"First duplicates: {plane_results.index[duplicated][:5].tolist()}"
+                )
+
+            planes[str(plane)] = plane_results
+
+        # One keyed outer join of the planes, with the (name, plane) column layout of pivot_table
+        results = pd.concat(planes, axis=1, join="outer")\
+                    .swaplevel(axis=1)\
+                    .sort_index(axis=0)\
+                    .sort_index(axis=1)\
+                    .reset_index()
 
         results.columns = pd.Index([
             f"{name}_{plane}" if plane else name
@@ -248,16 +976,85 @@ class ScanResults:
     def _process_sigvis_results(self, sigvis_results: List[pd.DataFrame]) -> pd.DataFrame:
         results = pd.concat(sigvis_results)\
                     .sort_index()\
-                    .drop(columns=["XscanNumber_YscanNumber", "Type"])
+                    .drop(columns=["XscanNumber_YscanNumber", "Type"], errors="ignore")
 
         return results
 
-    def _collect_results(self) -> None:
+    def _resolve_selection(self, index: ScanIndex) -> Tuple[List[str], List[str]]:
+        detectors = self.detectors
         if self._iter_detectors:
-            folders = [folder.stem for folder in self._path.iterdir() if folder.is_dir()]
-            self._detectors = [folder for folder in folders if folder.startswith(self._detector_prefixes)]
+            detectors = [
+                detector for detector in index.detectors
+                if detector.startswith(self._detector_prefixes)
+            ]
 
-        for fit in self.fits:
+        corrections = self.corrections
+        if self._iter_corrections:
+            corrections = [
+                correction for correction in index.corrections(detectors)
+                if correction.startswith(self._correction_prefixes)
+            ]
+
+        missing = index.missing(self.fits, detectors, corrections)
+        if missing:
+            raise FileNotFoundError(
+                f"Missing {len(missing)} result file(s) in '{self._path}':\n\t" + "\n\t".join(missing)
+            )
+
+        return detectors, corrections
+
+    def _collect_results(self, fits: List[str]) -> Dict[str, pd.DataFrame]:
+        results: Dict[str, pd.DataFrame] = {}
+
+        cache_keys: Dict[str, str] = {}
+        if self._cache is not None:
+            for fit in fits:
+                cache_keys[fit] = self._cache.key(
+                    self._index, fit, self.detectors, self.corrections, self._columns, self._schemas)
+
+                with profiling.stage("cache_load", scan=self.id_str, fit=fit):
+                    cached_results = self._cache.load(self.id_str, fit, cache_keys[fit])
+                if cached_results is not None:
+                    results[fit] = cached_results
+
+        fits_to_read = [fit for fit in fits if fit not in results]
+        if not fits_to_read:
+            return results
+
+        if self._executor is None:
+            read_results = self._collect_results_serially(fits_to_read)
+        else:
+            read_results = self._collect_results_concurrently(fits_to_read)
+
+        if self._cache is not None:
+            for fit, fit_results in read_results.items():
+                with profiling.stage("cache_store", scan=self.id_str, fit=fit):
+                    self._cache.store(self.id_str, fit, cache_keys[fit], fit_results)
+
+        results.update(read_results)
+
+        if self._compact or self._single_precision:
+            with profiling.stage("compact", scan=self.id_str):
+                results = {fit: self._compact_results(fit_results) for fit, fit_results in results.items()}
+
+        return results
+
+    def _compact_results(self, results: pd.DataFrame) -> pd.DataFrame:
+        dtypes: Dict[str, str] = {}
+
+        if self._compact:
+            dtypes["detector"] = "category"
+            dtypes["correction"] = "category"
+            results = results.assign(BCID=pd.to_numeric(results["BCID"], downcast="integer"))
+
+        if self._single_precision:
+            dtypes.update({column: "float32" for column in results.select_dtypes("float64").columns})
+
+        return results.astype(dtypes)
+
+    def _collect_results_serially(self, fits: List[str]) -> Dict[str, pd.DataFrame]:
+        results: Dict[str, pd.DataFrame] = {}
+        for fit in fits:
             per_detector_fit_results: List[pd.DataFrame] = []
             per_detector_sigvis_results: List[pd.DataFrame] = []
 
@@ -268,21 +1065,123 @@ class ScanResults:
                 per_detector_fit_results.append(detector_fit_results)
                 per_detector_sigvis_results.append(detector_sigvis_results)
 
-            fit_results = self._process_fit_results(per_detector_fit_results)
-            sigvis_results = self._process_sigvis_results(per_detector_sigvis_results)
+            results[fit] = self._merge_results(fit, per_detector_fit_results, per_detector_sigvis_results)
+
+        return results
 
-            self.results[fit] = fit_results.merge(sigvis_results, on=["BCID", "detector", "correction"])
+    def _collect_results_concurrently(self, fits: List[str]) -> Dict[str, pd.DataFrame]:
+        assert self._executor is not None
+
+        results: Dict[str, pd.DataFrame] = {}
+        fit_futures: Dict[Tuple[str, str, str], Future] = {}
+        sigvis_futures: Dict[Tuple[str, str, str], Future] = {}
+
+        # Every (fit, detector, correction) read is submitted at once, the merge waits on them in order
+        with self._executors[self._executor](max_workers=self._max_workers) as pool:
+            for fit in fits:
+                for detector in self.detectors:
+                    for correction in self.corrections:
+                        key = (fit, detector, correction)
+                        fit_futures[key] = pool.submit(_read_result,
+                            self._reader, self._fit_result_path(*key), correction,
+                            self._read_columns, self._schemas.get("fit", fit), self._stage_tags(fit, detector))
+                        sigvis_futures[key] = pool.submit(_read_result,
+                            self._reader, self._sigvis_result_path(*key), correction,
+                            self._read_columns, self._schemas.get("sigvis", fit), self._stage_tags(fit, detector))
+
+            for fit in fits:
+                per_detector_fit_results: List[pd.DataFrame] = []
+                per_detector_sigvis_results: List[pd.DataFrame] = []
+
+                for detector in self.detectors:
+                    per_detector_fit_results.append(self._tag_detector(
+                        [fit_futures[(fit, detector, correction)].result() for correction in self.corrections],
+                        detector
+                    ))
+                    per_detector_sigvis_results.append(self._tag_detector(
+                        [sigvis_futures[(fit, detector, correction)].result() for correction in self.corrections],
+                        detector
+                    ))
+
+                results[fit] = self._merge_results(fit, per_detector_fit_results, per_detector_sigvis_results)
 
-    def _read_detector_results(self, fit: str, detector: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        if self._iter_corrections:
-            folders = [folder.stem for folder in (self._path / detector / "results").iterdir() if folder.is_dir()]
-            self._corrections = [folder for folder in folders if folder.startswith(self._correction_prefixes)]
+        return results
+
+    def _splice_results(self, fit: str, changes: List[Tuple[str, str]]) -> pd.DataFrame:
+        per_detector_fit_results: List[pd.DataFrame] = []
+        per_detector_sigvis_results: List[pd.DataFrame] = []
+
+        changed_detectors = sorted({detector for detector, _ in changes})
+        for detector in changed_detectors:
+            detector_fit_results, detector_sigvis_results = self._read_detector_results(
+                fit, detector, [correction for changed_detector, correction in changes if changed_detector == detector]
+            )
+
+            per_detector_fit_results.append(detector_fit_results)
+            per_detector_sigvis_results.append(detector_sigvis_results)
+
+        spliced_results = self._merge_results(fit, per_detector_fit_results, per_detector_sigvis_results)
+
+        results = self.results[fit]
+        changed_rows = pd.MultiIndex.from_frame(results[["detector", "correction"]].astype(str))\
+                            .isin(changes)
+
+        results = pd.concat([results[~changed_rows].astype({"detector": str, "correction": str}), spliced_results])\
+                    .sort_values(self._result_keys, kind="stable")\
+                    .reset_index(drop=True)
+
+        if self._compact or self._single_precision:
+            results = self._compact_results(results)
 
+        return results
+
+    def _merge_results(self,
+                       fit: str,
+                       fit_results: List[pd.DataFrame],
+                       sigvis_results: List[pd.DataFrame]
+                       ) -> pd.DataFrame:
+        with profiling.stage("reshape", scan=self.id_str, fit=fit):
+            processed_fit_results = self._process_fit_results(fit_results)
+            processed_sigvis_results = self._process_sigvis_results(sigvis_results)
+
+        with profiling.stage("merge", scan=self.id_str, fit=fit):
+            results = processed_fit_results.merge(processed_sigvis_results, on=self._result_keys)
+        if self._columns is not None:
+            # Reading a fit result column parses both planes, drop the ones that were not requested
+            results = results[self._result_keys + [column for column in results.columns if column in self._columns]]
+
+        return results
+
+    @classmethod
+    def _get_read_columns(cls, columns: Optional[List[str]]) -> Optional[Set[str]]:
+        if columns is None:
+            return None
+
+        # Fit result columns are stored per plane in the files: CapSigma_X is column CapSigma with Type X
+        read_columns = {"Type", *cls._result_keys, *columns}
+        for column in columns:
+            for plane in ("_X", "_Y"):
+                if column.endswith(plane):
+                    read_columns.add(column[:-len(plane)])
+
+        return read_columns
+
+    @staticmethod
+    def _tag_detector(per_correction_results: List[pd.DataFrame], detector: str) -> pd.DataFrame:
+        results = pd.concat(per_correction_results, ignore_index=True)
+        results["detector"] = detector
+
+        return results
+
+    def _read_detector_results(self,
+                               fit: str,
+                               detector: str,
+                               corrections: Optional[List[str]] = None
+                               ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         per_correction_fit_results: List[pd.DataFrame] = []
         per_correction_sigvis_results: List[pd.DataFrame] = []
 
-        assert self._corrections is not None
-        for correction in self._corrections:
+        for correction in self.corrections if corrections is None else corrections:
 
             fit_result = self._read_fit_result(fit, detector, correction)
             sigvis_result = self._read_sigvis_result(fit, detector, correction)
@@ -290,29 +1189,29 @@ class ScanResults:
             per_correction_fit_results.append(fit_result)
             per_correction_sigvis_results.append(sigvis_result)
 
-        fit_results = pd.concat(per_correction_fit_results, ignore_index=True)
-        fit_results["detector"] = detector
-
-        sigvis_results = pd.concat(per_correction_sigvis_results, ignore_index=True)
-        sigvis_results["detector"] = detector
+        fit_results = self._tag_detector(per_correction_fit_results, detector)
+        sigvis_results = self._tag_detector(per_correction_sigvis_results, detector)
 
         return fit_results, sigvis_results
 
-    def _read_fit_result(self, fit: str, detector: str, correction: str) -> pd.DataFrame:
-        fit_result_path = self._path / detector / "results" / correction / f"{fit}_FitResults.csv"
-        fit_result = pd.read_csv(fit_result_path)
+    def _fit_result_path(self, fit: str, detector: str, correction: str) -> Path:
+        return self._index.fit_result(fit, detector, correction).path
 
-        fit_result["correction"] = correction
+    def _sigvis_result_path(self, fit: str, detector: str, correction: str) -> Path:
+        return self._index.sigvis_result(fit, detector, correction).path
 
-        return fit_result
+    def _read_fit_result(self, fit: str, detector: str, correction: str) -> pd.DataFrame:
+        return _read_result(
+            self._reader, self._fit_result_path(fit, detector, correction), correction,
+            self._read_columns, self._schemas.get("fit", fit), self._stage_tags(fit, detector))
 
     def _read_sigvis_result(self, fit: str, detector: str, correction: str) -> pd.DataFrame:
-        sigvis_result_path = self._path / detector / "results" / correction / f"LumiCalibration_{detector}_{fit}_{self.fill_number}.csv"
-        sigvis_result = pd.read_csv(sigvis_result_path)
-
-        sigvis_result["correction"] = correction
+        return _read_result(
+            self._reader, self._sigvis_result_path(fit, detector, correction), correction,
+            self._read_columns, self._schemas.get("sigvis", fit), self._stage_tags(fit, detector))
 
-        return sigvis_result
+    def _stage_tags(self, fit: str, detector: str) -> Dict[str, str]:
+        return {"scan": self.id_str, "fit": fit, "detector": detector}
 
     def __str__(self) -> str:
         output =  f"Fill Results for '{self._path}':\n\t"
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import Dict, Tuple
+from typing import Optional, Collection, TYPE_CHECKING
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from plotting_vdm.readers import ReaderBackend
+
+
+class SchemaError(ValueError):
+    """Raised when a result file does not match its declared schema."""
+
+
+@dataclass(frozen=True)
+class ResultSchema:
+    """
+    The declared columns of one kind of result file.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of result file. Either "fit" ({fit}_FitResults) or "sigvis" (LumiCalibration).
+    dtypes : Dict[str, str]
+        The dtype of every known column. Passed to the parser so that the
+        types of these columns are not inferred.
+    required : Tuple[str, ...]
+        The columns every file of this kind must have.
+    allow_extra : bool
+        If False, a column that is not in dtypes is a schema error, so that renamed
+        or added columns fail fast. If True, it is parsed with type inference.
+        The schemas of DEFAULT_SCHEMAS allow extra columns, strict schemas are registered explicitly.
+    """
+    kind: str
+    dtypes: Dict[str, str]
+    required: Tuple[str, ...] = ()
+    allow_extra: bool = False
+
+    def read(self, reader: ReaderBackend, path: Path, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """Parses a result file with the declared dtypes and validates it.
+
+        Arguments
+        ---------
+            reader : ReaderBackend
+                The backend that parses the file.
+            path : pathlib.Path
+                The path to the file.
+            columns : Optional[Collection[str]]
+                Only parse the columns of the file that are in this collection. If None, every column is parsed.
+
+        Returns
+        -------
+            pd.DataFrame
+                The validated result file.
+
+        Raises
+        ------
+            SchemaError
+                If the file does not match the schema.
+        """
+        try:
+            results = reader.read(path, columns, self.dtypes)
+        except (TypeError, ValueError) as error:
+            raise SchemaError(f"'{path}' does not match the {self.kind} result dtypes: {error}") from error
+
+        return self.validate(results, path, columns)
+
+    def validate(self, results: pd.DataFrame, path: Path, columns: Optional[Collection[str]] = None) -> pd.DataFrame:
+        """Checks a parsed result file against the schema and casts its known columns.
+
+        Arguments
+        ---------
+            results : pd.DataFrame
+                The parsed result file.
+            path : pathlib.Path
+                The path to the file. Only used in error messages.
+            columns : Optional[Collection[str]]
+                The columns the file was projected onto when parsed. Required columns
+                outside of the projection are not checked. If None, every column was parsed.
+
+        Returns
+        -------
+            pd.DataFrame
+                The result file with every known column in its declared dtype.
+
+        Raises
+        ------
+            SchemaError
+                If a required column is missing, an unknown column is present and
+                extra columns are not allowed, or a column cannot be cast to its dtype.
+        """
+        required = self.required if columns is None else [column for column in self.required if column in columns]
+        missing = [column for column in required if column not in results.columns]
+        if missing:
+            raise SchemaError(f"'{path}' is missing the {self.kind} result column(s) {missing}.")
+
+        if not self.allow_extra:
+            extra = [column for column in results.columns if column not in self.dtypes]
+            if extra:
+                raise SchemaError(
+                    f"'{path}' has unexpected {self.kind} result column(s) {extra}. "
+                    f"Declare them in the schema, or register it with allow_extra=True."
+                )
+
+        mismatched = {
+            column: dtype for column, dtype in self.dtypes.items()
+            if column in results.columns and results[column].dtype != dtype
+        }
+        if mismatched:
+            try:
+                results = results.astype(mismatched)
+            except (TypeError, ValueError) as error:
+                raise SchemaError(f"'{path}' does not match the {self.kind} result dtypes: {error}") from error
+
+        return results
+
+
+@dataclass
+class SchemaRegistry:
+    """
+    The schemas of the result files, keyed by file kind and fit model.
+    A schema registered without a fit model is used for every fit model
+    that does not have its own.
+
+    Examples
+    --------
+    >>> registry = SchemaRegistry()
+    >>> registry.register(ResultSchema("sigvis", {"BCID": "int64", "xsec": "float64"}, ("BCID", "xsec")))
+    >>> registry.get("sigvis", "SG").required
+    ('BCID', 'xsec')
+    """
+    schemas: Dict[Tuple[str, Optional[str]], ResultSchema] = field(default_factory=dict)
+
+    def register(self, schema: ResultSchema, fit: Optional[str] = None) -> None:
+        """Registers the schema of one kind of result file.
+
+        Arguments
+        ---------
+            schema : ResultSchema
+                The schema to register.
+            fit : Optional[str]
+                The fit model the schema applies to. If None, it applies to every fit model
+                that has no schema of its own.
+        """
+        self.schemas[(schema.kind, fit)] = schema
+
+    def get(self, kind: str, fit: str) -> ResultSchema:
+        """Returns the schema of a kind of result file for a fit model.
+
+        Arguments
+        ---------
+            kind : str
+                The kind of result file. Either "fit" or "sigvis".
+            fit : str
+                The fit model. Ex: SG, DG
+
+        Returns
+        -------
+            ResultSchema
+                The schema of the fit model, or the default schema of the kind.
+
+        Raises
+        ------
+            SchemaError
+                If no schema is registered for the kind.
+        """
+        schema = self.schemas.get((kind, fit)) or self.schemas.get((kind, None))
+        if schema is None:
+            raise SchemaError(f"No schema registered for {kind} results of fit '{fit}'.")
+
+        return schema
+
+
+_CONST_DTYPES = {"Const": "float64", "ConstErr": "float64"}
+
+# The second gaussian of the double gaussian fits
+_DG_DTYPES = {
+    "sigmaRatio": "float64",
+    "sigmaRatioErr": "float64",
+    "fraction": "float64",
+    "fractionErr": "float64",
+}
+
+
+def _fit_result_schema(extra_dtypes: Optional[Dict[str, str]] = None) -> ResultSchema:
+    dtypes = {
+        "XscanNumber_YscanNumber": "str",
+        "Type": "str",
+        "BCID": "int64",
+        "sigma": "float64",
+        "sigmaErr": "float64",
+        "Mean": "float64",
+        "MeanErr": "float64",
+        "CapSigma": "float64",
+        "CapSigmaErr": "float64",
+        "peak": "float64",
+        "peakErr": "float64",
+        "area": "float64",
+        "areaErr": "float64",
+        "fitStatus": "int64",
+        "covStatus": "int64",
+        "chi2": "float64",
+        "ndof": "float64",
+        **(extra_dtypes or {}),
+    }
+    required = ("Type", "BCID", "CapSigma", "CapSigmaErr", "peak", "peakErr", "chi2", "ndof")
+
+    return ResultSchema("fit", dtypes, required, allow_extra=True)
+
+
+def _default_registry() -> SchemaRegistry:
+    registry = SchemaRegistry()
+
+    registry.register(_fit_result_schema())
+    registry.register(_fit_result_schema(_DG_DTYPES), "DG")
+    registry.register(_fit_result_schema(_CONST_DTYPES), "SGConst")
+    registry.register(_fit_result_schema({**_DG_DTYPES, **_CONST_DTYPES}), "DGConst")
+
+    registry.register(ResultSchema(
+        "sigvis",
+        dtypes={
+            "XscanNumber_YscanNumber": "str",
+            "Type": "str",
+            "BCID": "int64",
+            "xsec": "float64",
+            "xsecErr": "float64",
+            "SBIL": "float64",
+            "SBILErr": "float64",
+        },
+        required=("BCID", "xsec", "xsecErr"),
+        allow_extra=True,
+    ))
+
+    return registry
+
+
+DEFAULT_SCHEMAS = _default_registry()
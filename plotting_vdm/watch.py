@@ -0,0 +1,260 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any
+from typing import Union, Optional, Sequence
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import os
+import time
+import logging
+import hashlib
+
+from plotting_vdm.scan_index import ScanIndex
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.scan.base import Plotter
+from plotting_vdm.plotter.worker import snapshot_rc_params, init_render_worker
+
+
+logger = logging.getLogger(__name__)
+
+
+def _render_scan(path: Path, scan_kwargs: Dict[str, Any], plotters: Sequence[Tuple[Plotter, Sequence[Any]]]) -> str:
+    result = ScanResults(path, **scan_kwargs)
+
+    for plotter, strategies in plotters:
+        for strategy in strategies:
+            # A copy without the strategies of a multi-strategy plotter, which would all be rendered again
+            plotter.for_strategy(strategy)(result)
+
+    return result.id_str
+
+
+@dataclass
+class _ScanState:
+    signature: Optional[str] = ""
+    changed_at: float = 0.0
+    rendered_signature: Optional[str] = ""
+    future: Optional[Future] = None
+    stamp: Optional[Tuple[Tuple[str, int], ...]] = None
+
+
+@dataclass
+class ScanWatcher:
+    """
+    Polls an analysed_data root and renders the plots of every scan that is new or
+    was updated, once its result files are complete and have stopped changing.
+
+    Only the directory listings are polled, so no inotify or external service is needed.
+    Each scan is rendered in a bounded process pool running the headless Agg backend
+    with the rcParams of the watching process.
+
+    The result files of a rendered scan are only listed again when the modification time
+    of its folder, or of one of its detector or correction folders, changes. Adding, removing
+    or renaming a result file changes them, so polling a tree of scans that were rendered
+    long ago stats a few folders per scan instead of every result file.
+
+    Parameters
+    ----------
+    root : Union[pathlib.Path,str]
+        The analysed_data directory containing one folder per scan.
+    fits : List[str]
+        The fits a scan must contain to be complete, and that are plotted.
+    plotters : Sequence[Tuple[Plotter, Sequence[Any]]]
+        The plotters to run on each scan, each with the strategies to run it with.
+    scan_kwargs : Dict[str, Any]
+        Forwarded to every ScanResults. Ex: detectors, corrections, energy, cache.
+    settle_time : float
+        The number of seconds a scan's files must stay unchanged before it is rendered.
+        Debounces scans that are still being written.
+    poll_interval : float
+        The number of seconds between two polls of the root.
+    max_workers : int
+        The number of scans rendered at the same time.
+    since : Optional[datetime]
+        Only scans starting at or after this time are watched. If None, every scan is watched.
+    render_existing : bool
+        If False, the scans that are already complete on the first poll are not rendered.
+
+    Examples
+    --------
+    >>> watcher = ScanWatcher(
+    ...     "<path-to>/output/analysed_data",
+    ...     fits=["SG", "DG"],
+    ...     plotters=[
+    ...         (NormalPlotter(config), [CapSigmaXNormalPlotStrategy(), SigVisNormalPlotStrategy()]),
+    ...         (RatioPlotter("HFOC", config), [CapSigmaXRatioPlotStrategy()]),
+    ...     ],
+    ...     since=datetime(2022, 11, 11),
+    ... )
+    >>> watcher.run()
+    """
+    root: Union[Path, str]
+    fits: List[str]
+    plotters: Sequence[Tuple[Plotter, Sequence[Any]]]
+    scan_kwargs: Dict[str, Any] = field(default_factory=dict)
+    settle_time: float = 10.0
+    poll_interval: float = 2.0
+    max_workers: int = 2
+    since: Optional[datetime] = None
+    render_existing: bool = False
+
+    def __post_init__(self):
+        self.root = Path(self.root).absolute()
+        self._states: Dict[str, _ScanState] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._first_poll = True
+        self._running = False
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """Polls the root until `stop` is called or the duration has elapsed.
+
+        Arguments
+        ---------
+            duration : Optional[float]
+                The number of seconds to watch for. If None, watch until stopped.
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+
+        self._running = True
+        try:
+            while self._running and (deadline is None or time.monotonic() < deadline):
+                self.poll()
+                time.sleep(self.poll_interval)
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def close(self) -> None:
+        """Waits for the scans being rendered and shuts down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def poll(self) -> List[str]:
+        """Polls the root once and submits every scan that became ready.
+
+        Returns
+        -------
+            List[str]
+                The ids of the scans submitted for rendering.
+        """
+        now = time.monotonic()
+        submitted: List[str] = []
+
+        for folder in os.scandir(self.root):
+            if not folder.is_dir() or not self._is_watched(Path(folder.path)):
+                continue
+
+            state = self._states.setdefault(folder.name, _ScanState())
+            if state.future is not None and not state.future.done():
+                continue
+
+            # Rendered scans whose folders did not change keep their signature
+            stamp = self._stamp(Path(folder.path))
+            if stamp is not None and stamp == state.stamp and state.signature == state.rendered_signature:
+                continue
+
+            state.stamp = stamp
+            signature = self._signature(Path(folder.path))
+            if signature != state.signature:
+                state.signature = signature
+                state.changed_at = now
+
+                # Scans already complete when watching starts count as rendered
+                if self._first_poll and not self.render_existing:
+                    state.rendered_signature = signature
+                continue
+
+            if signature is None or signature == state.rendered_signature:
+                continue
+
+            if now - state.changed_at < self.settle_time:
+                continue
+
+            state.rendered_signature = signature
+            state.future = self._submit(Path(folder.path))
+            submitted.append(folder.name)
+
+        self._first_poll = False
+        return submitted
+
+    def _is_watched(self, path: Path) -> bool:
+        try:
+            start, _ = ScanResults.get_scan_times(path)
+        except ValueError:
+            return False
+
+        return self.since is None or start >= self.since
+
+    @staticmethod
+    def _stamp(path: Path) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """Lists the modification times of a scan folder and of its detector, results and correction folders."""
+        try:
+            stamp = [("", path.stat().st_mtime_ns)]
+            for detector_entry in os.scandir(path):
+                results_path = Path(detector_entry.path) / "results"
+                if not detector_entry.is_dir() or not results_path.is_dir():
+                    continue
+
+                stamp.append((detector_entry.name, results_path.stat().st_mtime_ns))
+                stamp.extend(
+                    (f"{detector_entry.name}/{correction_entry.name}", correction_entry.stat().st_mtime_ns)
+                    for correction_entry in os.scandir(results_path) if correction_entry.is_dir()
+                )
+        except OSError:
+            return None
+
+        return tuple(sorted(stamp))
+
+    def _signature(self, path: Path) -> Optional[str]:
+        """Hashes the result files of a scan. None if the scan is not complete yet."""
+        try:
+            index = ScanIndex.build(path, ScanResults.get_fill_number(path), self.scan_kwargs.get("reader"))
+        except (OSError, ValueError):
+            return None
+
+        detectors = self.scan_kwargs.get("detectors") or [
+            detector for detector in index.detectors
+            if detector.startswith(ScanResults._detector_prefixes)
+        ]
+        corrections = self.scan_kwargs.get("corrections") or [
+            correction for correction in index.corrections(detectors)
+            if correction.startswith(ScanResults._correction_prefixes)
+        ]
+        if not detectors or not corrections or index.missing(self.fits, detectors, corrections):
+            return None
+
+        files = sorted(
+            (str(result_file.path), result_file.size, result_file.mtime_ns)
+            for result_file in (*index.fit_results.values(), *index.sigvis_results.values())
+        )
+
+        return hashlib.sha1(repr(files).encode()).hexdigest()
+
+    def _submit(self, path: Path) -> Future:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_render_worker,
+                initargs=(snapshot_rc_params(),),
+            )
+
+        logger.info("Rendering scan '%s'", path.name)
+
+        scan_kwargs = dict(self.scan_kwargs, fits=self.fits)
+        future = self._pool.submit(_render_scan, path, scan_kwargs, self.plotters)
+        future.add_done_callback(self._log_result)
+
+        return future
+
+    @staticmethod
+    def _log_result(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.error("Rendering failed", exc_info=error)
+        else:
+            logger.info("Rendered scan '%s'", future.result())
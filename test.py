@@ -3,23 +3,24 @@ from pathlib import Path
 import matplotlib
 import matplotlib.pyplot as plt
 
-from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.catalog import ScanCatalog
 from plotting_vdm.plotter.config import PlotterCongig, EvoPlotterConfig
 from plotting_vdm.plotter.scan.ratio import *
 from plotting_vdm.plotter.scan.normal import *
 from plotting_vdm.plotter.scan.corr import *
+from plotting_vdm.plotter.scan.comparison import *
 from plotting_vdm.plotter.evo import *
 
 
 matplotlib.style.use("classic")
 plt.rcParams["legend.numpoints"] = 1
 
-path = Path("/home/fabiocfabini/Desktop/CS/plotting-vdm/analysed_data/").glob("8381*")
+catalog = ScanCatalog("/home/fabiocfabini/Desktop/CS/plotting-vdm/analysed_data/")
 
 fits=["SG", "DG"]
 names = ["vdM1", "BI1", "BI2", "vdM2", "vdM3", "vdM4"]
-results = [ScanResults(path, fits=fits, name=name) for name, path in zip(names, path)]
-results.sort(key=lambda scan: scan.start)
+catalog.name_scans(8381, names)
+results = catalog.load(catalog.select(fills=[8381]), fits=fits)
 
 
 config = PlotterCongig(Path("plots_final"))
@@ -33,20 +34,25 @@ bcid_strategies: list[NormalPlotStrategy] = [
     SigVisNormalPlotStrategy(),
     SBILNormalPlotStrategy(),
 ]
-for bcid_strategy in bcid_strategies:
-    bcid_plotter.plot_strategy = bcid_strategy
-
-    bcid_plotter.plot_many(results)
+bcid_plotter.set_strategies(bcid_strategies)
+bcid_plotter.plot_many(results)
 
 ratio_plotter = RatioPlotter("HFOC", config)
 ratio_strategies: list[RatioPlotStrategy] = [
     CapSigmaXRatioPlotStrategy(),
     CapSigmaYRatioPlotStrategy(),
 ]
-for ratio_strategy in ratio_strategies:
-    ratio_plotter.plot_strategy = ratio_strategy
-
-    ratio_plotter.plot_many(results)
+ratio_plotter.set_strategies(ratio_strategies)
+ratio_plotter.plot_many(results)
+
+comparison_plotter = ComparisonPlotter(config)
+comparison_strategies: list[ComparisonPlotStrategy] = [
+    CapSigmaXComparisonPlotStrategy(),
+    CapSigmaYComparisonPlotStrategy(),
+    SigVisComparisonPlotStrategy(),
+]
+comparison_plotter.set_strategies(comparison_strategies)
+comparison_plotter.plot_many(results)
 
 corr_plotter = CorrPlotter("Background", config)
 corr_strategies: list[CorrPlotStrategy] = [
@@ -55,11 +61,12 @@ corr_strategies: list[CorrPlotStrategy] = [
     PeakXCorrPlotStrategy(),
     PeakYCorrPlotStrategy(),
     SigVisCorrPlotStrategy(),
+    CapSigmaXCorrWaterfallPlotStrategy(),
+    CapSigmaYCorrWaterfallPlotStrategy(),
+    SigVisCorrWaterfallPlotStrategy(),
 ]
-for corr_strategy in corr_strategies:
-    corr_plotter.plot_strategy = corr_strategy
-
-    corr_plotter.plot_many(results)
+corr_plotter.set_strategies(corr_strategies)
+corr_plotter.plot_many(results)
 
 evo_config = EvoPlotterConfig(Path("plots_final"), xticks=names)
 evo_strategies: list[EvoPlotStrategy] = [
@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.synthetic import generate
+
+
+@pytest.fixture(scope="session")
+def scan_paths(tmp_path_factory):
+    """Three synthetic scans with 3 detectors, 5 corrections and the SG fit."""
+    root = tmp_path_factory.mktemp("analysed_data")
+    return generate(root, n_scans=3, n_detectors=3, n_corrections=5, fits=["SG"], n_bcids=40)
@@ -0,0 +1,52 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.cache import ResultsCache
+from plotting_vdm.scan_results import ScanResults
+
+
+@pytest.fixture
+def scan_path(scan_paths, tmp_path):
+    return shutil.copytree(scan_paths[0], tmp_path/scan_paths[0].name)
+
+
+def load(path, cache, **kwargs):
+    return ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:3], cache=cache, lazy=False, **kwargs)
+
+
+def test_warm_loads_match_cold_loads(scan_path, tmp_path, monkeypatch):
+    cache = ResultsCache(tmp_path/"cache")
+    cold = load(scan_path, cache).results["SG"]
+
+    # A warm load must not parse any result file
+    monkeypatch.setattr(ScanResults, "_collect_results_serially", lambda *args: pytest.fail("read a result file"))
+    warm = load(scan_path, cache).results["SG"]
+
+    pd.testing.assert_frame_equal(warm, cold)
+
+
+def test_selections_are_cached_side_by_side(scan_path, tmp_path):
+    cache = ResultsCache(tmp_path/"cache")
+    full = load(scan_path, cache).results["SG"]
+    projected = load(scan_path, cache, columns=["CapSigma_X", "CapSigmaErr_X"]).results["SG"]
+
+    assert len(list((tmp_path/"cache").rglob("SG-*"))) == 2
+    pd.testing.assert_frame_equal(load(scan_path, cache).results["SG"], full)
+    pd.testing.assert_frame_equal(load(scan_path, cache, columns=["CapSigma_X", "CapSigmaErr_X"]).results["SG"], projected)
+
+
+def test_changed_source_files_are_read_again(scan_path, tmp_path):
+    cache = ResultsCache(tmp_path/"cache")
+    before = load(scan_path, cache).results["SG"]
+
+    path = scan_path/DETECTORS[0]/"results"/CORRECTIONS[0]/"SG_FitResults.csv"
+    pd.read_csv(path).assign(CapSigma=1.0).to_csv(path, index=False)
+
+    after = load(scan_path, cache).results["SG"]
+    changed = (after["detector"] == DETECTORS[0]) & (after["correction"] == CORRECTIONS[0])
+
+    assert (after.loc[changed, "CapSigma_X"] == 1.0).all()
+    assert (before.loc[changed, "CapSigma_X"] != 1.0).all()
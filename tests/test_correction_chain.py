@@ -0,0 +1,97 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.correction_chain import CorrectionChain
+from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.scan.corr import CorrPlotter, CapSigmaXCorrPlotStrategy, CapSigmaXCorrWaterfallPlotStrategy
+
+
+@pytest.fixture(scope="module")
+def result(scan_paths):
+    return ScanResults(scan_paths[0], ["SG"], DETECTORS[:3], CORRECTIONS, name="scan", lazy=False)
+
+
+def test_waterfall_jobs_skip_the_base_correction(result, tmp_path):
+    plotter = CorrPlotter("Background", PlotterCongig(tmp_path), CapSigmaXCorrWaterfallPlotStrategy())
+    plotter.plot(result)
+
+    corrections = CORRECTIONS[2:]
+    assert [job.correction for job in plotter.jobs(result)] == corrections
+    assert sorted(path.name for path in tmp_path.rglob("*.png")) == sorted(f"X_SG_{correction}.png" for correction in corrections)
+
+    plotter.plot_strategy = CapSigmaXCorrPlotStrategy()
+    assert [job.correction for job in plotter.jobs(result)] == CORRECTIONS[1:]
+
+
+def legacy_reference_correction(correction, applied_corrections, base):
+    """The reference correction walk CorrPlotter used before CorrectionChain."""
+    keep_looking = True
+    tmp_corr = correction
+    while keep_looking:
+        if len(tmp_corr.split("_")) != 1:
+            ref_corr = tmp_corr.replace("_" + tmp_corr.split("_")[-1], "")
+        else:
+            ref_corr = base
+        if ref_corr in applied_corrections:
+            keep_looking = False
+        else:
+            tmp_corr = ref_corr
+
+    return ref_corr
+
+
+CANDIDATES = ["noCorr", *CORRECTIONS[1:], "Background_DynamicBeta", "Background_BeamBeam_LengthScale"]
+
+
+@pytest.mark.parametrize("size", range(1, 5))
+def test_parents_match_the_reference_correction_walk(size):
+    for others in combinations(CANDIDATES[2:], size):
+        applied = ["noCorr", "Background", *others]
+        chain = CorrectionChain.build(applied, "Background")
+
+        for correction in applied:
+            assert chain.parent(correction) == legacy_reference_correction(correction, applied, "Background")
+
+            lineage = chain.lineage(correction)
+            assert lineage[-1] == "Background"
+            assert all(chain.parent(child) == parent for child, parent in zip(lineage, lineage[1:]))
+
+
+def test_chain_requires_the_base_correction():
+    with pytest.raises(ValueError):
+        CorrectionChain.build(["noCorr", "Background_BeamBeam"], "Background")
+
+
+def test_effects_match_the_aligned_slices(result):
+    effects = result.get_correction_effects("SG", "CapSigma_X", "CapSigmaErr_X", "Background")
+
+    for detector in result.detectors:
+        for correction, parent in effects.chain.steps():
+            data, ref = result.get_aligned_slices("SG", detector, correction, detector, parent)
+            effect = (data["CapSigma_X"] / ref["CapSigma_X"] - 1) * 100
+            error = np.abs(effect) * np.sqrt(
+                (data["CapSigmaErr_X"] / data["CapSigma_X"])**2 + (ref["CapSigmaErr_X"] / ref["CapSigma_X"])**2
+            )
+
+            bcids, values, errors = effects.detector(detector, correction)
+            np.testing.assert_array_equal(bcids, data["BCID"])
+            np.testing.assert_array_equal(values, effect)
+            np.testing.assert_array_equal(errors, error)
+
+
+def test_waterfall_contributions_add_up_to_the_cumulative_effect(result):
+    effects = result.get_correction_effects("SG", "CapSigma_X", "CapSigmaErr_X", "Background")
+    base = result.get_slice("SG", DETECTORS[0], "Background")
+
+    for correction in CORRECTIONS[2:]:
+        waterfall = effects.waterfall(DETECTORS[0], correction)
+        data = result.get_slice("SG", DETECTORS[0], correction)
+        cumulative = ((data["CapSigma_X"].to_numpy() / base["CapSigma_X"].to_numpy() - 1) * 100).mean()
+
+        assert list(waterfall["correction"]) == effects.chain.lineage(correction)[-2::-1]
+        assert waterfall["contribution"].sum() == pytest.approx(cumulative)
+        assert waterfall["cumulative"].iloc[-1] == pytest.approx(cumulative)
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.evolution import ScanEvolution, StreamingEvolution, ScanStatsReducer, mean_std, weighted_mean
+
+
+@pytest.fixture(scope="module")
+def results(scan_paths):
+    return [
+        ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:3], name=f"scan{i}", lazy=False)
+        for i, path in enumerate(scan_paths)
+    ]
+
+
+def per_scan(results, correction, detector, scan_stats):
+    """The statistic of each scan, computed one slice at a time like EvoPlotStrategy did."""
+    stats = []
+    for result in results:
+        data = result.results["SG"].query(f"detector == '{detector}' and correction == '{correction}'")
+        stats.append(scan_stats(data["xsec"], data["xsecErr"]))
+
+    return np.array(stats).T
+
+
+def inverse_variance(value, error):
+    weights = 1 / error**2
+    return (weights * value).sum() / weights.sum(), 1 / np.sqrt(weights.sum())
+
+
+@pytest.mark.parametrize("reducer, scan_stats", [
+    (mean_std, lambda value, _: (value.mean(), value.std())),
+    (weighted_mean, inverse_variance),
+    (ScanStatsReducer(lambda value, error: (value.median(), error.max())), lambda value, error: (value.median(), error.max())),
+], ids=["mean_std", "weighted_mean", "scan_stats"])
+def test_series_match_the_per_scan_statistics(results, reducer, scan_stats):
+    evolution = ScanEvolution(results)
+
+    for correction in CORRECTIONS[:3]:
+        for detector in DETECTORS[:3]:
+            avg, err = evolution.series("SG", correction, detector, "xsec", "xsecErr", reducer)
+            expected_avg, expected_err = per_scan(results, correction, detector, scan_stats)
+
+            np.testing.assert_allclose(avg, expected_avg, rtol=1e-12)
+            np.testing.assert_allclose(err, expected_err, rtol=1e-12)
+
+
+def test_missing_slices_are_nan(results):
+    avg, err = ScanEvolution(results).series("SG", "noCorr", "unknown", "xsec", "xsecErr")
+
+    assert len(avg) == len(results)
+    assert np.isnan(avg).all() and np.isnan(err).all()
+
+
+def test_table_names_the_scans(results):
+    table = ScanEvolution(results).table(["SG"], "xsec", "xsecErr")
+
+    assert list(table.columns) == ["fit", "correction", "detector", "scan", "scan_name", "avg", "err"]
+    assert len(table) == len(results) * 3 * 3
+    assert (table["scan_name"] == table["scan"].map(lambda scan: f"scan{scan}")).all()
+
+
+def test_streaming_evolution_matches_the_scan_evolution(results, scan_paths):
+    specs = [("xsec", "xsecErr", mean_std), ("CapSigma_X", "CapSigmaErr_X", weighted_mean)]
+    streaming = StreamingEvolution.build(
+        iter(scan_paths), specs, fits=["SG"], detectors=DETECTORS[:3], corrections=CORRECTIONS[:3]
+    )
+    evolution = ScanEvolution(results)
+
+    assert [summary.id_str for summary in streaming.results] == [result.id_str for result in results]
+    for quantity, quantity_err, reducer in specs:
+        pd.testing.assert_frame_equal(
+            streaming.stats("SG", quantity, quantity_err, reducer).sort_index(),
+            evolution.stats("SG", quantity, quantity_err, reducer).sort_index(),
+        )
+        for correction in CORRECTIONS[:3]:
+            for detector in DETECTORS[:3]:
+                np.testing.assert_array_equal(
+                    streaming.series("SG", correction, detector, quantity, quantity_err, reducer),
+                    evolution.series("SG", correction, detector, quantity, quantity_err, reducer),
+                )
+
+
+def test_streaming_evolution_only_keeps_its_specs(scan_paths):
+    streaming = StreamingEvolution.build(scan_paths[:1], [("xsec", "xsecErr", mean_std)], fits=["SG"])
+
+    with pytest.raises(ValueError):
+        streaming.stats("SG", "xsec", "xsecErr", weighted_mean)
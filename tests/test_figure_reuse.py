@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import Dict
+
+import hashlib
+
+import matplotlib
+import pytest
+
+from benchmarks.synthetic import generate, DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.config import PlotterCongig, EvoPlotterConfig
+from plotting_vdm.plotter.scan.normal import NormalPlotter, CapSigmaXNormalPlotStrategy, PeakXNormalPlotStrategy
+from plotting_vdm.plotter.scan.ratio import RatioPlotter, CapSigmaXRatioPlotStrategy
+from plotting_vdm.plotter.scan.corr import (
+    CorrPlotter,
+    CapSigmaXCorrPlotStrategy,
+    SigVisCorrPlotStrategy,
+    CapSigmaXCorrWaterfallPlotStrategy,
+    SigVisCorrWaterfallPlotStrategy,
+)
+from plotting_vdm.plotter.evo import EvoPlotter, CapSigmaXEvoPlotStrategy, SigVisEvoPlotStrategy
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+    root = tmp_path_factory.mktemp("analysed_data")
+    paths = generate(root, n_scans=2, n_detectors=3, n_corrections=5, fits=["SG"], n_bcids=40)
+
+    return [
+        ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:5], name=f"scan{i}", lazy=False)
+        for i, path in enumerate(paths)
+    ]
+
+
+def render(results, output_dir: Path, reuse: bool, multi: bool) -> Dict[str, str]:
+    config = PlotterCongig(output_dir, reuse_figure=reuse)
+
+    # The waterfall strategies come first so that the BCID plots of the same plotter follow them
+    plotters = [
+        (CorrPlotter("Background", config), [
+            CapSigmaXCorrWaterfallPlotStrategy(),
+            CapSigmaXCorrPlotStrategy(),
+            SigVisCorrWaterfallPlotStrategy(),
+            SigVisCorrPlotStrategy(),
+        ]),
+        (NormalPlotter(config), [PeakXNormalPlotStrategy(), CapSigmaXNormalPlotStrategy()]),
+        (RatioPlotter("HFOC", config), [CapSigmaXRatioPlotStrategy()]),
+    ]
+    for plotter, strategies in plotters:
+        if multi:
+            plotter.set_strategies(strategies)
+            plotter.plot_many(results)
+            continue
+
+        for strategy in strategies:
+            plotter.plot_strategy = strategy
+            plotter.plot_many(results)
+
+    evo_plotter = EvoPlotter(EvoPlotterConfig(output_dir, xticks=[result.name for result in results], reuse_figure=reuse))
+    for strategy in [SigVisEvoPlotStrategy(), CapSigmaXEvoPlotStrategy()]:
+        evo_plotter.plot_strategy = strategy
+        evo_plotter(results)
+
+    return {
+        str(path.relative_to(output_dir)): hashlib.md5(path.read_bytes()).hexdigest()
+        for path in sorted(output_dir.rglob("*.png"))
+    }
+
+
+@pytest.mark.parametrize("multi", [False, True])
+def test_reused_figures_are_byte_identical(results, tmp_path, multi):
+    with matplotlib.style.context("classic"):
+        fresh = render(results, tmp_path / "fresh", reuse=False, multi=multi)
+        reused = render(results, tmp_path / "reused", reuse=True, multi=multi)
+
+    assert fresh
+    assert reused == fresh
@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.synthetic import generate, DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.config import PlotterCongig
+from plotting_vdm.plotter.manifest import RenderManifest
+from plotting_vdm.plotter.scan.comparison import ComparisonPlotter, CapSigmaXComparisonPlotStrategy
+
+
+@pytest.fixture(scope="module")
+def result(tmp_path_factory):
+    root = tmp_path_factory.mktemp("analysed_data")
+    path, = generate(root, n_scans=1, n_detectors=3, n_corrections=2, fits=["SG"], n_bcids=20)
+
+    return ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:2], name="scan", lazy=False)
+
+
+def test_manifest_lists_and_restores_comparison_tables(result, tmp_path):
+    manifest = RenderManifest.load(tmp_path/"manifest.json")
+    plotter = ComparisonPlotter(PlotterCongig(tmp_path, manifest=manifest), CapSigmaXComparisonPlotStrategy())
+    plotter.plot(result)
+
+    files = sorted(path.name for path in RenderManifest.load(manifest.path).files())
+    assert files == ["X_SG_Background.csv", "X_SG_Background.png", "X_SG_noCorr.csv", "X_SG_noCorr.png"]
+
+    # A deleted table is written again even though its plot is up to date
+    table = next(path for path in manifest.files() if path.suffix == ".csv")
+    table.unlink()
+    plotter.plot(result)
+
+    assert table.is_file()
@@ -0,0 +1,19 @@
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.plotter.config import PlotterCongig, EvoPlotterConfig
+from plotting_vdm.plotter.planner import RenderPlanner
+from plotting_vdm.plotter.scan.normal import NormalPlotter, CapSigmaXNormalPlotStrategy
+from plotting_vdm.plotter.evo import EvoPlotter, CapSigmaXEvoPlotStrategy
+
+
+def test_units_of_unnamed_scans_are_named_by_id(scan_paths, tmp_path):
+    results = [ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:2]) for path in scan_paths[:2]]
+    planner = RenderPlanner([
+        (NormalPlotter(PlotterCongig(tmp_path)), [CapSigmaXNormalPlotStrategy()]),
+        (EvoPlotter(EvoPlotterConfig(tmp_path)), [CapSigmaXEvoPlotStrategy()]),
+    ])
+
+    names = sorted(unit.name for unit in planner.plan(results).units)
+
+    ids = [result.id_str for result in results]
+    assert names == sorted([f"{ids[0]}/SG", f"{ids[1]}/SG", f"{ids[0]}+{ids[1]}/SG"])
@@ -0,0 +1,114 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.ratios import BCIDMatrix, ComparisonMatrix
+
+
+def comparison_of(values, errors) -> ComparisonMatrix:
+    values, errors = np.asarray(values, dtype=float), np.asarray(errors, dtype=float)
+    n_bcids, n_detectors = values.shape
+
+    frame = pd.DataFrame({
+        "BCID": np.tile(np.arange(n_bcids), n_detectors),
+        "value": values.T.ravel(),
+        "error": errors.T.ravel(),
+    })
+    positions = {f"D{j}": np.arange(j * n_bcids, (j + 1) * n_bcids) for j in range(n_detectors)}
+    matrix = BCIDMatrix.build(frame, positions, list(positions), ["value", "error"])
+
+    return ComparisonMatrix.from_matrix(matrix, "value", "error")
+
+
+def test_weighted_mean_weights_the_error_of_the_ratio():
+    # The ratio of the first BCID is 0, its weight must still come from the errors of both detectors
+    comparison = comparison_of([[10.0, 10.0], [11.0, 10.0], [9.0, 10.0]], [[0.1, 0.1], [0.2, 0.1], [0.1, 0.2]])
+
+    ratios = np.array([0.0, 10.0, -10.0])
+    errors = np.array([
+        1.0 * np.hypot(0.1 / 10, 0.1 / 10),
+        1.1 * np.hypot(0.2 / 11, 0.1 / 10),
+        0.9 * np.hypot(0.1 / 9, 0.2 / 10),
+    ]) * 100
+    weights = 1 / errors**2
+
+    assert comparison.statistic("weighted_mean")[0, 1] == pytest.approx((weights * ratios).sum() / weights.sum())
+    assert comparison.statistic("weighted_mean_err")[0, 1] == pytest.approx(1 / np.sqrt(weights.sum()))
+    assert comparison.statistic("mean")[0, 1] == pytest.approx(0.0)
+    assert comparison.statistic("n_bcids")[0, 1] == 3
+
+
+def test_ratio_table_keeps_the_ratio_errors():
+    comparison = comparison_of([[10.0, 10.0], [11.0, 10.0]], [[0.1, 0.1], [0.2, 0.1]])
+
+    _, ratio, error = comparison.ratio_table("D1").detector("D0")
+
+    np.testing.assert_allclose(ratio, [0.0, 10.0])
+    np.testing.assert_allclose(error, [0.0, 10.0 * np.hypot(0.2 / 11, 0.1 / 10)])
+
+
+@pytest.fixture(scope="module")
+def result(scan_paths, tmp_path_factory):
+    """A scan in which the first detector missed some BCIDs."""
+    path = shutil.copytree(scan_paths[0], tmp_path_factory.mktemp("ratios")/scan_paths[0].name)
+    for result_file in (path/DETECTORS[0]/"results").rglob("*.csv"):
+        frame = pd.read_csv(result_file)
+        frame[frame["BCID"] % 3 != 0].to_csv(result_file, index=False)
+
+    return ScanResults(path, ["SG"], DETECTORS[:3], CORRECTIONS[:2], lazy=False)
+
+
+def legacy_ratio(result, correction, quantity, quantity_err, detector, reference):
+    frame = result.results["SG"]
+    data = frame.query(f"detector == '{detector}' and correction == '{correction}'")
+    ref = frame.query(f"detector == '{reference}' and correction == '{correction}'")
+
+    bcid_filter = np.intersect1d(ref["BCID"], data["BCID"])
+    data = data[data["BCID"].isin(bcid_filter)].reset_index(drop=True)
+    ref = ref[ref["BCID"].isin(bcid_filter)].reset_index(drop=True)
+
+    ratio = (data[quantity] / ref[quantity] - 1) * 100
+    ratio_err = np.abs(ratio) * np.sqrt((data[quantity_err] / data[quantity])**2 + (ref[quantity_err] / ref[quantity])**2)
+
+    return data["BCID"].to_numpy(), ratio.to_numpy(), ratio_err.to_numpy()
+
+
+@pytest.mark.parametrize("reference", DETECTORS[:3])
+def test_ratio_table_matches_the_per_detector_ratios(result, reference):
+    for correction in result.corrections:
+        table = result.get_ratio_table("SG", correction, "CapSigma_X", "CapSigmaErr_X", reference)
+        assert table.mask.sum(axis=0).min() < len(table.bcids)
+
+        for detector in result.detectors:
+            bcids, ratio, error = table.detector(detector)
+            legacy_bcids, legacy_ratio_values, legacy_error = legacy_ratio(
+                result, correction, "CapSigma_X", "CapSigmaErr_X", detector, reference
+            )
+
+            np.testing.assert_array_equal(bcids, legacy_bcids)
+            np.testing.assert_array_equal(ratio, legacy_ratio_values)
+            np.testing.assert_array_equal(error, legacy_error)
+
+
+def test_comparison_matrix_matches_the_per_detector_ratios(result):
+    for correction in result.corrections:
+        comparison = result.get_comparison_matrix("SG", correction, "CapSigma_X", "CapSigmaErr_X")
+        n_bcids, mean, std = (comparison.statistic(name) for name in ("n_bcids", "mean", "std"))
+
+        for j, reference in enumerate(result.detectors):
+            table = comparison.ratio_table(reference)
+            for i, detector in enumerate(result.detectors):
+                _, legacy_ratio_values, legacy_error = legacy_ratio(
+                    result, correction, "CapSigma_X", "CapSigmaErr_X", detector, reference
+                )
+                _, ratio, error = table.detector(detector)
+
+                np.testing.assert_array_equal(ratio, legacy_ratio_values)
+                np.testing.assert_array_equal(error, legacy_error)
+                assert n_bcids[i, j] == len(legacy_ratio_values)
+                assert mean[i, j] == pytest.approx(legacy_ratio_values.mean(), abs=1e-12)
+                assert std[i, j] == pytest.approx(legacy_ratio_values.std(), abs=1e-12)
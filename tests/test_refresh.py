@@ -0,0 +1,56 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+
+
+def sorted_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.sort_values(["detector", "correction", "BCID"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def live_scan(scan_paths, tmp_path):
+    """A copy of a scan whose last correction has not been written yet."""
+    path = shutil.copytree(scan_paths[0], tmp_path/scan_paths[0].name)
+    pending = tmp_path/"pending"
+    for detector in DETECTORS[:3]:
+        shutil.move(path/detector/"results"/CORRECTIONS[-1], pending/detector)
+
+    return path, pending
+
+
+def test_refresh_matches_a_fresh_load(live_scan):
+    path, pending = live_scan
+    result = ScanResults(path, ["SG"], lazy=False)
+    assert CORRECTIONS[-1] not in result.corrections
+
+    for detector in DETECTORS[:3]:
+        shutil.move(pending/detector, path/detector/"results"/CORRECTIONS[-1])
+    modified = path/DETECTORS[1]/"results"/CORRECTIONS[0]/"SG_FitResults.csv"
+    pd.read_csv(modified).assign(peak=0.5).to_csv(modified, index=False)
+
+    report = result.refresh()
+
+    assert report.new_corrections == [CORRECTIONS[-1]]
+    assert sorted(report.changes) == sorted(
+        [("SG", DETECTORS[1], CORRECTIONS[0])] + [("SG", detector, CORRECTIONS[-1]) for detector in DETECTORS[:3]]
+    )
+
+    fresh = ScanResults(path, ["SG"], lazy=False)
+    assert result.corrections == fresh.corrections
+    pd.testing.assert_frame_equal(
+        sorted_frame(result.results["SG"])[fresh.results["SG"].columns], sorted_frame(fresh.results["SG"]),
+        check_categorical=False,
+    )
+
+
+def test_refresh_without_changes_keeps_the_results(live_scan):
+    path, _ = live_scan
+    result = ScanResults(path, ["SG"], lazy=False)
+    frame = result.results["SG"]
+
+    assert not result.refresh()
+    assert result.results["SG"] is frame
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate, DETECTORS, CORRECTIONS
+from plotting_vdm.scan_results import ScanResults
+from plotting_vdm.readers import CSVReader, ArrowCSVReader
+from plotting_vdm.schema import DEFAULT_SCHEMAS, ResultSchema, SchemaRegistry, SchemaError
+
+
+@pytest.fixture
+def scan_path(tmp_path):
+    path, = generate(tmp_path, n_scans=1, n_detectors=2, n_corrections=1, fits=["SG", "DG"], n_bcids=10)
+    return path
+
+
+@pytest.mark.parametrize("reader", [CSVReader(), ArrowCSVReader()], ids=["csv", "arrow"])
+def test_default_schemas_parse_unknown_columns(scan_path, reader):
+    path = next(scan_path.rglob("DG_FitResults.csv"))
+    pd.read_csv(path).assign(newTerm=1.5).to_csv(path, index=False)
+
+    result = ScanResults(scan_path, ["SG", "DG"], DETECTORS[:2], CORRECTIONS[:1], reader=reader, lazy=False)
+    dg = result.results["DG"]
+
+    assert {"sigmaRatio_X", "fraction_Y", "newTerm_X"} <= set(dg.columns)
+    assert dg["fitStatus_X"].dtype == "int64"
+    assert dg["covStatus_Y"].dtype == "int64"
+    assert dg["newTerm_X"].dtype == "float64"
+
+
+def test_strict_schemas_reject_unknown_columns(scan_path):
+    path = next(scan_path.rglob("DG_FitResults.csv"))
+    pd.read_csv(path).assign(newTerm=1.5).to_csv(path, index=False)
+
+    schemas = SchemaRegistry(dict(DEFAULT_SCHEMAS.schemas))
+    dg = DEFAULT_SCHEMAS.get("fit", "DG")
+    schemas.register(ResultSchema(dg.kind, dg.dtypes, dg.required), "DG")
+
+    with pytest.raises(SchemaError, match="newTerm"):
+        ScanResults(scan_path, ["DG"], DETECTORS[:2], CORRECTIONS[:1], schemas=schemas, lazy=False)
@@ -0,0 +1,30 @@
+import shutil
+
+from benchmarks.synthetic import generate, DETECTORS, CORRECTIONS
+from plotting_vdm import watch
+from plotting_vdm.watch import ScanWatcher
+
+
+def test_rendered_scans_are_not_walked_again(tmp_path, monkeypatch):
+    path, = generate(tmp_path, n_scans=1, n_detectors=2, n_corrections=2, fits=["SG"], n_bcids=10)
+    watcher = ScanWatcher(tmp_path, ["SG"], plotters=[], settle_time=0.0)
+
+    builds = []
+    build = watch.ScanIndex.build
+
+    def counted_build(*args):
+        builds.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(watch.ScanIndex, "build", counted_build)
+
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    assert len(builds) == 1
+
+    # A new correction folder changes the stamp of the scan, which is walked again
+    correction = path/DETECTORS[0]/"results"/CORRECTIONS[1]
+    shutil.copytree(correction, correction.with_name("Background_Extra"))
+    watcher.poll()
+
+    assert len(builds) == 2